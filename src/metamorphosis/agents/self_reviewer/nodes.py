@@ -80,7 +80,7 @@ class WorkflowNodes:
         )
 
         # Initialize the achievement evaluator
-        vector_db = EmbeddedVectorDB()
+        vector_db = EmbeddedVectorDB.shared()
         embedder = SimpleTextEmbedder()
         self.achievement_evaluator = AchievementEvaluator(vector_db=vector_db, embedder=embedder)
 
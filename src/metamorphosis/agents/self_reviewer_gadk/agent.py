@@ -59,7 +59,7 @@ def _get_modifiers() -> TextModifiers:
 @lru_cache(maxsize=1)
 def _get_achievement_evaluator() -> AchievementEvaluator:
     """Lazy, cached AchievementEvaluator accessor for contextualization."""
-    vector_db = EmbeddedVectorDB()
+    vector_db = EmbeddedVectorDB.shared()
     projects_rag = ProjectsRag(vector_db=vector_db)
     embedder = projects_rag.embedder
     return AchievementEvaluator(vector_db=vector_db, embedder=embedder)
@@ -130,7 +130,9 @@ async def update_session_state(
     Returns:
         dict: Confirmation that state was updated.
     """
-    print(f"Updating session state for key: {session_state_key} with value: {value}")
+    # Lazy %-style args: the (possibly long) value is only formatted, and truncated,
+    # when DEBUG logging is enabled.
+    logger.debug("Updating session state for key: %s with value: %.200s", session_state_key, value)
     # Update the session state - the session object is mutable and persisted automatically
     tool_context.state[session_state_key] = value
     
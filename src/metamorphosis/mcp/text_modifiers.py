@@ -31,6 +31,15 @@ from metamorphosis import get_model_registry
 
 load_dotenv()
 
+# Rough English tokens-per-word ratio used to turn a word target into a token cap.
+_TOKENS_PER_WORD = 1.4
+# Fixed allowance on top of the word budget for the structured-output JSON envelope
+# and any hidden reasoning tokens the summarizer model spends before answering.
+_SUMMARY_TOKEN_HEADROOM = 2048
+
+# Upper bound on concurrent provider requests issued by batched calls.
+_BATCH_MAX_CONCURRENCY = 8
+
 
 class TextModifiers:
     """LLM-backed text processing utilities with structured outputs.
@@ -89,6 +98,18 @@ class TextModifiers:
             prompts_dir / "text_evaluator_user_prompt.md"
         )
 
+        # Structured-output runnables are built once: `with_structured_output` derives the
+        # JSON schema and output parser from the model class, which never changes.
+        self._copy_editor_structured = self.copy_editor_llm.with_structured_output(CopyEditedText)
+        self._key_achievements_structured = self.key_achievements_llm.with_structured_output(
+            AchievementsList
+        )
+        self._review_text_evaluator_structured = (
+            self.review_text_evaluator_llm.with_structured_output(ReviewScorecard)
+        )
+        # Summarizer runnables depend on the per-call token cap, so cache them by max_words.
+        self._summarizers_by_max_words: dict[int, Any] = {}
+
         # Compose prompts with input placeholders for clarity.
 
         logger.debug("TextModifiers initialized successfully")
@@ -122,7 +143,7 @@ class TextModifiers:
         ]
         prompt = ChatPromptTemplate.from_messages(messages)
         logger.debug("summarizer_llm: {}", self.summarizer_llm)
-        summarizer = prompt | self.summarizer_llm.with_structured_output(SummarizedText)
+        summarizer = prompt | self._structured_summarizer(max_words)
 
         try:
             result = summarizer.invoke({})
@@ -147,6 +168,64 @@ class TextModifiers:
         )
         return result
 
+    @validate_call
+    def summarize_batch(
+        self,
+        *,
+        texts: Annotated[list[Annotated[str, Field(min_length=1)]], Field(min_length=1)],
+        max_words: Annotated[int, Field(gt=0)] = 300,
+    ) -> list[SummarizedText]:
+        """Summarize several texts in one batched LLM call.
+
+        All inputs share the same system prompt and structured-output runnable, so
+        LangChain's ``batch`` reuses one client connection pool and the provider can
+        serve calls 2..N from its prompt-prefix cache.
+
+        Args:
+            texts: The input texts to summarize.
+            max_words: Maximum number of words in each summary.
+
+        Returns:
+            list[SummarizedText]: One structured summary per input, in input order.
+
+        Raises:
+            PostconditionError: If the LLM invocation or any output validation fails.
+        """
+        logger.debug("summarize_batch: processing {} texts (max_words={})", len(texts), max_words)
+        self._log_model_details_table("summarize")
+
+        # The review is a template variable here, so input text is never parsed as a template.
+        prompt = ChatPromptTemplate.from_messages(
+            [("system", self.summarizer_system_prompt), ("user", self.summarizer_user_prompt)]
+        )
+        summarizer = prompt | self._structured_summarizer(max_words)
+
+        try:
+            results = summarizer.batch(
+                [{"review": text} for text in texts],
+                config={"max_concurrency": _BATCH_MAX_CONCURRENCY},
+            )
+        except Exception as e:
+            logger.error("summarize_batch: LLM invocation failed - {}", str(e))
+            raise PostconditionError(
+                "Batch summarization LLM invocation failed",
+                operation="summarize_batch_llm_invocation",
+            ) from e
+
+        # Postcondition (O(n)): one valid structured summary per input
+        if len(results) != len(texts) or not all(
+            isinstance(result, SummarizedText) and result.summarized_text for result in results
+        ):
+            raise_postcondition_error(
+                "Batch summarization output validation failed",
+                function_name="summarize_batch_validation",
+                expected=f"{len(texts)} SummarizedText results with non-empty summarized_text",
+                actual=f"count={len(results)}, types={sorted({type(r).__name__ for r in results})}",
+            )
+
+        logger.debug("summarize_batch: completed successfully ({} summaries)", len(results))
+        return results
+
     @validate_call
     def rationalize_text(self, *, text: Annotated[str, Field(min_length=1)]) -> CopyEditedText:
         """Rationalize text by correcting grammar, spelling, and formatting errors.
@@ -217,6 +296,7 @@ class TextModifiers:
             configured in the model registry.
         """
         logger.debug("rationalize_text: processing text (length={})", len(text))
+
         # Log the model details as a simple table for traceability and debugging.
         self._log_model_details_table("rationalize_text")
 
@@ -228,7 +308,7 @@ class TextModifiers:
         prompt = ChatPromptTemplate.from_messages(messages)
 
         # Create the rationalization chain with structured output
-        rationalizer = prompt | self.copy_editor_llm.with_structured_output(CopyEditedText)
+        rationalizer = prompt | self._copy_editor_structured
 
         # Invoke the chain with exception handling
         try:
@@ -344,7 +424,7 @@ class TextModifiers:
         prompt = ChatPromptTemplate.from_messages(messages)
 
         # Create the achievement extraction chain with structured output
-        extractor = prompt | self.key_achievements_llm.with_structured_output(AchievementsList)
+        extractor = prompt | self._key_achievements_structured
 
         # Invoke the chain with exception handling
         try:
@@ -455,7 +535,7 @@ class TextModifiers:
         prompt = ChatPromptTemplate.from_messages(messages)
 
         # Create the evaluation chain with structured output
-        evaluator = prompt | self.review_text_evaluator_llm.with_structured_output(ReviewScorecard)
+        evaluator = prompt | self._review_text_evaluator_structured
 
         # Invoke the chain with exception handling
         try:
@@ -530,6 +610,45 @@ class TextModifiers:
 
         return model_info
 
+    def _structured_summarizer(self, max_words: int) -> Any:
+        """Return the cached structured-output summarizer for a word budget.
+
+        Args:
+            max_words: Target maximum number of words in the summary.
+
+        Returns:
+            A runnable producing `SummarizedText` with a token cap matching ``max_words``.
+        """
+        summarizer = self._summarizers_by_max_words.get(max_words)
+        if summarizer is None:
+            capped_llm = self._length_capped_llm(self.summarizer_llm, max_words=max_words)
+            summarizer = capped_llm.with_structured_output(SummarizedText)
+            self._summarizers_by_max_words[max_words] = summarizer
+        return summarizer
+
+    @staticmethod
+    def _length_capped_llm(llm: Any, *, max_words: int) -> Any:
+        """Return a copy of ``llm`` whose output token cap tracks the requested word budget.
+
+        The provider otherwise generates up to the configured ``max_tokens`` (often
+        tens of thousands), so overshooting summaries are paid for and add latency.
+        The cap never exceeds the configured ``max_tokens``.
+
+        Args:
+            llm: The chat model client to cap.
+            max_words: Target maximum number of words in the generated text.
+
+        Returns:
+            The original client if it is already tighter, else a shallow copy with a
+            reduced ``max_tokens`` that shares the underlying HTTP clients.
+        """
+        budget = int(max_words * _TOKENS_PER_WORD) + _SUMMARY_TOKEN_HEADROOM
+        configured = getattr(llm, "max_tokens", None)
+        if configured is not None and configured <= budget:
+            return llm
+        logger.debug("Capping max_tokens at {} for max_words={}", budget, max_words)
+        return llm.model_copy(update={"max_tokens": budget})
+
     def _log_model_details_table(self, method: str) -> None:
         """Log the LLM model details as a table for the given TextModifiers method.
 
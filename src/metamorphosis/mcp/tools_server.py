@@ -9,13 +9,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
-import uuid
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 from pydantic import Field, validate_call
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware, MiddlewareContext
 from wordcloud import WordCloud
 from dotenv import load_dotenv
 from loguru import logger
@@ -25,14 +31,92 @@ from metamorphosis.mcp.text_modifiers import TextModifiers
 from metamorphosis.datamodel import CopyEditedText, SummarizedText, AchievementsList, ReviewScorecard
 from metamorphosis.exceptions import (
     FileOperationError,
+    MCPToolError,
     raise_postcondition_error,
 )
 
 load_dotenv()
 
 
+class _StableToolListing(Middleware):
+    """Emit `tools/list` in a compact, deterministic form.
+
+    Hosts embed the tool list in their system prompt, so any change in ordering
+    or wording between restarts invalidates the provider-side prompt cache. Tools
+    are sorted by name and their descriptions are reduced to the docstring summary
+    line; the argument schemas already carry the structured details.
+    """
+
+    async def on_list_tools(  # type: ignore[override]
+        self, context: MiddlewareContext, call_next: Any
+    ) -> list[Any]:
+        tools = await call_next(context)
+        return [
+            tool.model_copy(update={"description": _summary_line(tool.description)})
+            for tool in sorted(tools, key=lambda tool: tool.name)
+        ]
+
+
+def _summary_line(description: str | None) -> str | None:
+    """Return the first non-empty line of a tool description."""
+    if not description or not description.strip():
+        return description
+    return description.strip().splitlines()[0].strip()
+
+
+class _RepeatedFailureGuard:
+    """Abort tool calls that keep failing on the same input.
+
+    A client that retries a failing call verbatim would otherwise spend LLM tokens
+    without bound. Failures are counted per (tool, input digest) inside a sliding TTL
+    window; once the count reaches `max_failures` the call is rejected before the LLM
+    is invoked. A success clears the entry. The table is an LRU capped at `max_entries`.
+    """
+
+    def __init__(
+        self, *, max_failures: int = 3, ttl_seconds: float = 60.0, max_entries: int = 1024
+    ) -> None:
+        self._max_failures = max_failures
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._failures: OrderedDict[tuple[str, bytes], tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, tool_name: str, text: str) -> Iterator[None]:
+        """Guard one tool invocation; raise MCPToolError if the input keeps failing."""
+        key = (tool_name, hashlib.sha256(text.encode("utf-8")).digest())
+        with self._lock:
+            count, last_failure = self._failures.get(key, (0, 0.0))
+            if count and time.monotonic() - last_failure > self._ttl_seconds:
+                self._failures.pop(key, None)
+                count = 0
+        if count >= self._max_failures:
+            logger.warning("{}: aborting after {} failures on the same input.", tool_name, count)
+            raise MCPToolError(
+                f"Input failed {count} times in a row; aborting without LLM call",
+                tool_name=tool_name,
+                operation=f"{tool_name}_loop_detection",
+                error_code="REPEATED_FAILURE_ABORTED",
+            )
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                self._failures[key] = (count + 1, time.monotonic())
+                self._failures.move_to_end(key)
+                while len(self._failures) > self._max_entries:
+                    self._failures.popitem(last=False)
+            raise
+        with self._lock:
+            self._failures.pop(key, None)
+
+
+_failure_guard = _RepeatedFailureGuard()
+
 # Create a basic server instance with a name identifier
 mcp = FastMCP(name="text_modifier_mcp_server")
+mcp.add_middleware(_StableToolListing())
 
 @lru_cache(maxsize=1)
 def _get_modifiers() -> TextModifiers:
@@ -87,7 +171,6 @@ def create_word_cloud(text: Annotated[str, Field(min_length=1)]) -> str:
         OSError: If word cloud directory creation or file save fails.
     """
     logger.info("word_cloud: generating for text length={}.", len(text))
-    word_cloud = WordCloud().generate(text)
 
     # Ensure word_clouds directory exists
     output_dir = Path("./word_clouds")
@@ -95,11 +178,17 @@ def create_word_cloud(text: Annotated[str, Field(min_length=1)]) -> str:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_dir2.mkdir(parents=True, exist_ok=True)
 
-    # Generate unique filename
-    unique_id = uuid.uuid4()
-    word_cloud_path = output_dir / f"word_cloud_{unique_id}.png"
+    # Content-addressed filename: identical text maps to the same image, so a
+    # repeat call reuses the file on disk instead of re-rendering it.
+    content_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+    word_cloud_path = output_dir / f"word_cloud_{content_hash}.png"
+    word_cloud_path2 = output_dir2 / f"word_cloud_{content_hash}.png"
+    if word_cloud_path.exists() and word_cloud_path2.exists():
+        logger.debug("word_cloud: reusing cached image {}", word_cloud_path)
+        return str(word_cloud_path)
+
+    word_cloud = WordCloud().generate(text)
     word_cloud.to_file(str(word_cloud_path))
-    word_cloud_path2 = output_dir2 / f"word_cloud_{unique_id}.png"
     word_cloud.to_file(str(word_cloud_path2))
 
     # Postcondition (O(1)): ensure file was created
@@ -149,6 +238,29 @@ def abstractive_summarize(
         )
     return result
 
+@mcp.tool("batch_abstractive_summarize")
+@validate_call
+def batch_abstractive_summarize(
+    texts: Annotated[list[Annotated[str, Field(min_length=1)]], Field(min_length=1)],
+    max_words: Annotated[int, Field(gt=0)] = 300,
+) -> list[SummarizedText]:
+    """Summarize several texts abstractively in one batched call.
+
+    Args:
+        texts: Input texts to summarize.
+        max_words: Target maximum words for each summary (best-effort).
+
+    Returns:
+        list[SummarizedText]: One structured summary per input, in input order.
+
+    Raises:
+        pydantic.ValidationError: If input fails validation.
+        PostconditionError: If the LLM call or output validation fails.
+    """
+    logger.info("batch_abstractive_summarize: {} texts, max_words={}.", len(texts), max_words)
+    modifiers = _get_modifiers()
+    return modifiers.summarize_batch(texts=texts, max_words=max_words)
+
 @mcp.tool("extract_achievements")
 @validate_call
 def extract_achievements(
@@ -165,21 +277,23 @@ def extract_achievements(
     Raises:
         pydantic.ValidationError: If input fails validation.
         ValueError: If postcondition validation fails.
+        MCPToolError: If the same input already failed repeatedly within the TTL window.
     """
     logger.info("extract_achievements: text length={}.", len(text))
-    modifiers = _get_modifiers()
-    result = modifiers.extract_achievements(text=text)
-    # Postcondition (O(1)): ensure structured output sanity
-    if not isinstance(result, AchievementsList) or not result.items or len(result.items) == 0:
-        raise_postcondition_error(
-            "Achievements extraction output validation failed",
-            context={
-                "result_type": type(result).__name__,
-                "has_items": bool(getattr(result, "items", None)),
-                "items_count": len(result.items),
-            },
-            operation="extract_achievements_tool_validation",
-        )
+    with _failure_guard.track("extract_achievements", text):
+        modifiers = _get_modifiers()
+        result = modifiers.extract_achievements(text=text)
+        # Postcondition (O(1)): ensure structured output sanity
+        if not isinstance(result, AchievementsList) or not result.items:
+            raise_postcondition_error(
+                "Achievements extraction output validation failed",
+                context={
+                    "result_type": type(result).__name__,
+                    "has_items": bool(getattr(result, "items", None)),
+                    "items_count": len(result.items),
+                },
+                operation="extract_achievements_tool_validation",
+            )
     return result
 
 @mcp.tool("evaluate_review_text")
@@ -198,26 +312,38 @@ def evaluate_review_text(
     Raises:
         pydantic.ValidationError: If input fails validation.
         ValueError: If postcondition validation fails.
+        MCPToolError: If the same input already failed repeatedly within the TTL window.
     """
     logger.info("evaluate_review_text: text length={}.", len(text))
-    modifiers = _get_modifiers()
-    result = modifiers.evaluate_review_text(text=text)
-    # Postcondition (O(1)): ensure structured output sanity
-    if not isinstance(result, ReviewScorecard) or not result.metrics or len(result.metrics) == 0:
-        raise_postcondition_error(
-            "Review text evaluation output validation failed",
-            context={
-                "result_type": type(result).__name__,
-                "has_metrics": bool(getattr(result, "metrics", None)),
-                "metrics_count": len(result.metrics),
-            },
-            operation="evaluate_review_text_tool_validation",
-        )
+    with _failure_guard.track("evaluate_review_text", text):
+        modifiers = _get_modifiers()
+        result = modifiers.evaluate_review_text(text=text)
+        # Postcondition (O(1)): ensure structured output sanity
+        if not isinstance(result, ReviewScorecard) or not result.metrics:
+            raise_postcondition_error(
+                "Review text evaluation output validation failed",
+                context={
+                    "result_type": type(result).__name__,
+                    "has_metrics": bool(getattr(result, "metrics", None)),
+                    "metrics_count": len(result.metrics),
+                },
+                operation="evaluate_review_text_tool_validation",
+            )
     return result
 
 if __name__ == "__main__":
     host = os.getenv("MCP_SERVER_HOST", "127.0.0.1")
     port = int(os.getenv("MCP_SERVER_PORT", "3333"))
+    # Build TextModifiers (LLM clients + prompt files) before accepting requests so
+    # the first tool call does not pay for it on the latency-critical path.
+    _get_modifiers()
     logger.info("Starting MCP tools server at {}:{}", host, port)
-    mcp.run(transport="http", host=host, port=port)
+    # Single process on uvloop + httptools: many concurrent tool calls share the one
+    # cached TextModifiers instance and its pooled HTTP clients.
+    mcp.run(
+        transport="http",
+        host=host,
+        port=port,
+        uvicorn_config={"loop": "uvloop", "http": "httptools"},
+    )
 
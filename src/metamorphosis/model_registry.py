@@ -12,14 +12,16 @@ from __future__ import annotations
 
 import os
 import threading
+from functools import cached_property
 from typing import Any
 
 from loguru import logger
 from dotenv import load_dotenv
-from pydantic import BaseModel, ConfigDict, Field, PositiveInt, validate_call
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, TypeAdapter
 from langchain_openai import ChatOpenAI
 
 from metamorphosis.exceptions import (
+    ConfigurationError,
     raise_configuration_error,
 )
 
@@ -39,40 +41,131 @@ class _LLMSettings(BaseModel):
     timeout: PositiveInt | None = None
 
 
+# Built once at import; full validation of the (trusted, local) config is opt-in.
+_LLM_SETTINGS_ADAPTER = TypeAdapter(_LLMSettings)
+_VALIDATE_CONFIG_ENV = "METAMORPHOSIS_VALIDATE_CONFIG"
+
+# Config keys under `text_modifier_models`, one per LLM client the registry exposes.
+_LLM_ROLES: tuple[str, ...] = (
+    "summarizer",
+    "copy_editor",
+    "key_achievements",
+    "review_text_evaluator",
+)
+
+# Optional `_LLMSettings` attributes and the `ChatOpenAI` keyword each maps to.
+_LLM_PARAM_MAP: tuple[tuple[str, str], ...] = (
+    ("temperature", "temperature"),
+    ("max_tokens", "max_tokens"),
+    ("top_p", "top_p"),
+    ("frequency_penalty", "frequency_penalty"),
+    ("presence_penalty", "presence_penalty"),
+    ("stop_sequences", "stop"),
+    ("timeout", "timeout"),
+)
+
+
+# Set once the project `.env` has been read, so it is parsed at most once per process
+# (and not again in child processes, which inherit the environment).
+_ENV_LOADED_FLAG = "METAMORPHOSIS_ENV_LOADED"
+
+
+def _load_project_env() -> None:
+    """Load the project `.env` once, without overriding variables already set.
+
+    Raises:
+        ConfigurationError: If the project root cannot be determined.
+    """
+    if os.getenv(_ENV_LOADED_FLAG):
+        return
+    from metamorphosis.utilities import get_project_root  # local import to avoid cycles
+
+    # Load project .env explicitly to avoid cwd/parent ambiguity
+    load_dotenv(dotenv_path=get_project_root() / ".env", override=False)
+    os.environ[_ENV_LOADED_FLAG] = "1"
+
+
 class ModelRegistry:
     """Singleton that provides configured LLM clients.
 
-    The registry reads the project's configuration and constructs four
-    `ChatOpenAI` clients: `summarizer_llm`, `copy_editor_llm`, `key_achievements_llm`,
-    and `review_text_evaluator_llm`.
+    The registry reads the project's configuration and exposes four `ChatOpenAI`
+    clients: `summarizer_llm`, `copy_editor_llm`, `key_achievements_llm`, and
+    `review_text_evaluator_llm`. Each client is constructed lazily on first access,
+    so callers that need only one LLM never pay for building the others.
     """
 
     _instance: "ModelRegistry | None" = None
     _lock = threading.Lock()
 
     def __new__(cls) -> "ModelRegistry":  # type: ignore[override]
-        if cls._instance is not None:
-            return cls._instance
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
-                cls._instance = super().__new__(cls)
+                instance = super().__new__(cls)
+                # Fully initialize before publishing, so no caller can observe a
+                # half-built registry; a failed init leaves `_instance` unset.
+                instance._do_init()
+                cls._instance = instance
         return cls._instance
 
     def __init__(self) -> None:
-        # Guard against re-initialization when called multiple times
-        if hasattr(self, "_initialized") and self._initialized:
-            return
+        """No-op: initialization runs exactly once, under the lock, in `__new__`."""
 
+    def _do_init(self) -> None:
+        """Load configuration and API key; called once from `__new__`."""
         logger.debug("Initializing ModelRegistry from configuration")
+        self._api_key = self._bootstrap()
 
-        # Load project .env explicitly to avoid cwd/parent ambiguity
-        try:
-            from metamorphosis.utilities import get_project_root  # local import to avoid cycles
+        # Only the parsed settings are kept; clients are built on first access.
+        cfg = self._load_text_modifier_section()
+        self._settings: dict[str, _LLMSettings] = {
+            role: self._load_llm_settings(cfg.get(role, {})) for role in _LLM_ROLES
+        }
+        self._clients: dict[str, ChatOpenAI] = {}
+        self._clients_lock = threading.Lock()
+        logger.debug("ModelRegistry initialized successfully")
 
-            project_root = get_project_root()
-            load_dotenv(dotenv_path=project_root / ".env", override=True)
-        except Exception as error:  # noqa: BLE001
-            logger.warning("Failed to load .env explicitly: {}", error)
+    def _get_client(self, role: str) -> ChatOpenAI:
+        """Return the client for ``role``, building it at most once across threads."""
+        client = self._clients.get(role)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(role)
+                if client is None:
+                    client = self._build_chat_openai(self._settings[role], self._api_key)
+                    self._clients[role] = client
+        return client
+
+    @cached_property
+    def summarizer_llm(self) -> ChatOpenAI:
+        """Client for summarization, built on first access."""
+        return self._get_client("summarizer")
+
+    @cached_property
+    def copy_editor_llm(self) -> ChatOpenAI:
+        """Client for copy editing, built on first access."""
+        return self._get_client("copy_editor")
+
+    @cached_property
+    def key_achievements_llm(self) -> ChatOpenAI:
+        """Client for key-achievement extraction, built on first access."""
+        return self._get_client("key_achievements")
+
+    @cached_property
+    def review_text_evaluator_llm(self) -> ChatOpenAI:
+        """Client for review-text evaluation, built on first access."""
+        return self._get_client("review_text_evaluator")
+
+    @staticmethod
+    def _bootstrap() -> str:
+        """Load the project `.env` and return the validated OpenAI API key.
+
+        Raises:
+            ConfigurationError: If ``OPENAI_API_KEY`` is not set.
+        """
+        _load_project_env()
 
         # Fail-fast on API key
         api_key = os.getenv("OPENAI_API_KEY")
@@ -87,21 +180,7 @@ class ModelRegistry:
             logger.warning(
                 "OPENAI_API_KEY does not start with expected prefix; double-check your key"
             )
-
-        cfg = self._load_text_modifier_section()
-
-        summarizer_cfg = _LLMSettings(**cfg.get("summarizer", {}))
-        copy_editor_cfg = _LLMSettings(**cfg.get("copy_editor", {}))
-        key_achievements_cfg = _LLMSettings(**cfg.get("key_achievements", {}))
-        review_text_evaluator_cfg = _LLMSettings(**cfg.get("review_text_evaluator", {}))
-
-        self.summarizer_llm = self._build_chat_openai(summarizer_cfg, api_key)
-        self.copy_editor_llm = self._build_chat_openai(copy_editor_cfg, api_key)
-        self.key_achievements_llm = self._build_chat_openai(key_achievements_cfg, api_key)
-        self.review_text_evaluator_llm = self._build_chat_openai(review_text_evaluator_cfg, api_key)
-
-        self._initialized = True
-        logger.debug("ModelRegistry initialized successfully")
+        return api_key
 
     @staticmethod
     def _load_text_modifier_section() -> dict[str, Any]:
@@ -132,25 +211,35 @@ class ModelRegistry:
         return section
 
     @staticmethod
-    @validate_call
+    def _load_llm_settings(raw: dict[str, Any]) -> _LLMSettings:
+        """Build `_LLMSettings` from a config mapping.
+
+        The config file is a trusted local file, so settings are constructed without
+        validation by default. Set ``METAMORPHOSIS_VALIDATE_CONFIG=1`` (e.g. in dev or
+        CI) to run the full schema validation instead.
+        """
+        if os.getenv(_VALIDATE_CONFIG_ENV) == "1":
+            return _LLM_SETTINGS_ADAPTER.validate_python(raw)
+        # The one field the client cannot be built without is still checked.
+        if not raw.get("model"):
+            raise ConfigurationError(
+                "LLM settings require a non-empty 'model'",
+                operation="llm_settings_resolution",
+                error_code="CONFIG_ERROR",
+            )
+        return _LLMSettings.model_construct(**raw)
+
+    @staticmethod
     def _build_chat_openai(settings: _LLMSettings, api_key: str) -> ChatOpenAI:
-        """Construct a `ChatOpenAI` client from validated settings."""
+        """Construct a `ChatOpenAI` client from already-loaded settings."""
         params: dict[str, Any] = {"model": settings.model, "openai_api_key": api_key}
-
-        if settings.temperature is not None:
-            params["temperature"] = settings.temperature
-        if settings.max_tokens is not None:
-            params["max_tokens"] = settings.max_tokens
-        if settings.top_p is not None:
-            params["top_p"] = settings.top_p
-        if settings.frequency_penalty is not None:
-            params["frequency_penalty"] = settings.frequency_penalty
-        if settings.presence_penalty is not None:
-            params["presence_penalty"] = settings.presence_penalty
-        if settings.stop_sequences is not None:
-            params["stop"] = settings.stop_sequences
-        if settings.timeout is not None:
-            params["timeout"] = settings.timeout
+        params.update(
+            {
+                param: value
+                for attr, param in _LLM_PARAM_MAP
+                if (value := getattr(settings, attr)) is not None
+            }
+        )
 
         logger.debug("Creating ChatOpenAI with params: {}", params)
         return ChatOpenAI(**params)
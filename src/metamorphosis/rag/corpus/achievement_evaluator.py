@@ -10,7 +10,10 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional, get_args
 from icontract import require, ensure
 from loguru import logger
 
@@ -25,6 +28,42 @@ from metamorphosis.rag.vectordb.embedder import SimpleTextEmbedder
 from metamorphosis.model_registry import ModelRegistry
 from metamorphosis.rag.corpus.project_data_models import Project 
 
+# Upper bound on concurrent LLM requests when judging a batch of achievements.
+_LLM_BATCH_MAX_CONCURRENCY = 16
+
+# Contribution levels keyed by their lowercase spelling, for normalizing LLM replies.
+# Derived from the data model so adding a level needs no change here.
+_LEVELS: tuple[str, ...] = get_args(ContributionLevelLiteral)
+_LEVEL_BY_LOWERCASE = {level.lower(): level for level in _LEVELS}
+
+# Judgments are deterministic enough per (model, prompt) to reuse across runs in
+# the same process; re-evaluating an overlapping achievement list skips the LLM.
+_LEVEL_CACHE_MAX_ENTRIES = 4096
+_level_cache: "OrderedDict[tuple[str, bytes], ContributionLevelLiteral]" = OrderedDict()
+_level_cache_lock = threading.Lock()
+
+
+def _level_cache_key(llm: object, prompt: str) -> tuple[str, bytes]:
+    model = str(getattr(llm, "model_name", "") or "")
+    return model, hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+
+
+def _cached_level(key: tuple[str, bytes]) -> Optional[ContributionLevelLiteral]:
+    with _level_cache_lock:
+        level = _level_cache.get(key)
+        if level is not None:
+            _level_cache.move_to_end(key)
+        return level
+
+
+def _store_level(key: tuple[str, bytes], level: ContributionLevelLiteral) -> None:
+    with _level_cache_lock:
+        _level_cache[key] = level
+        _level_cache.move_to_end(key)
+        while len(_level_cache) > _LEVEL_CACHE_MAX_ENTRIES:
+            _level_cache.popitem(last=False)
+
+
 class AchievementEvaluator:
     """Contextualize achievements against projects and assess contribution level.
 
@@ -37,45 +76,126 @@ class AchievementEvaluator:
              "vector_db must be EmbeddedVectorDB")
     @require(lambda embedder: embedder is None or isinstance(embedder, SimpleTextEmbedder),
              "embedder must be SimpleTextEmbedder or None")
+    @require(lambda models: models is None or isinstance(models, ModelRegistry),
+             "models must be ModelRegistry or None")
+    @require(lambda max_candidates: isinstance(max_candidates, int) and max_candidates > 0,
+             "max_candidates must be a positive integer")
+    @require(lambda max_candidate_chars: isinstance(max_candidate_chars, int) and max_candidate_chars > 0,
+             "max_candidate_chars must be a positive integer")
     def __init__(self, *, vector_db: EmbeddedVectorDB,
                  embedder: Optional[SimpleTextEmbedder] = None,
-                 collection_name: str = "projects") -> None:
+                 collection_name: str = "projects",
+                 models: Optional[ModelRegistry] = None,
+                 max_candidates: int = 5,
+                 max_candidate_chars: int = 400) -> None:
+        # Caps on the candidate projects quoted in each prompt; input tokens drive
+        # both latency and cost of every judgment.
+        self.max_candidates = max_candidates
+        self.max_candidate_chars = max_candidate_chars
         self.embedder = embedder or SimpleTextEmbedder()
         self.semantic_search = SemanticSearch(
             embedder=self.embedder, vector_db=vector_db, collection_name=collection_name
         )
-        self.models = ModelRegistry()
+        self.models = models or ModelRegistry()
 
     # ------- helpers
     def _format_context(self, *, achievement: Achievement, top_k_texts: List[str]) -> str:
+        parts = [
+            "Achievement:\n- title: ", achievement.title,
+            "\n- outcome: ", achievement.outcome,
+            "\n- impact_area: ", achievement.impact_area,
+            "\n\nCandidate Projects:",
+        ]
+        for text in top_k_texts:
+            parts.append("\n- ")
+            parts.append(text)
+        return "".join(parts)
+
+    def _candidate_texts(self, hits: list) -> List[str]:
+        """Truncated contents of the top distinct projects, in score order."""
+        seen: set = set()
+        texts: List[str] = []
+        for hit in hits:
+            payload = hit.payload
+            if not payload:
+                continue
+            # Chunks of the same project share a name; quote each project once.
+            name = payload.get("name")
+            if name is not None:
+                if name in seen:
+                    continue
+                seen.add(name)
+            content = payload.get("content")
+            if content:
+                texts.append(content[:self.max_candidate_chars])
+                if len(texts) >= self.max_candidates:
+                    break
+        return texts
+
+    def _build_prompt(self, *, context: str) -> str:
         return (
-            "Achievement:\n"
-            f"- title: {achievement.title}\n"
-            f"- outcome: {achievement.outcome}\n"
-            f"- impact_area: {achievement.impact_area}\n\n"
-            "Candidate Projects:\n" + "\n".join([f"- {t}" for t in top_k_texts])
+            "You are an expert evaluator. Given an achievement and candidate projects, "
+            f"decide the employee contribution level: one of [{', '.join(_LEVELS)}].\n\n"
+            f"{context}\n\n"
+            "Return only one word from the set above."
         )
 
+    @staticmethod
+    def _normalize_level(text: str) -> ContributionLevelLiteral:
+        # maxsplit=1 stops after the first word; any whitespace (incl. newlines) separates.
+        words = text.split(maxsplit=1)
+        head = words[0].lower() if words else ""
+        return _LEVEL_BY_LOWERCASE.get(head, "Medium")  # type: ignore[return-value]
+
     def _call_reasoning_model(self, *, context: str) -> ContributionLevelLiteral:
         # Use review_text_evaluator_llm as a reasoning-capable model by default
         llm = self.models.review_text_evaluator_llm
-        prompt = (
-            "You are an expert evaluator. Given an achievement and candidate projects, "
-            "decide the employee contribution level: one of [Minor, Medium, Significant, Critical].\n\n"
-            f"{context}\n\n"
-            "Return only one word from the set above."
-        )
+        prompt = self._build_prompt(context=context)
+        key = _level_cache_key(llm, prompt)
+        cached = _cached_level(key)
+        if cached is not None:
+            return cached
+
         try:
             resp = llm.invoke(prompt)  # LangChain ChatOpenAI
-            text = (resp.content or "").strip()
         except Exception as error:  # noqa: BLE001
             logger.warning(f"LLM call failed, defaulting to 'Medium': {error}")
-            text = "Medium"
+            return "Medium"
+
+        level = self._normalize_level((resp.content or "").strip())
+        _store_level(key, level)
+        return level
+
+    def _call_reasoning_model_batch(self, *, contexts: List[str]) -> List[ContributionLevelLiteral]:
+        """Judge several contexts concurrently; falls back to sequential calls on failure."""
+        llm = self.models.review_text_evaluator_llm
+        prompts = [self._build_prompt(context=context) for context in contexts]
+        keys = [_level_cache_key(llm, prompt) for prompt in prompts]
+        levels: List[Optional[ContributionLevelLiteral]] = [_cached_level(key) for key in keys]
+        pending = [i for i, level in enumerate(levels) if level is None]
+        if not pending:
+            return levels  # type: ignore[return-value]
 
-        normalized = text.split()[0].strip().capitalize()
-        if normalized not in {"Minor", "Medium", "Significant", "Critical"}:
-            normalized = "Medium"
-        return normalized  # type: ignore[return-value]
+        try:
+            responses = llm.batch(
+                [prompts[i] for i in pending],
+                config={"max_concurrency": _LLM_BATCH_MAX_CONCURRENCY},
+                return_exceptions=True,
+            )
+        except Exception as error:  # noqa: BLE001
+            logger.warning("Batched LLM call failed, evaluating sequentially: {}", error)
+            for i in pending:
+                levels[i] = self._call_reasoning_model(context=contexts[i])
+            return levels  # type: ignore[return-value]
+
+        for i, response in zip(pending, responses):
+            if isinstance(response, Exception):
+                logger.warning("LLM call failed, defaulting to 'Medium': {}", response)
+                levels[i] = "Medium"
+            else:
+                levels[i] = self._normalize_level((response.content or "").strip())
+                _store_level(keys[i], levels[i])
+        return levels  # type: ignore[return-value]
 
     # ------- core API
     @require(lambda achievements: isinstance(achievements, AchievementsList) and len(achievements.items) > 0,
@@ -93,31 +213,40 @@ class AchievementEvaluator:
             List of `AchievementEvaluation` objects.
         """
         logger.info("contextualize: contextualizing achievements (length={})", len(achievements.items))
-        evaluations: List[AchievementEvaluation] = []
-
-        for ach in achievements.items:
-            query = f"{ach.title}. {ach.outcome}"
-            hits = self.semantic_search.search_with_text(
-                query_text=query, limit=limit
-            )
+        # Pass 1: retrieve candidate projects for all achievements in one batched search,
+        # then assemble the prompt context per achievement.
+        queries = [f"{ach.title}. {ach.outcome}" for ach in achievements.items]
+        hits_per_achievement = self.semantic_search.search_with_texts(
+            query_texts=queries, limit=limit
+        )
 
+        matched: List[tuple[Achievement, dict, str]] = []
+        for ach, hits in zip(achievements.items, hits_per_achievement):
             if not hits:
                 logger.info("No projects matched achievement: {}", ach.title)
                 continue
 
             # Pick top-1 project by score for a concise judgment
-            top_hit = hits[0]
-            payload = top_hit.payload or {}
-            project_text = payload.get("content", "")
-            project_name = payload.get("name", "(unnamed)")
-            top_k_texts = [h.payload.get("content", "") for h in hits if h.payload]
-
+            payload = hits[0].payload or {}
+            top_k_texts = self._candidate_texts(hits)
             context = self._format_context(achievement=ach, top_k_texts=top_k_texts)
-            contribution = self._call_reasoning_model(context=context)
+            matched.append((ach, payload, context))
+
+        if not matched:
+            return []
 
-            project = Project(
-                name=project_name,
-                text=project_text,
+        # Pass 2: judge all contexts in one concurrent batch (the calls are latency-bound).
+        contributions = self._call_reasoning_model_batch(
+            contexts=[context for _, _, context in matched]
+        )
+
+        # Pass 3: zip the judgments back onto their achievements.
+        evaluations: List[AchievementEvaluation] = []
+        for (ach, payload, _), contribution in zip(matched, contributions):
+            # Payloads were written by `Project.to_payload()`; skip re-validating them.
+            project = Project.model_construct(
+                name=payload.get("name", "(unnamed)"),
+                text=payload.get("content", ""),
                 department=payload.get("department", "Unknown"),
                 impact_category=payload.get("impact_category", "Medium Impact"),
                 effort_size=payload.get("effort_size", "Medium"),
@@ -133,5 +262,3 @@ class AchievementEvaluator:
             )
 
         return evaluations
-
-
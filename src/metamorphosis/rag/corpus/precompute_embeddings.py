@@ -0,0 +1,77 @@
+# =============================================================================
+#  Filename: precompute_embeddings.py
+#
+#  Short Description: Build the embedding cache shipped next to a project portfolio file.
+#
+#  Creation date: 2025-09-27
+#  Author: Asif Qamar
+# =============================================================================
+
+"""
+Pre-compute the embeddings of a project portfolio once and store them next to it.
+
+The vectors are written to ``<portfolio>.embeddings.sqlite``, which
+`ProjectsRag.index_all_projects` picks up automatically; indexing the portfolio
+(including the auto-bootstrap of an empty collection) then reads them from disk
+instead of running the embedding model. Entries are keyed by model and text, so
+the file stays valid as projects are added: only new texts get embedded.
+
+Usage:
+    python -m metamorphosis.rag.corpus.precompute_embeddings \\
+        project_documents/project_portfolio.jsonl
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from loguru import logger
+
+from metamorphosis.rag.corpus.project_data_models import Project
+from metamorphosis.rag.vectordb.embedder import SimpleTextEmbedder
+from metamorphosis.rag.vectordb.embedding_cache import EmbeddingDiskCache, sidecar_cache_path
+
+
+def precompute_embeddings(*, jsonl_path: Path, model_name: str,
+                          batch_size: int = 64) -> Path:
+    """Embed every project text in `jsonl_path` and store it in the sidecar cache.
+
+    Args:
+        jsonl_path: Project portfolio in JSON Lines format.
+        model_name: Embedding model used when indexing the portfolio.
+        batch_size: Number of texts per forward pass.
+
+    Returns:
+        Path of the written cache file.
+    """
+    with jsonl_path.open(encoding="utf-8") as f:
+        texts = [Project(**json.loads(line)).text for line in f if line.strip()]
+
+    cache = EmbeddingDiskCache(path=sidecar_cache_path(jsonl_path))
+    missing = [
+        text for text, vector in zip(texts, cache.get_many(model_name=model_name, texts=texts))
+        if vector is None
+    ]
+    if missing:
+        embedder = SimpleTextEmbedder(model_name=model_name)
+        vectors = embedder.embed_texts(texts=missing, batch_size=batch_size)
+        cache.put_many(model_name=model_name, texts=missing, vectors=vectors)
+    logger.info(f"Embedded {len(missing)} of {len(texts)} projects into '{cache.path}'")
+    return cache.path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("jsonl_path", type=Path, help="Project portfolio JSONL file")
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2",
+                        help="Embedding model used when indexing the portfolio")
+    parser.add_argument("--batch-size", type=int, default=64,
+                        help="Number of texts per forward pass")
+    args = parser.parse_args()
+    precompute_embeddings(
+        jsonl_path=args.jsonl_path, model_name=args.model, batch_size=args.batch_size
+    )
+
+
+if __name__ == "__main__":
+    main()
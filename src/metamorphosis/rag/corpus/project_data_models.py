@@ -7,9 +7,15 @@
 #  Author: Asif Qamar
 # =============================================================================
 
+import uuid
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict
+
+
+# Namespace for content-derived point IDs; changing it re-keys every indexed project.
+PROJECT_ID_NAMESPACE = uuid.UUID("6f0b4e1a-3c2d-5e8f-9a7b-1d4c6e8f0a2b")
 
 
 #============================================================================================
@@ -41,6 +47,7 @@ class Project(BaseModel):
     model_config = ConfigDict(
         str_strip_whitespace=True,
         validate_assignment=True,
+        revalidate_instances="never",
         frozen=True,
         extra="forbid"
     )
@@ -67,14 +74,39 @@ class Project(BaseModel):
         ..., description="Effort size for the project"
     )
     
-    @field_validator('name', 'text', 'department', 'impact_category', 'effort_size')
     @classmethod
-    def validate_non_empty_strings(cls, v: str) -> str:
-        """Ensure all string fields are non-empty after stripping."""
-        if not v or not v.strip():
-            raise ValueError("Field cannot be empty or whitespace only")
-        return v.strip()
-    
+    def from_trusted_payload(cls, payload: Dict[str, Any]) -> "Project":
+        """Build a Project from data produced by this codebase, skipping validation.
+
+        Only use this for records this project wrote itself — the bundled portfolio
+        JSONL or a Qdrant payload created by `to_payload()`. No field is checked,
+        stripped, or coerced; untrusted input must go through `Project(**data)`.
+
+        Args:
+            payload: A portfolio record (``text`` key) or a vector-store payload
+                (``content`` key) with ``name``, ``department``, ``impact_category``
+                and ``effort_size``.
+
+        Returns:
+            The constructed Project.
+        """
+        return cls.model_construct(
+            name=payload["name"],
+            text=payload["content"] if "content" in payload else payload["text"],
+            department=payload["department"],
+            impact_category=payload["impact_category"],
+            effort_size=payload["effort_size"],
+        )
+
+    @property
+    def point_id(self) -> str:
+        """Stable vector-store ID derived from the project's name and text.
+
+        Re-indexing an unchanged project yields the same ID, so the upsert replaces
+        the existing point instead of adding a duplicate.
+        """
+        return str(uuid.uuid5(PROJECT_ID_NAMESPACE, f"{self.name}\n{self.text}"))
+
     def to_payload(self) -> Dict[str, Any]:
         """Convert the project to a payload dictionary for vector storage.
         
@@ -104,9 +136,14 @@ class ProjectPortfolio(BaseModel):
         projects: List of Project instances
         source_file: Optional path to the source JSONL file
     """
+    # Frozen and never re-validated on assignment. Together with `Project`'s own
+    # `revalidate_instances="never"`, already-built projects are accepted as-is
+    # rather than re-validated or copied when a portfolio wraps them.
     model_config = ConfigDict(
-        validate_assignment=True,
-        arbitrary_types_allowed=True
+        validate_assignment=False,
+        revalidate_instances="never",
+        arbitrary_types_allowed=True,
+        frozen=True,
     )
     
     projects: List[Project] = Field(
@@ -119,26 +156,73 @@ class ProjectPortfolio(BaseModel):
         description="Path to the source JSONL file"
     )
     
-    @field_validator('projects')
-    @classmethod
-    def validate_projects_not_empty(cls, v: List[Project]) -> List[Project]:
-        """Ensure projects list is not empty."""
-        if not v:
-            raise ValueError("Projects collection cannot be empty")
-        return v
-    
     def __len__(self) -> int:
         """Return the number of projects in the collection."""
         return len(self.projects)
     
+    # The portfolio is frozen, so derived views are computed once and cached on the
+    # instance (`cached_property` writes to `__dict__`, bypassing the frozen check).
+    @cached_property
+    def projects_by_impact_category(self) -> Dict[str, List[Project]]:
+        """Projects grouped by impact category, in original order."""
+        groups: Dict[str, List[Project]] = {}
+        for project in self.projects:
+            groups.setdefault(project.impact_category, []).append(project)
+        return groups
+
+    @cached_property
+    def projects_by_department(self) -> Dict[str, List[Project]]:
+        """Projects grouped by department, in original order."""
+        groups: Dict[str, List[Project]] = {}
+        for project in self.projects:
+            groups.setdefault(project.department, []).append(project)
+        return groups
+
+    @cached_property
+    def payloads(self) -> tuple[Dict[str, Any], ...]:
+        """Vector-store payload of every project, in order; built once per portfolio.
+
+        The dicts are shared across calls, so callers must copy before mutating.
+        """
+        return tuple(project.to_payload() for project in self.projects)
+
+    @cached_property
+    def point_ids(self) -> tuple[str, ...]:
+        """Stable point ID of every project, in order (see `Project.point_id`)."""
+        return tuple(project.point_id for project in self.projects)
+
+    @cached_property
+    def texts(self) -> tuple[str, ...]:
+        """Text of every project, in order; the column handed to the embedder."""
+        return tuple(project.text for project in self.projects)
+
+    @cached_property
+    def impact_categories(self) -> tuple[str, ...]:
+        """Sorted unique impact categories."""
+        return tuple(sorted(self.projects_by_impact_category))
+
+    @cached_property
+    def departments(self) -> tuple[str, ...]:
+        """Sorted unique departments."""
+        return tuple(sorted(self.projects_by_department))
+
+    @cached_property
+    def impact_categories_by_lowercase(self) -> Dict[str, str]:
+        """Map each lowercased impact category to its spelling in the corpus."""
+        return {category.lower(): category for category in self.impact_categories}
+
+    @cached_property
+    def departments_by_lowercase(self) -> Dict[str, str]:
+        """Map each lowercased department to its spelling in the corpus."""
+        return {department.lower(): department for department in self.departments}
+
     def get_impact_categories(self) -> List[str]:
         """Get unique impact categories from all projects.
         
         Returns:
             Sorted list of unique category names.
         """
-        impacts = {project.impact_category for project in self.projects}
-        return sorted(impacts)
+        return list(self.impact_categories)
     
     def get_departments(self) -> List[str]:
         """Get unique departments from all projects.
@@ -146,8 +230,7 @@ class ProjectPortfolio(BaseModel):
         Returns:
             Sorted list of unique department names.
         """
-        departments = {project.department for project in self.projects}
-        return sorted(departments)
+        return list(self.departments)
     
     def filter_by_impact_category(self, *, impact_category: str) -> List[Project]:
         """Filter projects by impact category.
@@ -158,7 +241,7 @@ class ProjectPortfolio(BaseModel):
         Returns:
             List of projects matching the impact category.
         """
-        return [project for project in self.projects if project.impact_category == impact_category]
+        return list(self.projects_by_impact_category.get(impact_category, ()))
     
     def filter_by_department(self, *, department: str) -> List[Project]:
         """Filter projects by department.
@@ -169,7 +252,7 @@ class ProjectPortfolio(BaseModel):
         Returns:
             List of projects by the specified department.
         """
-        return [project for project in self.projects if project.department == department]
+        return list(self.projects_by_department.get(department, ()))
 
 
 # ----------------------------------------------------------------------------------------
@@ -7,24 +7,194 @@
 #  Author: Asif Qamar
 # =============================================================================
 
+import asyncio
 import json
+import operator
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Annotated, AsyncIterator, Iterable, Iterator, List, Optional, Dict, Any, Union
+import numpy as np
 from icontract import require, ensure
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter, ValidationError
 from qdrant_client import models
 from loguru import logger
 
 # Import instructor and OpenAI for LLM integration
 import instructor
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from metamorphosis.rag.vectordb.embedded_vectordb import EmbeddedVectorDB
 from metamorphosis.rag.vectordb.embedder import SimpleTextEmbedder
+from metamorphosis.rag.vectordb.embedding_cache import EmbeddingDiskCache, sidecar_cache_path
 from metamorphosis.rag.search.semantic_search import SemanticSearch
+from metamorphosis.rag.search.semantic_cache import SemanticQueryCache
+from metamorphosis.rag.search.reranker import CrossEncoderReranker, mmr_select
 from metamorphosis.rag.exceptions import InvalidPointsError
 from metamorphosis.rag.corpus.project_data_models import Project, ProjectPortfolio
 
+# orjson is optional: it parses the same input several times faster than stdlib json.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# rich is optional at runtime: without it the display methods fall back to print().
+try:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    _HAS_RICH = True
+except ImportError:
+    _HAS_RICH = False
+
+# One console for all display calls (it holds terminal detection and the output lock).
+_CONSOLE = Console() if _HAS_RICH else None
+
+
+# Display fields of a search-hit payload, and what to show when one is missing.
+_HIT_FIELD_DEFAULTS = {
+    "content": "",
+    "name": "(unnamed)",
+    "department": "Unknown",
+    "impact_category": "Unknown",
+}
+_get_hit_fields = operator.itemgetter(*_HIT_FIELD_DEFAULTS)
+
+
+def _hit_fields(payload: Optional[Dict[str, Any]]) -> tuple[str, str, str, str]:
+    """Return (content, name, department, impact_category) of a search-hit payload.
+    
+    Payloads written by `Project.to_payload` carry every field, so one itemgetter call
+    serves them; defaults are merged in only for incomplete payloads.
+    """
+    try:
+        return _get_hit_fields(payload)
+    except (KeyError, TypeError):
+        return _get_hit_fields({**_HIT_FIELD_DEFAULTS, **(payload or {})})
+
+
+@lru_cache(maxsize=1)
+def _token_encoding() -> Optional[Any]:
+    """Return the tiktoken encoding of the GPT-4o family, or None if it is unavailable.
+    
+    tiktoken is optional (it arrives with langchain-openai) and may need to download the
+    BPE table on first use, so it is loaded lazily and any failure means "estimate".
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, estimating token counts: {e}")
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _count_tokens(text: str) -> int:
+    """Count the tokens of `text` (about 4 characters per token without tiktoken)."""
+    encoding = _token_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
+# Tokens taken by the fixed headings and closing instruction of `create_rag_context`.
+_RAG_CONTEXT_FRAME_TOKENS = 50
+
+# One search hit as rendered into the RAG prompt by `format_search_results_for_rag`.
+_RAG_RESULT_TEMPLATE = (
+    '\nProject {i}: "{content}"\n'
+    "Department: {department}\n"
+    "Category: {category}\n"
+    "Relevance Score: {score:.3f}\n"
+)
+
+# The full RAG prompt assembled by `create_rag_context`. Everything up to and including
+# "## Relevant Projects" is identical across calls, so OpenAI's prompt cache can reuse it;
+# the per-call fields must stay after that prefix (see `create_rag_context`).
+_RAG_CONTEXT_TEMPLATE = (
+    "\n{system_prompt}\n\n"
+    "## Relevant Projects\n{formatted_results}\n\n"
+    "## User Query\n{user_query}\n\n"
+    "Please answer the user's question using the provided projects and following the "
+    "guidelines above.\n"
+)
+
+# Heading shown above every displayed LLM answer.
+_LLM_ANSWER_TITLE_TEMPLATE = "🤖 LLM Answer to: '{user_query}'"
+
+# Runtime contracts of this module; set PROJECTS_RAG_STRICT=0 in production to skip them
+# once inputs are validated upstream (e.g. by the API layer). Disabled contracts are not
+# wrapped at all, so the methods run with no per-call overhead.
+PROJECTS_RAG_STRICT = os.getenv("PROJECTS_RAG_STRICT", "1") == "1"
+
+# Validates a whole list of records in one call, without per-record __init__ dispatch.
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[Project])
+
+# Portfolio files at least this large are parsed across worker processes.
+_PARALLEL_PARSE_MIN_BYTES = 10 * 1024 * 1024
+
+
+def _parse_jsonl_lines(lines: List[bytes], first_line_num: int,
+                       trusted: bool) -> tuple[List[Project], List[tuple[int, str]]]:
+    """Parse JSONL lines into Projects, collecting (line number, error) for bad lines.
+    
+    Module-level so it can run in a worker process.
+    """
+    # Pass 1: decode JSON only.
+    records: List[Any] = []
+    record_line_nums: List[int] = []
+    skipped: List[tuple[int, str]] = []
+    for line_num, line in enumerate(lines, first_line_num):
+        line = line.strip()
+        if not line:  # Skip empty lines
+            continue
+        
+        try:
+            records.append(_json_loads(line))
+            record_line_nums.append(line_num)
+        except ValueError as e:
+            skipped.append((line_num, str(e)))
+    
+    # Pass 2: build Projects.
+    if trusted:
+        projects: List[Project] = []
+        for line_num, data in zip(record_line_nums, records):
+            try:
+                projects.append(Project.from_trusted_payload(data))
+            except (KeyError, TypeError) as e:
+                skipped.append((line_num, str(e)))
+    else:
+        projects = _validate_projects(records, record_line_nums, skipped)
+    skipped.sort()
+    return projects, skipped
+
+
+def _validate_projects(records: List[Any], line_nums: List[int],
+                       skipped: List[tuple[int, str]]) -> List[Project]:
+    """Validate all records in one TypeAdapter call, dropping (and recording) bad ones.
+    
+    Invalid records are located from the error locations, so a file with bad lines
+    costs one extra validation pass over the good records, not one per record.
+    """
+    try:
+        return _PROJECT_LIST_ADAPTER.validate_python(records)
+    except ValidationError as e:
+        errors: Dict[int, str] = {}
+        for error in e.errors():
+            field = ".".join(map(str, error["loc"][1:])) or "record"
+            errors.setdefault(error["loc"][0], f"{field}: {error['msg']}")
+        skipped.extend((line_nums[i], message) for i, message in errors.items())
+        return _PROJECT_LIST_ADAPTER.validate_python(
+            [record for i, record in enumerate(records) if i not in errors]
+        )
+
 
 #============================================================================================
 #  Class: ProjectsRag
@@ -60,7 +230,7 @@ class ProjectsRag:
         from metamorphosis.rag.corpus.projects_rag import ProjectsRag
         
         # Initialize
-        vector_db = EmbeddedVectorDB()
+        vector_db = EmbeddedVectorDB.shared()
         projects = ProjectsRag(vector_db=vector_db, collection_name="my_projects")
         
         # Load and index projects
@@ -82,16 +252,65 @@ class ProjectsRag:
         semantic_search: Underlying search engine for similarity queries
     """
     
+    # Sent with every chat request so OpenAI routes them to machines that already hold
+    # the shared system-prompt prefix in their prompt cache
+    PROMPT_CACHE_KEY = "metamorphosis-projects-rag"
+    
+    # Number of project texts embedded per forward pass when indexing
+    INDEX_BATCH_SIZE = 128
+    
+    # Collections already known to be populated in this process (auto-bootstrap done)
+    _bootstrap_done: set[str] = set()
+    
+    # Collections whose payload indexes were checked in this process
+    _payload_indexes_done: set[str] = set()
+    
+    # Payload fields filtered on by search(); indexed as keywords in Qdrant
+    FILTERABLE_PAYLOAD_FIELDS = ("department", "impact_category")
+    
+    # Cross-encoder shared by every instance; loaded on the first reranked search
+    _reranker: Optional[CrossEncoderReranker] = None
+    _reranker_lock = threading.Lock()
+    
+    # int8 scalar quantization kept in RAM: ~4x less vector memory, <1% recall loss
+    # once the oversampled candidates are rescored against the original vectors.
+    QUANTIZATION_CONFIG = models.ScalarQuantization(
+        scalar=models.ScalarQuantizationConfig(
+            type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+        )
+    )
+    
+    # Original vectors are only read to rescore the quantized candidates, so they are
+    # stored as float16 in memory-mapped files: half the size, and out of RAM.
+    VECTOR_DATATYPE = models.Datatype.FLOAT16
+    VECTORS_ON_DISK = True
+    
+    # Denser HNSW graph than Qdrant's default (m=16, ef_construct=100): better recall
+    # on the compressed int8 vectors for a modest amount of extra index memory
+    HNSW_CONFIG = models.HnswConfigDiff(m=32, ef_construct=256)
+    
     # ----------------------------------------------------------------------------------------
     #  Constructor
     # ----------------------------------------------------------------------------------------
     @require(lambda vector_db: isinstance(vector_db, EmbeddedVectorDB),
-             "Vector DB must be an EmbeddedVectorDB instance")
+             "Vector DB must be an EmbeddedVectorDB instance",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda embedder: embedder is None or isinstance(embedder, SimpleTextEmbedder),
-             "Embedder must be None or a SimpleTextEmbedder instance")
+             "Embedder must be None or a SimpleTextEmbedder instance",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda query_cache: query_cache is None or isinstance(query_cache, SemanticQueryCache),
+             "Query cache must be None or a SemanticQueryCache instance",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda oversampling: oversampling >= 1.0, "Oversampling must be at least 1.0",
+             enabled=PROJECTS_RAG_STRICT)
     def __init__(self, vector_db: EmbeddedVectorDB, 
                  embedder: Optional[SimpleTextEmbedder] = None,
-                 collection_name: str = "projects") -> None:
+                 collection_name: str = "projects",
+                 query_cache: Optional[SemanticQueryCache] = None,
+                 embedding_cache: Optional[EmbeddingDiskCache] = None,
+                 oversampling: float = 2.0,
+                 server_side_inference: bool = False,
+                 server_inference_model: str = "sentence-transformers/all-MiniLM-L6-v2") -> None:
         """Initialize your project portfolio with intelligent search capabilities.
         
         Sets up the complete infrastructure for loading, indexing, and searching projects.
@@ -100,10 +319,32 @@ class ProjectsRag:
         
         Args:
             vector_db: Your vector database instance where projects will be stored.
-                This handles all the vector storage and retrieval operations.
+                This handles all the vector storage and retrieval operations. Pass
+                `EmbeddedVectorDB.shared()` so every instance reuses one client
+                (gRPC when connected to a Qdrant server).
             embedder: Optional text embedding model. If None, uses the default
                 'sentence-transformers/all-MiniLM-L6-v2'.
             collection_name: Unique name for your project collection.
+            query_cache: Optional semantic cache for search results and LLM answers.
+                If None, a private cache with default settings is created. Repeated or
+                near-identical questions are then served without re-running the
+                search or the LLM; the cache is cleared whenever the collection changes.
+            embedding_cache: Optional on-disk embedding cache used when indexing. If
+                None, the shared cache under ``~/.cache/metamorphosis`` is used, so
+                re-indexing only embeds projects whose text changed.
+            oversampling: How many quantized candidates to fetch per requested result
+                before rescoring them against the full-precision vectors. Higher values
+                recover more recall at the cost of latency; 1.0 disables oversampling.
+                Ignored when the database runs in local (on-disk) mode.
+            server_side_inference: Let Qdrant embed search queries with
+                `server_inference_model`, so a search is one round-trip and no model runs
+                here. Requires a Qdrant deployment with inference for that model. Such
+                searches bypass the semantic cache, which needs the query vector; MMR
+                searches still embed locally.
+            server_inference_model: Model id Qdrant runs for server-side inference. It
+                must produce the same vectors as `embedder`; it is set separately
+                because a local embedder's `model_name` (e.g. an ONNX export's) need
+                not be a model id Qdrant knows.
         
         Example:
             ```python
@@ -122,13 +363,24 @@ class ProjectsRag:
             ```
         
         Note:
-            The constructor automatically loads the RAG system prompt for AI interactions.
+            The RAG system prompt is loaded on first use by the AI methods, not here.
             If the prompt file is missing, a warning is logged but the system continues
             to work with reduced AI capabilities.
         """
         self.embedder = embedder or SimpleTextEmbedder()
         self.collection_name = collection_name
+        self.server_side_inference = server_side_inference
+        self.server_inference_model = server_inference_model
         self.wisdom: Optional[ProjectPortfolio] = None
+        self.query_cache = query_cache or SemanticQueryCache()
+        self.embedding_cache = embedding_cache or EmbeddingDiskCache()
+        # Stored spellings of filter values, read lazily when no portfolio is loaded
+        self._payload_spellings: Optional[Dict[str, Dict[str, str]]] = None
+        self.search_params = models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                ignore=False, rescore=True, oversampling=oversampling
+            )
+        )
         
         # Initialize the underlying semantic search engine
         self.semantic_search = SemanticSearch(
@@ -137,23 +389,33 @@ class ProjectsRag:
             collection_name=collection_name
         )
         
+        if collection_name not in ProjectsRag._payload_indexes_done:
+            self._ensure_payload_indexes()
+        
         logger.info(f"Initialized Projects corpus loader for collection '{collection_name}'")
-        if not ProjectsRag.PROJECTS_RAG_SYSTEM_PROMPT:
-            ProjectsRag.PROJECTS_RAG_SYSTEM_PROMPT = self._load_system_prompt()
 
-        # Auto-bootstrap: if the collection is empty, try to load and index a default portfolio
+        # Auto-bootstrap: if the collection is empty, try to load and index a default
+        # portfolio. Once a collection is known to hold data, later instances skip the
+        # count_points round-trip.
+        if collection_name in ProjectsRag._bootstrap_done:
+            return
         try:
             points_count = self.semantic_search.vector_db.count_points(
                 collection_name=self.collection_name
             )
-            if points_count == 0:
+            if points_count > 0:
+                ProjectsRag._bootstrap_done.add(collection_name)
+            else:
                 default_file = self._find_default_portfolio_file()
                 if default_file is not None and default_file.exists():
                     logger.info(
                         f"Auto-bootstrap: indexing default project portfolio from {default_file}"
                     )
-                    self.load_from_jsonl(default_file)
+                    # The collection is still empty, so quantizing it now is free
+                    self.enable_quantization()
+                    self.load_from_jsonl(default_file, trusted=True)
                     self.index_all_projects()
+                    ProjectsRag._bootstrap_done.add(collection_name)
                 else:
                     logger.info(
                         "Auto-bootstrap skipped: no default portfolio file found."
@@ -173,6 +435,16 @@ class ProjectsRag:
             logger.warning(f"Could not load system prompt: {e}")
             return ""
 
+    def _get_system_prompt(self) -> str:
+        """Return the RAG system prompt, reading it from disk on first use.
+        
+        The prompt is cached on the class, so the file is read at most once per process
+        and constructing a ProjectsRag never touches it.
+        """
+        if not ProjectsRag.PROJECTS_RAG_SYSTEM_PROMPT:
+            ProjectsRag.PROJECTS_RAG_SYSTEM_PROMPT = self._load_system_prompt()
+        return ProjectsRag.PROJECTS_RAG_SYSTEM_PROMPT
+
     def _find_default_portfolio_file(self) -> Optional[Path]:
         """Locate the default project portfolio JSONL file if present.
 
@@ -191,10 +463,12 @@ class ProjectsRag:
     #  Load from JSONL
     # ----------------------------------------------------------------------------------------
     @require(lambda jsonl_path: isinstance(jsonl_path, (str, Path)),
-             "JSONL path must be a string or Path object")
+             "JSONL path must be a string or Path object",
+             enabled=PROJECTS_RAG_STRICT)
     @ensure(lambda result: isinstance(result, ProjectPortfolio),
-            "Must return a ProjectPortfolio instance")
-    def load_from_jsonl(self, jsonl_path: Path) -> ProjectPortfolio:
+            "Must return a ProjectPortfolio instance",
+            enabled=PROJECTS_RAG_STRICT)
+    def load_from_jsonl(self, jsonl_path: Path, *, trusted: bool = False) -> ProjectPortfolio:
         """Load and validate projects from a JSONL (JSON Lines) file.
         
         Reads a file where each line contains a JSON object with project data. The method
@@ -211,6 +485,9 @@ class ProjectsRag:
         Args:
             jsonl_path: Path to your JSONL file containing projects.
                 Can be a string path or pathlib.Path object.
+            trusted: Set to True only for files produced by this codebase (such as
+                the bundled default portfolio); records are then built with
+                `Project.from_trusted_payload`, skipping per-record validation.
         
         Returns:
             ProjectPortfolio object containing all successfully loaded projects with
@@ -228,7 +505,7 @@ class ProjectsRag:
             portfolio = projects.load_from_jsonl(projects_path)
             
             print(f"Loaded {len(portfolio)} projects")
-            print(f"Categories: {portfolio.get_categories()}")
+            print(f"Categories: {portfolio.get_impact_categories()}")
             print(f"Departments: {portfolio.get_departments()}")
             
             # Access individual projects
@@ -245,6 +522,7 @@ class ProjectsRag:
         Note:
             - Empty lines in the file are automatically skipped
             - Malformed JSON lines generate warnings but don't stop the process
+            - Files of 10 MiB or more are parsed across worker processes
             - The loaded projects are stored in self.wisdom for later use
             - All text fields are automatically stripped of whitespace
         """
@@ -254,20 +532,15 @@ class ProjectsRag:
             raise FileNotFoundError(f"JSONL file not found: {jsonl_path}")
         
         try:
-            quotes = []
-            with open(jsonl_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:  # Skip empty lines
-                        continue
-                    
-                    try:
-                        data = json.loads(line)
-                        project = Project(**data)
-                        quotes.append(project)
-                    except (json.JSONDecodeError, ValueError) as e:
-                        logger.warning(f"Skipped invalid line {line_num} in {jsonl_path}: {e}")
-                        continue
+            # One read of the whole file; both parsers accept UTF-8 bytes directly.
+            raw = jsonl_path.read_bytes()
+            lines = raw.splitlines()
+            if len(raw) >= _PARALLEL_PARSE_MIN_BYTES:
+                quotes, skipped = self._parse_lines_in_parallel(lines, trusted=trusted)
+            else:
+                quotes, skipped = _parse_jsonl_lines(lines, 1, trusted)
+            for line_num, error in skipped:
+                logger.warning(f"Skipped invalid line {line_num} in {jsonl_path}: {error}")
             
             if not quotes:
                 raise InvalidPointsError(
@@ -285,11 +558,35 @@ class ProjectsRag:
                 points_count=0
             )
     
+    @staticmethod
+    def _parse_lines_in_parallel(lines: List[bytes], *,
+                                 trusted: bool) -> tuple[List[Project], List[tuple[int, str]]]:
+        """Parse JSONL lines in contiguous shards across worker processes.
+        
+        Shards are reassembled in file order, so the result matches a serial parse.
+        """
+        workers = os.cpu_count() or 1
+        shard_size = -(-len(lines) // workers)  # ceiling division
+        starts = range(0, len(lines), shard_size)
+        projects: List[Project] = []
+        skipped: List[tuple[int, str]] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_parse_jsonl_lines, lines[start:start + shard_size], start + 1, trusted)
+                for start in starts
+            ]
+            for future in futures:  # submission order == file order
+                shard_projects, shard_skipped = future.result()
+                projects.extend(shard_projects)
+                skipped.extend(shard_skipped)
+        return projects, skipped
+    
     # ----------------------------------------------------------------------------------------
     #  Index All Projects
     # ----------------------------------------------------------------------------------------
     @require(lambda self: self.wisdom is not None,
-             "Project portfolio must be loaded before indexing")
+             "Project portfolio must be loaded before indexing",
+             enabled=PROJECTS_RAG_STRICT)
     def index_all_projects(self) -> List[str]:
         """Transform all loaded projects into searchable vector embeddings.
         
@@ -334,15 +631,23 @@ class ProjectsRag:
         
         try:
             # Prepare texts and metadata for batch indexing
-            texts = [p.text for p in self.wisdom.projects]
-            metadata_list = [p.to_payload() for p in self.wisdom.projects]
+            texts = list(self.wisdom.texts)
+            metadata_list = list(self.wisdom.payloads)
             
-            # Use SemanticSearch's batch indexing capability
+            # Use SemanticSearch's batch indexing capability: large batches keep the
+            # embedding model's matmul kernels busy and cut per-item Python dispatch.
+            # Content-derived IDs make re-indexing the same portfolio an in-place update.
             indexed_ids = self.semantic_search.index_all_text(
                 texts=texts,
-                metadata_list=metadata_list
+                metadata_list=metadata_list,
+                point_ids=list(self.wisdom.point_ids),
+                batch_size=self.INDEX_BATCH_SIZE,
+                bulk=True,
+                embedding_cache=self._indexing_embedding_cache(),
             )
             
+            self.query_cache.clear()
+            self._payload_spellings = None
             logger.info(f"Successfully indexed {len(indexed_ids)} projects into collection '{self.collection_name}'")
             return indexed_ids
             
@@ -375,11 +680,19 @@ class ProjectsRag:
             self.semantic_search.vector_db.create_collection(
                 collection_name=self.collection_name,
                 vector_size=self.semantic_search.embedder.get_vector_size(),
-                distance=self.semantic_search.embedder.get_distance_metric()
+                distance=self.semantic_search.embedder.get_distance_metric(),
+                quantization_config=self.QUANTIZATION_CONFIG,
+                on_disk=self.VECTORS_ON_DISK,
+                datatype=self.VECTOR_DATATYPE,
+                hnsw_config=self.HNSW_CONFIG,
             )
+            self._ensure_payload_indexes()
             
-            # Clear loaded data
+            # Clear loaded data and any results cached from the old collection
             self.wisdom = None
+            self.query_cache.clear()
+            self._payload_spellings = None
+            ProjectsRag._bootstrap_done.discard(self.collection_name)
             
             logger.info(f"Successfully recreated empty collection '{self.collection_name}'")
             
@@ -389,6 +702,25 @@ class ProjectsRag:
                 points_count=0
             )
     
+    def enable_quantization(self) -> None:
+        """Add `QUANTIZATION_CONFIG` to an existing collection that has no quantization.
+        
+        Collections created by `recreate_collection` are quantized from the start;
+        this upgrades an older collection in place. On a populated collection Qdrant
+        re-quantizes every vector in the background, so call it deliberately, once.
+        """
+        self.semantic_search.vector_db.ensure_quantization(
+            collection_name=self.collection_name, quantization_config=self.QUANTIZATION_CONFIG
+        )
+    
+    def clear_cache(self) -> None:
+        """Drop all cached search results, LLM answers and RAG results.
+        
+        Hit and miss counts remain available as `query_cache.hits` / `query_cache.misses`.
+        """
+        self.query_cache.clear()
+        logger.info(f"Cleared query cache for collection '{self.collection_name}'")
+    
     # ----------------------------------------------------------------------------------------
     #  Load and Index
     # ----------------------------------------------------------------------------------------
@@ -419,18 +751,34 @@ class ProjectsRag:
     #  Search Projects
     # ----------------------------------------------------------------------------------------
     @require(lambda query: isinstance(query, str) and len(query.strip()) > 0,
-             "Query must be a non-empty string")
+             "Query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda limit: isinstance(limit, int) and limit > 0,
-             "Limit must be a positive integer")
+             "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda department: department is None or (isinstance(department, str) and len(department.strip()) > 0),
-             "Department filter must be None or a non-empty string")
+             "Department filter must be None or a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda impact_category: impact_category is None or (isinstance(impact_category, str) and len(impact_category.strip()) > 0),
-             "Impact category filter must be None or a non-empty string")
-    @ensure(lambda result: isinstance(result, list), "Must return a list")
+             "Impact category filter must be None or a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda candidate_multiplier: isinstance(candidate_multiplier, int)
+             and candidate_multiplier >= 1,
+             "Candidate multiplier must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda rerank, mmr: not (rerank and mmr),
+             "Choose at most one of rerank and mmr",
+             enabled=PROJECTS_RAG_STRICT)
+    @ensure(lambda result: isinstance(result, list), "Must return a list",
+            enabled=PROJECTS_RAG_STRICT)
     def search(self, query: str, limit: int = 10, 
               score_threshold: Optional[float] = None,
               department: Optional[str] = None,
-              impact_category: Optional[str] = None) -> List[models.ScoredPoint]:
+              impact_category: Optional[str] = None,
+              rerank: bool = False,
+              candidate_multiplier: int = 4,
+              mmr: bool = False,
+              mmr_lambda: float = 0.5) -> List[models.ScoredPoint]:
         """Find the most relevant projects using intelligent semantic search.
         
         Args:
@@ -439,6 +787,15 @@ class ProjectsRag:
             score_threshold: Minimum similarity score (0.0-1.0).
             department: Filter results to only include projects by this department.
             impact_category: Filter results to only include projects in this impact category.
+            rerank: Retrieve `limit * candidate_multiplier` candidates and keep the
+                `limit` a cross-encoder ranks highest. Slower, but puts better context
+                into a small prompt.
+            candidate_multiplier: Candidate pool size relative to `limit` when reranking
+                or diversifying.
+            mmr: Retrieve `limit * candidate_multiplier` candidates with their vectors and
+                keep `limit` of them by Maximal Marginal Relevance, trading a little
+                relevance for less redundant results.
+            mmr_lambda: MMR trade-off; 1.0 is pure relevance, 0.0 pure diversity.
         
         Returns:
             List of ScoredPoint objects, each containing:
@@ -447,25 +804,61 @@ class ProjectsRag:
             Results are automatically sorted by relevance (highest scores first).
         """
         try:
-            # Use SemanticSearch for the core search functionality
-            # Request more results than needed to allow for filtering
-            search_limit = limit * 3 if (department or impact_category) else limit
-            
-            initial_results = self.semantic_search.search_with_text(
-                query_text=query.strip(),
-                limit=search_limit,
-                score_threshold=score_threshold
+            query_text = query.strip()
+            scope = ("search", limit, score_threshold, department, impact_category,
+                     candidate_multiplier if rerank or mmr else None,
+                     mmr_lambda if mmr else None)
+            # MMR compares candidates against the query vector, so it always embeds here
+            server_side = self.server_side_inference and not mmr
+            query_vector = None
+            if not server_side:
+                query_vector, cached = self._cached_lookup(query_text=query_text, scope=scope)
+                if cached is not None:
+                    logger.info(f"Projects search for '{query[:50]}...' served from cache")
+                    return list(cached)
+            
+            # Metadata filters are applied by Qdrant during the vector search, so
+            # exactly `limit` matching results come back without over-fetching
+            fetch_limit = limit * candidate_multiplier if rerank or mmr else limit
+            query_filter = self._build_metadata_filter(
+                department=department, impact_category=impact_category
             )
-            
-            # Apply metadata filters if specified
-            filtered_results = self._apply_metadata_filters(
-                results=initial_results,
-                department_filter=department,
-                impact_category_filter=impact_category
-            )
-            
-            # Limit to requested number of results
-            final_results = filtered_results[:limit]
+            if server_side:
+                final_results = self.semantic_search.vector_db.search_points_by_text(
+                    collection_name=self.collection_name,
+                    text=query_text,
+                    model_name=self.server_inference_model,
+                    limit=fetch_limit,
+                    score_threshold=score_threshold,
+                    query_filter=query_filter,
+                    search_params=self.search_params,
+                )
+            else:
+                final_results = self.semantic_search.search_with_vector(
+                    query_vector=query_vector,
+                    limit=fetch_limit,
+                    score_threshold=score_threshold,
+                    query_filter=query_filter,
+                    search_params=self.search_params,
+                    with_vectors=mmr,
+                )
+            if rerank:
+                final_results = self._get_reranker().rerank(
+                    query=query_text, hits=final_results, limit=limit
+                )
+            elif mmr and final_results:
+                selected = mmr_select(
+                    query_vector=query_vector,
+                    candidate_vectors=[hit.vector for hit in final_results],
+                    limit=limit,
+                    lambda_mult=mmr_lambda,
+                )
+                final_results = [final_results[i] for i in selected]
+            if query_vector is not None:
+                self.query_cache.put(
+                    query_text=query_text, query_vector=query_vector, scope=scope,
+                    value=list(final_results),
+                )
             
             logger.info(
                 f"Projects search for '{query[:50]}...' returned {len(final_results)} results"
@@ -481,18 +874,147 @@ class ProjectsRag:
                 points_count=1
             )
 
+    # ----------------------------------------------------------------------------------------
+    #  Search Batch
+    # ----------------------------------------------------------------------------------------
+    @require(lambda requests: isinstance(requests, list) and len(requests) > 0,
+             "Requests must be a non-empty list",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda requests: all(isinstance(r, dict) and isinstance(r.get("query"), str)
+                                  and len(r["query"].strip()) > 0 for r in requests),
+             "Every request must be a dict with a non-empty 'query'",
+             enabled=PROJECTS_RAG_STRICT)
+    @ensure(lambda requests, result: len(result) == len(requests),
+            "Must return one result list per request",
+            enabled=PROJECTS_RAG_STRICT)
+    def search_batch(self, requests: List[Dict[str, Any]]) -> List[List[models.ScoredPoint]]:
+        """Run several searches with one embedding pass and one Qdrant round-trip.
+        
+        Each request holds keyword arguments of `search()`: `query` and optionally
+        `limit`, `score_threshold`, `department` and `impact_category`. Results are
+        read from and stored in the same cache as `search()`, so a later `search()`,
+        `ask_llm()` or `rag()` call with the same arguments is served without
+        touching the database.
+        
+        Args:
+            requests: The searches to run.
+        
+        Returns:
+            One list of ScoredPoint objects per request, in input order.
+        """
+        try:
+            results: List[Optional[List[models.ScoredPoint]]] = [None] * len(requests)
+            pending = []
+            searched = 0
+            for i, request in enumerate(requests):
+                query_text = request["query"].strip()
+                limit = request.get("limit", 10)
+                score_threshold = request.get("score_threshold")
+                department = request.get("department")
+                impact_category = request.get("impact_category")
+                # Same scope as a plain (no rerank / MMR) search()
+                scope = ("search", limit, score_threshold, department, impact_category,
+                         None, None)
+                cached = self.query_cache.get_exact(query_text=query_text, scope=scope)
+                if cached is not None:
+                    results[i] = list(cached)
+                    continue
+                query_filter = self._build_metadata_filter(
+                    department=department, impact_category=impact_category
+                )
+                pending.append((i, query_text, scope, limit, score_threshold, query_filter))
+            
+            if pending:
+                # One batched forward pass for every query the exact cache did not answer
+                query_vectors = self.embed_queries([query_text for _, query_text, *_ in pending])
+                to_search = []
+                for i, query_text, scope, *_ in pending:
+                    cached = self.query_cache.get(
+                        query_vector=query_vectors[query_text], scope=scope
+                    )
+                    if cached is not None:
+                        results[i] = list(cached)
+                    else:
+                        to_search.append(i)
+                
+                requests_by_index = {entry[0]: entry for entry in pending}
+                query_requests = []
+                for i in to_search:
+                    _, query_text, _, limit, score_threshold, query_filter = requests_by_index[i]
+                    query_requests.append(models.QueryRequest(
+                        query=query_vectors[query_text].tolist(),
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        filter=query_filter,
+                        params=self.search_params,
+                        with_payload=True,
+                    ))
+                searched = len(query_requests)
+                if query_requests:
+                    hits_per_request = self.semantic_search.vector_db.query_batch(
+                        collection_name=self.collection_name, requests=query_requests
+                    )
+                    for i, hits in zip(to_search, hits_per_request):
+                        _, query_text, scope, *_ = requests_by_index[i]
+                        self.query_cache.put(
+                            query_text=query_text, query_vector=query_vectors[query_text],
+                            scope=scope, value=list(hits),
+                        )
+                        results[i] = hits
+            
+            logger.info(f"Batched {len(requests)} project searches "
+                        f"({len(requests) - searched} served from cache)")
+            return results
+        
+        except Exception as e:
+            raise InvalidPointsError(
+                issue=f"Failed to run batched project search: {str(e)}",
+                points_count=len(requests)
+            )
+
+    # ----------------------------------------------------------------------------------------
+    #  Embed Queries (batched)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda queries: isinstance(queries, list) and len(queries) > 0
+             and all(isinstance(q, str) and len(q.strip()) > 0 for q in queries),
+             "Queries must be a non-empty list of non-empty strings",
+             enabled=PROJECTS_RAG_STRICT)
+    def embed_queries(self, queries: List[str]) -> Dict[str, np.ndarray]:
+        """Embed several upcoming queries in one batched forward pass.
+        
+        The vectors are added to the embedder's vector cache, so later `search()`,
+        `ask_llm()` or `rag()` calls for these queries skip the model. Call this
+        once up front when the queries of a session are known in advance.
+        
+        Args:
+            queries: Query texts to embed; surrounding whitespace is ignored.
+        
+        Returns:
+            The embedding of each (stripped) query text.
+        """
+        texts = list(dict.fromkeys(query.strip() for query in queries))
+        vectors = self.embedder.embed_cached_texts(texts=texts)
+        embedded = dict(zip(texts, vectors))
+        logger.info(f"Pre-embedded {len(embedded)} queries in one batch")
+        return embedded
+
     # ----------------------------------------------------------------------------------------
     #  Search Projects (as Domain Models)
     # ----------------------------------------------------------------------------------------
     @require(lambda query: isinstance(query, str) and len(query.strip()) > 0,
-             "Query must be a non-empty string")
+             "Query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda limit: isinstance(limit, int) and limit > 0,
-             "Limit must be a positive integer")
+             "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda department: department is None or (isinstance(department, str) and len(department.strip()) > 0),
-             "Department filter must be None or a non-empty string")
+             "Department filter must be None or a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda impact_category: impact_category is None or (isinstance(impact_category, str) and len(impact_category.strip()) > 0),
-             "Impact category filter must be None or a non-empty string")
-    @ensure(lambda result: isinstance(result, list), "Must return a list")
+             "Impact category filter must be None or a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @ensure(lambda result: isinstance(result, list), "Must return a list",
+            enabled=PROJECTS_RAG_STRICT)
     def search_projects(self, query: str, limit: int = 10,
                         score_threshold: Optional[float] = None,
                         department: Optional[str] = None,
@@ -574,7 +1096,7 @@ class ProjectsRag:
         
         if self.wisdom:
             stats["loaded_projects"] = len(self.wisdom)
-            stats["categories"] = self.wisdom.get_categories()
+            stats["categories"] = self.wisdom.get_impact_categories()
             stats["departments"] = self.wisdom.get_departments()
         
         return stats
@@ -595,10 +1117,14 @@ class ProjectsRag:
         Returns:
             Point ID of the indexed project.
         """
-        return self.semantic_search.index_text(
+        point_id = self.semantic_search.index_text(
             text=project.text,
-            metadata=project.to_payload()
+            metadata=project.to_payload(),
+            point_id=project.point_id,
         )
+        self.query_cache.clear()
+        self._payload_spellings = None
+        return point_id
     
     # ----------------------------------------------------------------------------------------
     #  RAG System Prompts
@@ -606,7 +1132,7 @@ class ProjectsRag:
     # Path to the external system prompt file
     SYSTEM_PROMPT_PATH = Path(__file__).parent / "prompts" / "projects_system_prompt.md"
 
-    # Comprehensive RAG System Prompt for ProjectsRag Class (loaded at init time)
+    # Comprehensive RAG System Prompt for ProjectsRag Class (loaded on first use)
     PROJECTS_RAG_SYSTEM_PROMPT: str = ""
 
     # Alternative shorter version for quick use
@@ -621,16 +1147,22 @@ class ProjectsRag:
     # ----------------------------------------------------------------------------------------
     #  RAG Helper Methods
     # ----------------------------------------------------------------------------------------
-    @require(lambda search_results: isinstance(search_results, list), "Search results must be a list")
+    @require(lambda search_results: isinstance(search_results, list), "Search results must be a list",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda max_results: isinstance(max_results, int) and max_results > 0,
-             "Max results must be a positive integer")
+             "Max results must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     def format_search_results_for_rag(self, search_results: List[models.ScoredPoint], 
-                                     max_results: int = 5) -> str:
+                                     max_results: int = 5,
+                                     max_tokens: Optional[int] = None) -> str:
         """Format search results from Projects for RAG system prompt.
         
         Args:
             search_results: List of ScoredPoint objects from ProjectsRag.search()
             max_results: Maximum number of results to include
+            max_tokens: Optional token budget for the formatted results. Results are
+                taken in relevance order until the next one would exceed it (the top
+                result is always kept), and a footer notes how many were dropped.
             
         Returns:
             Formatted string for RAG context
@@ -638,60 +1170,84 @@ class ProjectsRag:
         if not search_results:
             return "No relevant projects found for this query."
         
-        formatted_results = []
-        for i, result in enumerate(search_results[:max_results], 1):
-            content = result.payload.get("content", "")
-            department = result.payload.get("department", "Unknown")
-            category = result.payload.get("impact_category", "Unknown")
-            score = result.score
-            
-            formatted_results.append(f"""
-Project {i}: "{content}"
-Department: {department}
-Category: {category}
-Relevance Score: {score:.3f}
-""")
-        
-        return "\n".join(formatted_results)
+        candidates = search_results[:max_results]
+        rendered = []
+        used_tokens = 0
+        for i, result in enumerate(candidates, 1):
+            content, _, department, category = _hit_fields(result.payload)
+            block = _RAG_RESULT_TEMPLATE.format(
+                i=i, content=content, department=department, category=category,
+                score=result.score,
+            )
+            if max_tokens is not None:
+                used_tokens += _count_tokens(block)
+                if used_tokens > max_tokens and rendered:
+                    break
+            rendered.append(block)
+        
+        if len(rendered) < len(candidates):
+            logger.info(f"RAG context token budget kept {len(rendered)} of "
+                        f"{len(candidates)} projects")
+            rendered.append(f"[truncated: {len(rendered)} of {len(candidates)} projects shown]")
+        return "\n".join(rendered)
     
     @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
-             "User query must be a non-empty string")
-    @require(lambda search_results: isinstance(search_results, list), "Search results must be a list")
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda search_results: isinstance(search_results, list), "Search results must be a list",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda max_context_tokens: isinstance(max_context_tokens, int)
+             and max_context_tokens > 0, "Max context tokens must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     def create_rag_context(self, user_query: str, search_results: List[models.ScoredPoint], 
-                          system_prompt: Optional[str] = None) -> str:
+                          system_prompt: Optional[str] = None,
+                          max_context_tokens: int = 6000) -> str:
         """Create a complete RAG context with system prompt and formatted results.
         
         Args:
             user_query: The user's question
             search_results: Search results from ProjectsRag.search()
             system_prompt: System prompt to use (defaults to comprehensive prompt)
+            max_context_tokens: Token budget for the whole context. What the system
+                prompt and query leave over is filled with the most relevant projects;
+                the least relevant are dropped first if they do not fit.
             
         Returns:
             Complete RAG context string
+
+        Note:
+            OpenAI caches prompt prefixes of 1024+ tokens and reuses them for later
+            requests that start with the same bytes. The context therefore opens with the
+            unchanged system prompt and puts the retrieved projects and the user query
+            after it; keep anything that varies per call out of that prefix.
         """
         if system_prompt is None:
-            system_prompt = self.PROJECTS_RAG_SYSTEM_PROMPT
-        if not isinstance(system_prompt, str) or not system_prompt.strip():
+            system_prompt = self._get_system_prompt()
+        # isspace() checks the (multi-KB) prompt without copying it, unlike strip()
+        if not isinstance(system_prompt, str) or not system_prompt or system_prompt.isspace():
             raise ValueError("System prompt must be a non-empty string")
         
-        formatted_results = self.format_search_results_for_rag(search_results)
+        # Projects get whatever the prompt and query leave of the token budget
+        results_budget = (max_context_tokens - _count_tokens(system_prompt)
+                          - _count_tokens(user_query) - _RAG_CONTEXT_FRAME_TOKENS)
         
-        context = f"""
-{system_prompt}
-
-## User Query
-{user_query}
-
-## Relevant Projects
-{formatted_results}
-
-Please answer the user's question using the provided projects and following the guidelines above.
-"""
-        return context
+        # The per-result blocks are joined once in format_search_results_for_rag; the
+        # module-level template then builds the whole context in a single allocation
+        formatted_results = self.format_search_results_for_rag(
+            search_results, max_tokens=max(results_budget, 0)
+        )
+        
+        return _RAG_CONTEXT_TEMPLATE.format(
+            system_prompt=system_prompt,
+            user_query=user_query,
+            formatted_results=formatted_results,
+        )
     
     @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
-             "User query must be a non-empty string")
-    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer")
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     def search_and_create_rag_context(self, user_query: str, limit: int = 5,
                                     score_threshold: Optional[float] = None,
                                     department: Optional[str] = None,
@@ -725,16 +1281,22 @@ Please answer the user's question using the provided projects and following the
     # ----------------------------------------------------------------------------------------
     #  Helper Methods (Private)
     # ----------------------------------------------------------------------------------------
-    @require(lambda results: isinstance(results, list), "Results must be a list")
+    @require(lambda results: isinstance(results, list), "Results must be a list",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda search_description: isinstance(search_description, str) and len(search_description.strip()) > 0,
-             "Search description must be a non-empty string")
+             "Search description must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
     @require(lambda max_text_length: isinstance(max_text_length, int) and max_text_length > 0,
-             "Max text length must be a positive integer")
+             "Max text length must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     def display_search_results(self, results: List[models.ScoredPoint], 
                               search_description: str, 
                               max_text_length: int = 120) -> None:
         """Present search results in a beautiful, easy-to-read table format.
         
+        When stdout is not a terminal (e.g. redirected to a log file), the results are
+        printed as plain text instead.
+        
         Args:
             results: Your search results from the search() method. Each result
                 contains the project text, department, impact_category, effort_size, and relevance score.
@@ -743,12 +1305,17 @@ Please answer the user's question using the provided projects and following the
             max_text_length: Maximum characters to display for each item before
                 truncating with "..." (default: 120). Keeps table readable.
         """
+        if not _HAS_RICH:
+            logger.warning("Rich library not available, falling back to simple display")
+            self._display_search_results_simple(results, search_description, max_text_length)
+            return
+        # Output piped to a file or CI log: skip the table layout and ANSI styling
+        if not _CONSOLE.is_terminal:
+            self._display_search_results_simple(results, search_description, max_text_length)
+            return
+        
         try:
-            from rich.console import Console
-            from rich.table import Table
-            from rich.text import Text
-            
-            console = Console()
+            console = _CONSOLE
             
             # Create table
             table = Table(
@@ -762,7 +1329,7 @@ Please answer the user's question using the provided projects and following the
             # Add columns
             table.add_column("#", style="magenta", width=15, justify="center")
             table.add_column("Score", style="green", width=20, justify="center")
-            table.add_column("Project", style="bright_white", width=60)
+            table.add_column("Project", style="italic bright_white", width=60)
             table.add_column("Name", style="cyan", width=30)
             table.add_column("Department", style="bold bright_yellow", width=25)
             table.add_column("Impact Category", style="white", width=25)
@@ -772,38 +1339,27 @@ Please answer the user's question using the provided projects and following the
                 console.print(table)
                 return
             
-            # Add rows
+            # Add rows; long text is truncated for readability. Cells are plain strings
+            # styled by their column, so no per-row Text object is built; the project
+            # text is escaped so brackets in it are not read as rich markup
+            cutoff = max_text_length - 3
             for i, result in enumerate(results, 1):
-                content = result.payload.get("content", "")
-                name = result.payload.get("name", "(unnamed)")
-                department = result.payload.get("department", "Unknown")
-                category = result.payload.get("impact_category", "Unknown")
-                score = result.score
-                
-                # Truncate long text for readability
-                display_content = (content if len(content) <= max_text_length 
-                                 else content[:max_text_length-3] + "...")
-                
-                # Create styled text
-                project_text = Text(f'"{display_content}"', style="italic")
-                
+                content, name, department, category = _hit_fields(result.payload)
+                if len(content) > max_text_length:
+                    content = content[:cutoff] + "..."
                 table.add_row(
                     str(i),
-                    f"{score:.3f}",
-                    project_text,
+                    f"{result.score:.3f}",
+                    f'"{escape(content)}"',
                     name,
                     department,
-                    category
+                    category,
                 )
             
             # Display table
             console.print(table)
             console.print(f"📊 Found {len(results)} results", style="bold green")
             
-        except ImportError:
-            # Fallback to simple print if rich is not available
-            logger.warning("Rich library not available, falling back to simple display")
-            self._display_search_results_simple(results, search_description, max_text_length)
         except Exception as e:
             logger.error(f"Failed to display search results: {str(e)}")
             # Fallback to simple display
@@ -829,30 +1385,152 @@ Please answer the user's question using the provided projects and following the
         print(f"   📊 Found {len(results)} results")
         print()
         
+        # Build every block first and print once; long text is truncated for readability
+        cutoff = max_text_length - 3
+        blocks = []
         for i, result in enumerate(results, 1):
-            content = result.payload.get("content", "")
-            department = result.payload.get("department", "Unknown")
-            category = result.payload.get("impact_category", "Unknown")
-            
-            # Truncate long text for readability
-            display_content = (content if len(content) <= max_text_length 
-                             else content[:max_text_length-3] + "...")
-            
-            print(f"   {i}. 📊 Score: {result.score:.3f}")
-            print(f"      📝 Project: \"{display_content}\"")
-            print(f"      🏢 Department: {department}")
-            print(f"      🏷️  Category: {category}")
-            print()
+            content, _, department, category = _hit_fields(result.payload)
+            if len(content) > max_text_length:
+                content = content[:cutoff] + "..."
+            blocks.append(
+                f"   {i}. 📊 Score: {result.score:.3f}\n"
+                f"      📝 Project: \"{content}\"\n"
+                f"      🏢 Department: {department}\n"
+                f"      🏷️  Category: {category}\n"
+            )
+        print("\n".join(blocks))
+    
+    def _indexing_embedding_cache(self) -> EmbeddingDiskCache:
+        """Prefer the pre-computed cache shipped next to the portfolio file, if any.
+        
+        `precompute_embeddings.py` writes it, so indexing a bundled portfolio (e.g. on
+        auto-bootstrap) reads vectors from disk instead of running the embedder.
+        """
+        source_file = self.wisdom.source_file if self.wisdom else None
+        if source_file is not None:
+            sidecar = sidecar_cache_path(source_file)
+            if sidecar.exists():
+                logger.info(f"Using pre-computed embeddings from '{sidecar}'")
+                return EmbeddingDiskCache(path=sidecar)
+        return self.embedding_cache
+    
+    def _embed_query(self, query_text: str) -> np.ndarray:
+        """Embed a (stripped) query string.
+        
+        Paginated or repeated searches for the same text are served from the
+        embedder's vector cache and skip the transformer forward pass.
+        """
+        return self.embedder.embed_cached_texts(texts=[query_text])[0]
+
+    # LLM clients are created on first use (so constructing a ProjectsRag needs no API
+    # key) and then reused, keeping their HTTP connection pools warm across calls.
+    @cached_property
+    def _openai_client(self) -> OpenAI:
+        return OpenAI()
+    
+    @cached_property
+    def _instructor_client(self) -> instructor.Instructor:
+        return instructor.from_openai(self._openai_client)
+    
+    @cached_property
+    def _async_openai_client(self) -> AsyncOpenAI:
+        return AsyncOpenAI()
+    
+    @cached_property
+    def _async_instructor_client(self) -> instructor.AsyncInstructor:
+        return instructor.from_openai(self._async_openai_client)
+    
+    @classmethod
+    def _get_reranker(cls) -> CrossEncoderReranker:
+        """Return the shared cross-encoder, loading it on first use."""
+        if cls._reranker is None:
+            with cls._reranker_lock:
+                if cls._reranker is None:
+                    cls._reranker = CrossEncoderReranker()
+        return cls._reranker
+    
+    def _cached_lookup(self, *, query_text: str, scope: tuple) -> tuple[Optional[np.ndarray], Any]:
+        """Look up `query_text` in the semantic cache.
+        
+        Returns:
+            A `(query_vector, cached_value)` pair. On an exact-text hit the vector is
+            None (no embedding was needed); on a miss the cached value is None and the
+            vector can be reused for the search and for `query_cache.put`.
+        """
+        cached = self.query_cache.get_exact(query_text=query_text, scope=scope)
+        if cached is not None:
+            return None, cached
+        query_vector = self._embed_query(query_text)
+        return query_vector, self.query_cache.get(query_vector=query_vector, scope=scope)
+    
+    def _build_metadata_filter(self, *, department: Optional[str] = None,
+                               impact_category: Optional[str] = None) -> Optional[models.Filter]:
+        """Build a Qdrant payload filter for the department / impact category filters.
+        
+        Qdrant keyword matches are case-sensitive, so each value is first mapped to
+        its spelling in the corpus, keeping the case-insensitive behaviour of the
+        former Python-side filtering.
+        
+        Returns:
+            A `models.Filter`, or None when no filter is requested.
+        """
+        conditions = []
+        for field_name, value in (("department", department),
+                                  ("impact_category", impact_category)):
+            if not value:
+                continue
+            conditions.append(models.FieldCondition(
+                key=field_name,
+                match=models.MatchValue(value=self._canonical_payload_value(field_name, value)),
+            ))
+        return models.Filter(must=conditions) if conditions else None
+    
+    def _canonical_payload_value(self, field_name: str, value: str) -> str:
+        """Return the corpus spelling of `value` for `field_name`, if any."""
+        if self.wisdom:
+            known = (self.wisdom.departments_by_lowercase if field_name == "department"
+                     else self.wisdom.impact_categories_by_lowercase)
+        else:
+            known = self._stored_payload_spellings().get(field_name, {})
+        return known.get(value.lower(), value)
+    
+    def _stored_payload_spellings(self) -> Dict[str, Dict[str, str]]:
+        """Map lowercased filter values to their stored spelling, read from the collection.
+        
+        Used when no portfolio is loaded in this instance (the collection was already
+        populated). The collection is scanned once; indexing resets the mapping.
+        """
+        if self._payload_spellings is None:
+            stored = self.semantic_search.vector_db.distinct_payload_values(
+                collection_name=self.collection_name,
+                field_names=list(self.FILTERABLE_PAYLOAD_FIELDS),
+            )
+            self._payload_spellings = {
+                field_name: {value.lower(): value for value in values}
+                for field_name, values in stored.items()
+            }
+        return self._payload_spellings
+    
+    def _ensure_payload_indexes(self) -> None:
+        """Index the payload fields used by metadata filters, creating only missing ones."""
+        self.semantic_search.vector_db.ensure_payload_indexes(
+            collection_name=self.collection_name,
+            field_names=list(self.FILTERABLE_PAYLOAD_FIELDS),
+        )
+        ProjectsRag._payload_indexes_done.add(self.collection_name)
     
     def _apply_metadata_filters(self, results: List[models.ScoredPoint],
                                department_filter: Optional[str] = None,
                                impact_category_filter: Optional[str] = None) -> List[models.ScoredPoint]:
         """Apply department and/or impact category filters to search results.
         
+        `search` filters inside Qdrant; this helper remains for filtering result lists
+        obtained elsewhere. Matching is case-insensitive.
+        
         Args:
             results: List of scored points from vector search.
             department_filter: Optional department name to filter by.
-            category_filter: Optional category name to filter by.
+            impact_category_filter: Optional impact category name to filter by.
             
         Returns:
             Filtered list of scored points.
@@ -860,28 +1538,17 @@ Please answer the user's question using the provided projects and following the
         if not department_filter and not impact_category_filter:
             return results
         
-        filtered_results = []
-        
-        for result in results:
-            # Skip results without payload
-            if not result.payload:
-                continue
-            
-            # Apply department filter
-            if department_filter:
-                result_department = result.payload.get("department", "")
-                if not result_department or result_department.lower() != department_filter.lower():
-                    continue
-            
-            # Apply category filter
-            if impact_category_filter:
-                result_category = result.payload.get("impact_category", "")
-                if not result_category or result_category.lower() != impact_category_filter.lower():
-                    continue
-            
-            filtered_results.append(result)
-        
-        return filtered_results
+        # Lowercase the filter values once; a single pass then checks each payload
+        department = department_filter.lower() if department_filter else None
+        category = impact_category_filter.lower() if impact_category_filter else None
+        return [
+            result for result in results
+            if result.payload
+            and (department is None
+                 or (result.payload.get("department") or "").lower() == department)
+            and (category is None
+                 or (result.payload.get("impact_category") or "").lower() == category)
+        ]
 
     # ----------------------------------------------------------------------------------------
     #  LLM Response Models
@@ -889,7 +1556,9 @@ Please answer the user's question using the provided projects and following the
     class ProjectsResponse(BaseModel):
         """Structured response from LLM about projects portfolio queries."""
         
-        answer: str = Field(
+        # Substantial answers only: at least 50 characters once surrounding whitespace
+        # is stripped. Checked inside pydantic-core, with no Python validator call.
+        answer: Annotated[str, StringConstraints(strip_whitespace=True, min_length=50)] = Field(
             ..., 
             description="A thoughtful answer to the user's question about projects, using the provided context"
         )
@@ -907,26 +1576,21 @@ Please answer the user's question using the provided projects and following the
             default_factory=list,
             description="2-3 follow-up questions to explore related topics"
         )
-        
-        @field_validator('answer')
-        @classmethod
-        def validate_answer_length(cls, v: str) -> str:
-            """Ensure answer is substantial."""
-            if len(v.strip()) < 50:
-                raise ValueError("Answer must be at least 50 characters long")
-            return v
     
     # ----------------------------------------------------------------------------------------
     #  LLM Integration Methods
     # ----------------------------------------------------------------------------------------
     @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
-             "User query must be a non-empty string")
-    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer")
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     def ask_llm(self, *, user_query: str, limit: int = 5, 
                 score_threshold: Optional[float] = None,
                 department: Optional[str] = None,
                 impact_category: Optional[str] = None,
-                model: str = "gpt-4o") -> "ProjectsRag.ProjectsResponse":
+                model: str = "gpt-4o",
+                precomputed_context: Optional[str] = None) -> "ProjectsRag.ProjectsResponse":
         """Ask AI thoughtful questions about projects and get structured, insightful answers.
         
         This method combines the power of semantic search with advanced AI reasoning
@@ -939,6 +1603,9 @@ Please answer the user's question using the provided projects and following the
             department: Focus the answer on projects from this specific department only.
             impact_category: Limit context to projects from this impact category only.
             model: OpenAI model to use.
+            precomputed_context: RAG context already built by the caller (e.g. `rag`).
+                When given, the search and context-building steps are skipped and the
+                answer is not cached here, since the context is the caller's.
         
         Returns:
             ProjectsResponse containing:
@@ -948,27 +1615,44 @@ Please answer the user's question using the provided projects and following the
             - follow_up_questions: Suggested related questions to explore further
         """
         try:
-            # Create RAG context
-            rag_context = self.search_and_create_rag_context(
-                user_query=user_query,
-                limit=limit,
-                score_threshold=score_threshold,
-                department=department,
-                impact_category=impact_category
-            )
+            if precomputed_context is None:
+                scope = ("ask_llm", model, limit, score_threshold, department, impact_category)
+                query_vector, cached = self._cached_lookup(
+                    query_text=user_query.strip(), scope=scope
+                )
+                if cached is not None:
+                    logger.info(f"LLM response for query '{user_query[:50]}...' served from cache")
+                    return cached
+                
+                # Create RAG context
+                rag_context = self.search_and_create_rag_context(
+                    user_query=user_query,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    department=department,
+                    impact_category=impact_category
+                )
+            else:
+                rag_context = precomputed_context
             
-            # Create instructor-patched client
-            client = instructor.from_openai(OpenAI())
+            # Reuse the instance's instructor-patched client
+            client = self._instructor_client
             
             # Get structured response from LLM
             response = client.chat.completions.create(
                 model=model,
+                prompt_cache_key=self.PROMPT_CACHE_KEY,
                 response_model=self.ProjectsResponse,
                 messages=[
                     {"role": "user", "content": rag_context}
                 ]
             )
             
+            if precomputed_context is None:
+                self.query_cache.put(
+                    query_text=user_query.strip(), query_vector=query_vector, scope=scope,
+                    value=response,
+                )
             logger.info(f"LLM response generated for query: '{user_query[:50]}...'")
             return response
             
@@ -979,33 +1663,131 @@ Please answer the user's question using the provided projects and following the
                 points_count=1
             )
     
+    @require(lambda query: isinstance(query, str) and len(query.strip()) > 0,
+             "Query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda limit: isinstance(limit, int) and limit > 0,
+             "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
+    async def asearch(self, query: str, limit: int = 10,
+                      score_threshold: Optional[float] = None,
+                      department: Optional[str] = None,
+                      impact_category: Optional[str] = None) -> List[models.ScoredPoint]:
+        """Async variant of `search` that keeps the event loop free.
+        
+        Query embedding is CPU-bound and the vector store client is synchronous, so the
+        search runs in a worker thread; other coroutines progress in the meantime.
+        
+        Args:
+            query: Search query text.
+            limit: Maximum number of results to return.
+            score_threshold: Minimum similarity score threshold.
+            department: Optional filter to only return projects by this department.
+            impact_category: Optional filter to only return projects in this impact category.
+            
+        Returns:
+            List of ScoredPoint objects, as returned by `search`.
+        """
+        return await asyncio.to_thread(
+            self.search,
+            query=query,
+            limit=limit,
+            score_threshold=score_threshold,
+            department=department,
+            impact_category=impact_category,
+        )
+    
+    @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
+    async def ask_llm_astream(self, *, user_query: str, limit: int = 5,
+                              score_threshold: Optional[float] = None,
+                              department: Optional[str] = None,
+                              impact_category: Optional[str] = None,
+                              model: str = "gpt-4o") -> AsyncIterator[str]:
+        """Stream a free-text answer about projects as the LLM produces it.
+        
+        The search and the (first-use) system-prompt load run concurrently, and answer
+        tokens are yielded as they arrive instead of after the full completion.
+        
+        Args:
+            user_query: The user's question about projects.
+            limit: Maximum number of search results to include.
+            score_threshold: Minimum similarity score threshold.
+            department: Optional filter to only use projects by this department.
+            impact_category: Optional filter to only use projects in this impact category.
+            model: OpenAI model to use.
+            
+        Yields:
+            Successive fragments of the answer text.
+        """
+        try:
+            search_results, system_prompt = await asyncio.gather(
+                self.asearch(
+                    query=user_query,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    department=department,
+                    impact_category=impact_category,
+                ),
+                asyncio.to_thread(self._get_system_prompt),
+            )
+            rag_context = self.create_rag_context(user_query, search_results, system_prompt)
+            
+            stream = await self._async_openai_client.chat.completions.create(
+                model=model,
+                prompt_cache_key=self.PROMPT_CACHE_KEY,
+                messages=[
+                    {"role": "user", "content": rag_context}
+                ],
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            logger.info(f"Streamed LLM response for query: '{user_query[:50]}...'")
+            
+        except Exception as e:
+            logger.error(f"Failed to stream LLM response: {str(e)}")
+            raise InvalidPointsError(
+                issue=f"Streaming LLM query failed: {str(e)}",
+                points_count=1
+            )
+    
     @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
-             "User query must be a non-empty string")
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
     def ask_llm_simple(self, *, user_query: str, limit: int = 3, 
-                      model: str = "gpt-4o") -> str:
+                      model: str = "gpt-4o",
+                      precomputed_context: Optional[str] = None) -> str:
         """Get a simple text response from the LLM about projects.
         
         Args:
             user_query: The user's question about projects
             limit: Maximum number of search results to include
             model: OpenAI model to use (default: gpt-4o)
+            precomputed_context: RAG context already built by the caller; when given,
+                the search and context-building steps are skipped
             
         Returns:
             Simple text response from the LLM
         """
         try:
             # Create RAG context
-            rag_context = self.search_and_create_rag_context(
+            rag_context = precomputed_context or self.search_and_create_rag_context(
                 user_query=user_query,
                 limit=limit
             )
             
-            # Create OpenAI client
-            client = OpenAI()
+            # Reuse the instance's OpenAI client (and its connection pool)
+            client = self._openai_client
             
             # Get simple response from LLM
             response = client.chat.completions.create(
                 model=model,
+                prompt_cache_key=self.PROMPT_CACHE_KEY,
                 messages=[
                     {"role": "user", "content": rag_context}
                 ],
@@ -1024,25 +1806,91 @@ Please answer the user's question using the provided projects and following the
                 points_count=1
             )
     
-    def display_llm_response(self, response: "ProjectsRag.ProjectsResponse", user_query: str) -> None:
+    @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    def ask_llm_stream(self, *, user_query: str, limit: int = 3,
+                       model: str = "gpt-4o",
+                       precomputed_context: Optional[str] = None) -> Iterator[str]:
+        """Stream a simple text response from the LLM about projects.
+        
+        Same prompt and settings as `ask_llm_simple`, but the first fragment is available
+        as soon as the model emits it, and the caller can stop iterating early.
+        
+        Args:
+            user_query: The user's question about projects
+            limit: Maximum number of search results to include
+            model: OpenAI model to use (default: gpt-4o)
+            precomputed_context: RAG context already built by the caller; when given,
+                the search and context-building steps are skipped
+            
+        Yields:
+            Successive fragments of the answer text
+        """
+        try:
+            rag_context = precomputed_context or self.search_and_create_rag_context(
+                user_query=user_query,
+                limit=limit
+            )
+            
+            stream = self._openai_client.chat.completions.create(
+                model=model,
+                prompt_cache_key=self.PROMPT_CACHE_KEY,
+                messages=[
+                    {"role": "user", "content": rag_context}
+                ],
+                max_tokens=500,
+                temperature=0.7,
+                stream=True,
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            logger.info(f"Streamed LLM response for query: '{user_query[:50]}...'")
+            
+        except Exception as e:
+            logger.error(f"Failed to stream LLM response: {str(e)}")
+            raise InvalidPointsError(
+                issue=f"Streaming LLM query failed: {str(e)}",
+                points_count=1
+            )
+    
+    def display_llm_response(self, response: Union["ProjectsRag.ProjectsResponse", str, Iterable[str]],
+                             user_query: str) -> None:
         """Display the LLM response in a formatted way using rich.
         
         Args:
-            response: The structured response from the LLM
+            response: The structured response from the LLM, a plain-text answer, or a
+                stream of answer fragments (as from `ask_llm_stream`), which is rendered
+                live as the fragments arrive
             user_query: The original user query
         """
+        if not _HAS_RICH:
+            logger.warning("Rich library not available, falling back to simple display")
+            self._display_llm_response_simple(response, user_query)
+            return
+        
         try:
-            from rich.console import Console
-            from rich.panel import Panel
-            from rich.text import Text
-            from rich.columns import Columns
+            console = _CONSOLE
+            title = _LLM_ANSWER_TITLE_TEMPLATE.format(user_query=user_query)
             
-            console = Console()
+            if isinstance(response, str):
+                console.print(Panel(Text(response, style="white"), title=title,
+                                    border_style="green"))
+                return
+            if not isinstance(response, ProjectsRag.ProjectsResponse):
+                answer = Text(style="white")
+                with Live(Panel(answer, title=title, border_style="green"),
+                          console=console, refresh_per_second=12) as live:
+                    for fragment in response:
+                        answer.append(fragment)
+                        live.refresh()
+                return
             
             # Display the main answer
             console.print(Panel(
                 Text(response.answer, style="white"),
-                title=f"🤖 LLM Answer to: '{user_query}'",
+                title=title,
                 border_style="green"
             ))
             
@@ -1072,23 +1920,26 @@ Please answer the user's question using the provided projects and following the
                     border_style="magenta"
                 ))
                 
-        except ImportError:
-            # Fallback to simple print if rich is not available
-            logger.warning("Rich library not available, falling back to simple display")
-            self._display_llm_response_simple(response, user_query)
         except Exception as e:
             logger.error(f"Failed to display LLM response: {str(e)}")
             self._display_llm_response_simple(response, user_query)
     
-    def _display_llm_response_simple(self, response: "ProjectsRag.ProjectsResponse", user_query: str) -> None:
+    def _display_llm_response_simple(self, response: Union["ProjectsRag.ProjectsResponse", str, Iterable[str]],
+                                     user_query: str) -> None:
         """Simple fallback display method when rich is not available.
         
         Args:
-            response: The structured response from the LLM
+            response: The structured response, a plain-text answer, or a stream of
+                answer fragments
             user_query: The original user query
         """
-        print(f"\n🤖 LLM Answer to: '{user_query}'")
+        print("\n" + _LLM_ANSWER_TITLE_TEMPLATE.format(user_query=user_query))
         print("=" * 60)
+        if not isinstance(response, ProjectsRag.ProjectsResponse):
+            for fragment in ([response] if isinstance(response, str) else response):
+                print(fragment, end="", flush=True)
+            print("\n")
+            return
         print(response.answer)
         print()
         
@@ -1113,8 +1964,10 @@ Please answer the user's question using the provided projects and following the
     #  RAG Facade Method
     # ----------------------------------------------------------------------------------------
     @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
-             "User query must be a non-empty string")
-    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer")
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
     def rag(self, *, user_query: str, limit: int = 5, 
             score_threshold: Optional[float] = None,
             department: Optional[str] = None,
@@ -1153,6 +2006,8 @@ Please answer the user's question using the provided projects and following the
             response_type: Format of AI response:
                 - "structured": Rich AnimalWisdomResponse with insights and follow-ups
                 - "simple": Plain text response for basic use cases
+                - "stream": Iterator of plain-text fragments, yielded as the model
+                  produces them (pass it to `display_llm_response` to render live)
         
         Returns:
             Complete results dictionary containing:
@@ -1219,42 +2074,44 @@ Please answer the user's question using the provided projects and following the
             - Start with limit=5 for good balance of quality and speed
             - Use score_threshold=0.7+ for highly focused questions
             - Choose "simple" response_type for faster, lower-cost interactions
-            - Cache results for frequently asked questions
+            - Repeated or near-identical questions with the same settings are served
+              from the semantic cache; call `clear_cache()` to force a fresh answer
         """
         try:
-            # Step 1: Perform semantic search
-            search_results = self.search(
-                query=user_query,
+            pipeline_args = dict(
+                user_query=user_query,
                 limit=limit,
                 score_threshold=score_threshold,
                 department=department,
-                impact_category=impact_category
-            )
-            
-            # Step 2: Generate RAG context
-            rag_context = self.create_rag_context(
-                user_query=user_query,
-                search_results=search_results
+                impact_category=impact_category,
+                model=model,
+                response_type=response_type,
             )
-            
-            # Step 3: Get LLM response based on type
-            if response_type.lower() == "structured":
-                llm_response = self.ask_llm(
-                    user_query=user_query,
-                    limit=limit,
-                    score_threshold=score_threshold,
-                    department=department,
-                    impact_category=impact_category,
-                    model=model
-                )
-            elif response_type.lower() == "simple":
-                llm_response = self.ask_llm_simple(
-                    user_query=user_query,
-                    limit=limit,
-                    model=model
+            if response_type.lower() == "stream":
+                # A stream can only be consumed once, so it is never cached
+                llm_response, search_results, rag_context = self._run_rag_pipeline(
+                    **pipeline_args
                 )
             else:
-                raise ValueError(f"Invalid response_type: {response_type}. Must be 'structured' or 'simple'")
+                # Repeated or near-identical questions with the same settings skip the
+                # whole pipeline, including the LLM call
+                scope = ("rag", model, response_type.lower(), limit, score_threshold,
+                         department, impact_category)
+                query_vector, cached = self._cached_lookup(
+                    query_text=user_query.strip(), scope=scope
+                )
+                if cached is None:
+                    llm_response, search_results, rag_context = self._run_rag_pipeline(
+                        **pipeline_args
+                    )
+                    self.query_cache.put(
+                        query_text=user_query.strip(), query_vector=query_vector,
+                        scope=scope, value=(llm_response, search_results, rag_context),
+                    )
+                else:
+                    logger.info(f"RAG result for query '{user_query[:50]}...' served from cache")
+                    llm_response, search_results, rag_context = cached
+                    search_results = list(search_results)
             
             # Step 4: Prepare query info
             query_info = {
@@ -1286,4 +2143,168 @@ Please answer the user's question using the provided projects and following the
             raise InvalidPointsError(
                 issue=f"RAG pipeline failed: {str(e)}",
                 points_count=1
-            ) 
\ No newline at end of file
+            )
+    
+    def _run_rag_pipeline(self, *, user_query: str, limit: int,
+                          score_threshold: Optional[float], department: Optional[str],
+                          impact_category: Optional[str], model: str,
+                          response_type: str) -> tuple[Any, List[models.ScoredPoint], str]:
+        """Run search, context generation and the LLM call for `rag`.
+        
+        Returns:
+            A `(llm_response, search_results, rag_context)` triple.
+        """
+        # Step 1: Perform semantic search
+        search_results = self.search(
+            query=user_query,
+            limit=limit,
+            score_threshold=score_threshold,
+            department=department,
+            impact_category=impact_category
+        )
+        
+        # Step 2: Generate RAG context
+        rag_context = self.create_rag_context(
+            user_query=user_query,
+            search_results=search_results
+        )
+        
+        # Step 3: Get LLM response based on type, reusing the context built above
+        if response_type.lower() == "structured":
+            llm_response = self.ask_llm(
+                user_query=user_query,
+                limit=limit,
+                score_threshold=score_threshold,
+                department=department,
+                impact_category=impact_category,
+                model=model,
+                precomputed_context=rag_context,
+            )
+        elif response_type.lower() == "simple":
+            llm_response = self.ask_llm_simple(
+                user_query=user_query,
+                limit=limit,
+                model=model,
+                precomputed_context=rag_context,
+            )
+        elif response_type.lower() == "stream":
+            llm_response = self.ask_llm_stream(
+                user_query=user_query,
+                limit=limit,
+                model=model,
+                precomputed_context=rag_context,
+            )
+        else:
+            raise ValueError(f"Invalid response_type: {response_type}. "
+                             "Must be 'structured', 'simple' or 'stream'")
+        
+        return llm_response, search_results, rag_context
+    
+    @require(lambda user_query: isinstance(user_query, str) and len(user_query.strip()) > 0,
+             "User query must be a non-empty string",
+             enabled=PROJECTS_RAG_STRICT)
+    @require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer",
+             enabled=PROJECTS_RAG_STRICT)
+    async def arag(self, *, user_query: str, limit: int = 5,
+                   score_threshold: Optional[float] = None,
+                   department: Optional[str] = None,
+                   impact_category: Optional[str] = None,
+                   model: str = "gpt-4o",
+                   response_type: str = "structured") -> Dict[str, Any]:
+        """Async counterpart of `rag` for event-loop servers (FastAPI, NiceGUI).
+        
+        The search and the first-use system-prompt load run concurrently in worker
+        threads, and the LLM is called through `AsyncOpenAI`, so many concurrent
+        questions share one event loop instead of each blocking a thread on network
+        I/O. Results share the semantic cache with `rag`.
+        
+        Args:
+            user_query: Your question about projects.
+            limit: Number of projects to use as context.
+            score_threshold: Minimum relevance score for projects (0.0-1.0).
+            department: Limit context to projects from this department only.
+            impact_category: Limit context to projects from this impact category only.
+            model: OpenAI model for AI responses.
+            response_type: "structured" (ProjectsResponse) or "simple" (plain text).
+        
+        Returns:
+            The same dictionary as `rag`: llm_response, search_results, rag_context
+            and query_info.
+        
+        Raises:
+            InvalidPointsError: When any step fails.
+        """
+        try:
+            kind = response_type.lower()
+            if kind not in ("structured", "simple"):
+                raise ValueError(f"Invalid response_type: {response_type}. "
+                                 "Must be 'structured' or 'simple'")
+            
+            scope = ("rag", model, kind, limit, score_threshold, department, impact_category)
+            query_vector, cached = await asyncio.to_thread(
+                self._cached_lookup, query_text=user_query.strip(), scope=scope
+            )
+            if cached is not None:
+                logger.info(f"RAG result for query '{user_query[:50]}...' served from cache")
+                llm_response, search_results, rag_context = cached
+                search_results = list(search_results)
+            else:
+                search_results, system_prompt = await asyncio.gather(
+                    self.asearch(
+                        query=user_query,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        department=department,
+                        impact_category=impact_category,
+                    ),
+                    asyncio.to_thread(self._get_system_prompt),
+                )
+                rag_context = self.create_rag_context(user_query, search_results, system_prompt)
+                messages = [{"role": "user", "content": rag_context}]
+                
+                if kind == "structured":
+                    llm_response = await self._async_instructor_client.chat.completions.create(
+                        model=model,
+                        prompt_cache_key=self.PROMPT_CACHE_KEY,
+                        response_model=self.ProjectsResponse,
+                        messages=messages,
+                    )
+                else:
+                    completion = await self._async_openai_client.chat.completions.create(
+                        model=model,
+                        prompt_cache_key=self.PROMPT_CACHE_KEY,
+                        messages=messages,
+                        max_tokens=500,
+                        temperature=0.7,
+                    )
+                    llm_response = completion.choices[0].message.content
+                
+                self.query_cache.put(
+                    query_text=user_query.strip(), query_vector=query_vector,
+                    scope=scope, value=(llm_response, search_results, rag_context),
+                )
+            
+            logger.info(f"Async RAG pipeline executed for query: '{user_query[:50]}...' "
+                       f"with {len(search_results)} results and {response_type} response")
+            return {
+                "llm_response": llm_response,
+                "search_results": search_results,
+                "rag_context": rag_context,
+                "query_info": {
+                    "user_query": user_query,
+                    "limit": limit,
+                    "score_threshold": score_threshold,
+                    "department_filter": department,
+                    "impact_category_filter": impact_category,
+                    "model": model,
+                    "response_type": response_type,
+                    "results_count": len(search_results),
+                },
+            }
+            
+        except Exception as e:
+            logger.error(f"Async RAG pipeline failed: {str(e)}")
+            raise InvalidPointsError(
+                issue=f"RAG pipeline failed: {str(e)}",
+                points_count=1
+            )
@@ -0,0 +1,89 @@
+# =============================================================================
+#  Filename: _shared.py
+#
+#  Short Description: Process-wide embedder, vector DB and helpers shared by the example scripts.
+#
+#  Creation date: 2025-09-26
+#  Author: Asif Qamar
+# =============================================================================
+
+"""
+Shared components for the RAG examples.
+
+Loading the embedding model dominates an example's start-up time. The factories
+below build each component once per process, so a demo that runs several steps
+(e.g. `main()` followed by `demonstrate_rag_context_structure()`) pays that cost
+only on the first call. The module also holds the RAG-context section printer used
+by the demos that show how a context is structured.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterator
+
+from loguru import logger
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from metamorphosis.rag.vectordb.embedded_vectordb import EmbeddedVectorDB
+from metamorphosis.rag.vectordb.embedder import (
+    DEFAULT_ONNX_MODEL_DIR,
+    OnnxTextEmbedder,
+    SimpleTextEmbedder,
+)
+
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# A RAG context section: the text before the first "##" heading, or a heading and its body.
+_CONTEXT_SECTION_PATTERN = re.compile(r"(?:^##)?(.+?)(?=^##|\Z)", re.MULTILINE | re.DOTALL)
+
+
+def get_embedder(model_name: str = DEFAULT_EMBEDDING_MODEL) -> SimpleTextEmbedder:
+    """Return the process-wide text embedder for `model_name`, loading it on first use.
+
+    For the default model, the INT8 ONNX export is used when it has been created with
+    `export_onnx_embedder.py`. A failed load is not cached, so callers may retry.
+    """
+    # Always pass the name positionally so `get_embedder()` and
+    # `get_embedder(DEFAULT_EMBEDDING_MODEL)` share one cache entry
+    return _load_embedder(model_name)
+
+
+@lru_cache(maxsize=None)
+def _load_embedder(model_name: str) -> SimpleTextEmbedder:
+    if model_name == DEFAULT_EMBEDDING_MODEL and DEFAULT_ONNX_MODEL_DIR.is_dir():
+        return OnnxTextEmbedder(model_dir=DEFAULT_ONNX_MODEL_DIR)
+    return SimpleTextEmbedder(model_name=model_name)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=4),
+    before_sleep=lambda state: logger.warning(
+        f"Loading the embedder failed (attempt {state.attempt_number}); retrying"
+    ),
+    reraise=True,
+)
+def get_embedder_with_retry(model_name: str = DEFAULT_EMBEDDING_MODEL) -> SimpleTextEmbedder:
+    """`get_embedder`, retried with exponential backoff on transient failures."""
+    return get_embedder(model_name)
+
+
+def get_vector_db() -> EmbeddedVectorDB:
+    """Return the process-wide vector database client."""
+    return EmbeddedVectorDB.shared()
+
+
+def iter_context_sections(rag_context: str) -> Iterator[str]:
+    """Yield the non-empty sections of a RAG context: the preamble, then one per "##" heading."""
+    for match in _CONTEXT_SECTION_PATTERN.finditer(rag_context):
+        section = match.group(1).strip()
+        if section:
+            yield section
+
+
+def print_context_sections(rag_context: str) -> None:
+    """Print each section of a RAG context under a numbered separator."""
+    for i, section in enumerate(iter_context_sections(rag_context), 1):
+        print(f"\n--- Section {i} ---")
+        print(section)
@@ -10,18 +10,14 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from rich.table import Table
 from rich.console import Console
 
-# Make src importable when running as a script
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from metamorphosis.mcp.text_modifiers import TextModifiers
 from metamorphosis.rag.corpus.achievement_evaluator import AchievementEvaluator
-from metamorphosis.rag.vectordb.embedded_vectordb import EmbeddedVectorDB
-from metamorphosis.rag.vectordb.embedder import SimpleTextEmbedder
+from metamorphosis.rag.examples._shared import get_embedder, get_vector_db
 from metamorphosis.rag.corpus.projects_rag import ProjectsRag
 
 
@@ -40,8 +36,8 @@ def main() -> bool:
     achievements = tm.extract_achievements(text=text)
 
     # Ensure the collection is up-to-date with names in payload
-    vector_db = EmbeddedVectorDB()
-    embedder = SimpleTextEmbedder()
+    vector_db = get_vector_db()
+    embedder = get_embedder()
     projects = ProjectsRag(vector_db=vector_db, embedder=embedder)
     portfolio_path = repo_root / "project_documents" / "project_portfolio.jsonl"
     try:
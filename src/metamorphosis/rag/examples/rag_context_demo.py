@@ -20,15 +20,15 @@ The example uses the query "a friendship with projects" to show the complete wor
 """
 
 import sys
-from pathlib import Path
-import time
-
-# Add the src directory to the path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from concurrent.futures import ThreadPoolExecutor
 
 from metamorphosis.rag.corpus.projects_rag import ProjectsRag
-from metamorphosis.rag.vectordb.embedded_vectordb import EmbeddedVectorDB
-from metamorphosis.rag.vectordb.embedder import SimpleTextEmbedder
+from metamorphosis.rag.examples._shared import (
+    get_embedder,
+    get_embedder_with_retry,
+    get_vector_db,
+    print_context_sections,
+)
 from loguru import logger
 
 
@@ -44,37 +44,19 @@ def main():
     # Initialize components with retry logic
     print("\n🔍 Initializing vector DB and embedder...")
     try:
-        vector_db = EmbeddedVectorDB()
+        vector_db = get_vector_db()
         print("   ✅ Vector database connected")
     except Exception as e:
         print(f"   ❌ Vector database failed: {str(e)}")
         return None
     
-    # Try to initialize embedder with retry logic
-    embedder = None
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            print(f"   🔄 Loading embedder (attempt {attempt + 1}/{max_retries})...")
-            embedder = SimpleTextEmbedder(model_name="sentence-transformers/all-MiniLM-L6-v2")
-            print("   ✅ Embedder loaded successfully")
-            break
-        except Exception as e:
-            print(f"   ⚠️  Attempt {attempt + 1} failed: {str(e)}")
-            if attempt < max_retries - 1:
-                print("   🔄 Retrying in 5 seconds...")
-                time.sleep(5)
-            else:
-                print("   ❌ All attempts failed. Trying with default model...")
-                try:
-                    embedder = SimpleTextEmbedder()  # Use default model
-                    print("   ✅ Default embedder loaded successfully")
-                except Exception as e2:
-                    print(f"   ❌ Default embedder also failed: {str(e2)}")
-                    return None
-    
-    if embedder is None:
-        print("   ❌ Could not initialize any embedder")
+    # Transient download failures are retried with exponential backoff
+    try:
+        print("   🔄 Loading embedder...")
+        embedder = get_embedder_with_retry()
+        print("   ✅ Embedder loaded successfully")
+    except Exception as e:
+        print(f"   ❌ Could not initialize the embedder: {str(e)}")
         return None
     
     try:
@@ -84,10 +66,19 @@ def main():
         print(f"   ❌ ProjectsRag class initialization failed: {str(e)}")
         return None
     
+    # Every search of the demo (the table below and the three LLM calls) runs in one
+    # batched embedding pass and one Qdrant request; the LLM calls reuse the cached hits
+    filtered_query = "What do literary authors specifically say about project collaboration?"
+    
     # Perform real search
     print("\n🔎 Performing real search in the projects collection...")
     try:
-        search_results = projects.search(query=user_query, limit=5)
+        search_results, *_ = projects.search_batch([
+            {"query": user_query, "limit": 5},
+            {"query": user_query, "limit": 3},
+            {"query": filtered_query, "limit": 3,
+             "impact_category": "Famous Literary Passages"},
+        ])
         print(f"   ✅ Found {len(search_results)} results")
     except Exception as e:
         print(f"   ❌ Search failed: {str(e)}")
@@ -120,37 +111,47 @@ def main():
     print(f"   • Total words: {len(rag_context.split())}")
     print(f"   • Number of quotes: {len(search_results)}")
     if search_results:
-        print(f"   • Average quote length: {sum(len(r.payload.get('content', '')) for r in search_results) / len(search_results):.0f} characters")
+        contents = [(r.payload or {}).get("content", "") for r in search_results]
+        print(f"   • Average quote length: {sum(map(len, contents)) / len(contents):.0f} characters")
     
     # LLM Integration Demo
     print("\n" + "🤖" * 20)
     print("🤖 LLM INTEGRATION DEMO")
     print("🤖" * 20)
     
-    # Demo 1: Simple LLM Response
-    print("\n1️⃣ Simple LLM Response (GPT-4o):")
-    print("-" * 50)
-    try:
-        simple_answer = projects.ask_llm_simple(
-            user_query=user_query,
+    # The two structured calls run in the background while the simple answer streams
+    # in, so their round-trips overlap with it; they are rendered once it has finished
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        structured_future = executor.submit(
+            projects.ask_llm, user_query=user_query, limit=5, model="gpt-4o"
+        )
+        filtered_future = executor.submit(
+            projects.ask_llm,
+            user_query=filtered_query,
             limit=3,
-            model="gpt-4o"
+            impact_category="Famous Literary Passages",
+            model="gpt-4o",
         )
-        print("✅ Simple LLM Response:")
-        print(simple_answer)
-    except Exception as e:
-        print(f"❌ Simple LLM failed: {str(e)}")
-        print("   (This might be due to missing OpenAI API key or network issues)")
+        
+        # Demo 1: Simple LLM Response, printed token by token as it is generated
+        print("\n1️⃣ Simple LLM Response (GPT-4o):")
+        print("-" * 50)
+        try:
+            print("✅ Simple LLM Response:")
+            for fragment in projects.ask_llm_stream(
+                user_query=user_query, limit=3, model="gpt-4o"
+            ):
+                print(fragment, end="", flush=True)
+            print()
+        except Exception as e:
+            print(f"❌ Simple LLM failed: {str(e)}")
+            print("   (This might be due to missing OpenAI API key or network issues)")
     
     # Demo 2: Structured LLM Response
     print("\n2️⃣ Structured LLM Response (GPT-4o with Instructor):")
     print("-" * 50)
     try:
-        structured_response = projects.ask_llm(
-            user_query=user_query,
-            limit=5,
-            model="gpt-4o"
-        )
+        structured_response = structured_future.result()
         
         print("✅ Structured LLM Response Generated!")
         print("   Displaying with rich formatting...")
@@ -166,15 +167,10 @@ def main():
     print("\n3️⃣ Filtered LLM Query (Famous Literary Passages only):")
     print("-" * 50)
     try:
-        filtered_response = projects.ask_llm(
-            user_query="What do literary authors specifically say about project collaboration?",
-            limit=3,
-            impact_category="Famous Literary Passages",
-            model="gpt-4o"
-        )
+        filtered_response = filtered_future.result()
         
         print("✅ Filtered LLM Response Generated!")
-        projects.display_llm_response(filtered_response, "What do literary authors specifically say about project collaboration?")
+        projects.display_llm_response(filtered_response, filtered_query)
         
     except Exception as e:
         print(f"❌ Filtered LLM failed: {str(e)}")
@@ -211,8 +207,8 @@ def demonstrate_rag_context_structure():
     print("=" * 50)
     
     # Initialize components
-    vector_db = EmbeddedVectorDB()
-    embedder = SimpleTextEmbedder()
+    vector_db = get_vector_db()
+    embedder = get_embedder()
     projects = ProjectsRag(vector_db=vector_db, embedder=embedder)
     
     # Create a simple example
@@ -228,12 +224,8 @@ def demonstrate_rag_context_structure():
     print("\n📋 Complete RAG Context Structure:")
     rag_context = projects.create_rag_context(user_query=user_query, search_results=search_results)
     
-    # Split and display sections
-    sections = rag_context.split("##")
-    for i, section in enumerate(sections, 1):
-        if section.strip():
-            print(f"\n--- Section {i} ---")
-            print(section.strip())
+    # Display the sections (the preamble, then one per "##" heading)
+    print_context_sections(rag_context)
 
 
 if __name__ == "__main__":
@@ -15,15 +15,9 @@ the entire RAG pipeline: search + LLM response in a single method call.
 """
 
 import sys
-from pathlib import Path
-import time
-
-# Add the src directory to the path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from metamorphosis.rag.corpus.projects_rag import ProjectsRag
-from metamorphosis.rag.vectordb.embedded_vectordb import EmbeddedVectorDB
-from metamorphosis.rag.vectordb.embedder import SimpleTextEmbedder
+from metamorphosis.rag.examples._shared import get_embedder_with_retry, get_vector_db
 from loguru import logger
 
 
@@ -42,37 +36,19 @@ def main():
     # Initialize components with retry logic
     print("\n🔍 Initializing vector DB and embedder...")
     try:
-        vector_db = EmbeddedVectorDB()
+        vector_db = get_vector_db()
         print("   ✅ Vector database connected")
     except Exception as e:
         print(f"   ❌ Vector database failed: {str(e)}")
         return None
     
-    # Try to initialize embedder with retry logic
-    embedder = None
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            print(f"   🔄 Loading embedder (attempt {attempt + 1}/{max_retries})...")
-            embedder = SimpleTextEmbedder(model_name="sentence-transformers/all-MiniLM-L6-v2")
-            print("   ✅ Embedder loaded successfully")
-            break
-        except Exception as e:
-            print(f"   ⚠️  Attempt {attempt + 1} failed: {str(e)}")
-            if attempt < max_retries - 1:
-                print("   🔄 Retrying in 5 seconds...")
-                time.sleep(5)
-            else:
-                print("   ❌ All attempts failed. Trying with default model...")
-                try:
-                    embedder = SimpleTextEmbedder()  # Use default model
-                    print("   ✅ Default embedder loaded successfully")
-                except Exception as e2:
-                    print(f"   ❌ Default embedder also failed: {str(e2)}")
-                    return None
-    
-    if embedder is None:
-        print("   ❌ Could not initialize any embedder")
+    # Transient download failures are retried with exponential backoff
+    try:
+        print("   🔄 Loading embedder...")
+        embedder = get_embedder_with_retry()
+        print("   ✅ Embedder loaded successfully")
+    except Exception as e:
+        print(f"   ❌ Could not initialize the embedder: {str(e)}")
         return None
     
     try:
@@ -82,6 +58,10 @@ def main():
         print(f"   ❌ ProjectsRag class initialization failed: {str(e)}")
         return None
     
+    # Embed every query of the demo in one batched forward pass up front
+    components_query = "feature engineering standards"
+    projects.embed_queries(queries + [components_query])
+    
     # Demo 1: Structured RAG response
     print("\n" + "="*60)
     print("1️⃣ STRUCTURED RAG RESPONSE")
@@ -184,7 +164,7 @@ def main():
     print("4️⃣ ACCESSING RAG COMPONENTS")
     print("="*60)
     
-    query = "feature engineering standards"
+    query = components_query
     print(f"\n📝 Query: '{query}'")
     
     try:
@@ -19,14 +19,13 @@ ProjectsRag auto-bootstraps by loading and indexing
 """
 
 import sys
-from pathlib import Path
-
-# Add the src directory to the path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from metamorphosis.rag.corpus.projects_rag import ProjectsRag
-from metamorphosis.rag.vectordb.embedded_vectordb import EmbeddedVectorDB
-from metamorphosis.rag.vectordb.embedder import SimpleTextEmbedder
+from metamorphosis.rag.examples._shared import (
+    get_embedder,
+    get_vector_db,
+    print_context_sections,
+)
 from loguru import logger
 
 
@@ -37,14 +36,18 @@ def main():
 
     # Initialize components (auto-bootstrap will index default portfolio if empty)
     print("\n1️⃣ Initializing...")
-    vector_db = EmbeddedVectorDB()
-    embedder = SimpleTextEmbedder(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    vector_db = get_vector_db()
+    embedder = get_embedder()
     projects = ProjectsRag(vector_db=vector_db, embedder=embedder)
     print("   ✅ Ready")
 
+    # Embed every query of the demo in one batched forward pass up front
+    topic_query = "feature store real-time offers"
+    dept_query = "data quality"
+    projects.embed_queries([topic_query, dept_query])
+
     # Example 1 — Topic search (feature store rollout)
     print("\n2️⃣ Topic search: 'feature store real-time offers'")
-    topic_query = "feature store real-time offers"
     results_topic = projects.search(query=topic_query, limit=5)
     projects.display_search_results(
         results=results_topic,
@@ -54,7 +57,6 @@ def main():
 
     # Example 2 — Department-filtered search (Data Platform)
     print("\n3️⃣ Department-filtered search: 'data quality' in 'Data Platform'")
-    dept_query = "data quality"
     results_dept = projects.search(
         query=dept_query,
         limit=5,
@@ -77,8 +79,8 @@ def demonstrate_rag_context_structure():
     print("=" * 50)
     
     # Initialize components
-    vector_db = EmbeddedVectorDB()
-    embedder = SimpleTextEmbedder()
+    vector_db = get_vector_db()
+    embedder = get_embedder()
     projects = ProjectsRag(vector_db=vector_db, embedder=embedder)
     
     # Create a simple example
@@ -94,12 +96,8 @@ def demonstrate_rag_context_structure():
     print("\n📋 Complete RAG Context Structure:")
     rag_context = projects.create_rag_context(user_query, search_results)
     
-    # Split and display sections
-    sections = rag_context.split("##")
-    for i, section in enumerate(sections, 1):
-        if section.strip():
-            print(f"\n--- Section {i} ---")
-            print(section.strip())
+    # Display the sections (the preamble, then one per "##" heading)
+    print_context_sections(rag_context)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+# =============================================================================
+#  Filename: reranker.py
+#
+#  Short Description: Cross-encoder reranking of vector-search candidates.
+#
+#  Creation date: 2025-09-24
+#  Author: Asif Qamar
+# =============================================================================
+
+from typing import Any, List
+
+import numpy as np
+import torch
+from icontract import require
+from loguru import logger
+from qdrant_client import models
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from metamorphosis.rag.exceptions import InvalidPointsError
+
+
+#============================================================================================
+#  Class: CrossEncoderReranker
+#============================================================================================
+class CrossEncoderReranker:
+    """Reorder search hits by a cross-encoder's relevance score.
+
+    A bi-encoder (the embedder) scores query and passage independently, which is fast
+    enough for a whole collection; a cross-encoder reads both together and ranks a
+    short candidate list more accurately. Hits keep their original vector `score`;
+    only their order changes.
+    """
+
+    # ----------------------------------------------------------------------------------------
+    #  Constructor
+    # ----------------------------------------------------------------------------------------
+    @require(lambda model_name: isinstance(model_name, str) and len(model_name.strip()) > 0,
+             "Model name must be a non-empty string")
+    @require(lambda batch_size: isinstance(batch_size, int) and batch_size > 0,
+             "Batch size must be a positive integer")
+    def __init__(self, *, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+                 batch_size: int = 32) -> None:
+        """Load the cross-encoder model.
+
+        Args:
+            model_name: HuggingFace identifier of a sequence-classification cross-encoder.
+            batch_size: Number of (query, passage) pairs scored per forward pass.
+
+        Raises:
+            InvalidPointsError: If the model cannot be loaded.
+        """
+        try:
+            self.model_name = model_name
+            self.batch_size = batch_size
+            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+            self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            self.model.eval()
+            logger.info(f"Initialized CrossEncoderReranker with model '{model_name}'")
+        except Exception as e:
+            raise InvalidPointsError(
+                issue=f"Failed to initialize cross-encoder '{model_name}': {str(e)}"
+            )
+
+    # ----------------------------------------------------------------------------------------
+    #  Rerank
+    # ----------------------------------------------------------------------------------------
+    @require(lambda query: isinstance(query, str) and len(query.strip()) > 0,
+             "Query must be a non-empty string")
+    @require(lambda limit: isinstance(limit, int) and limit > 0,
+             "Limit must be a positive integer")
+    def rerank(self, *, query: str, hits: List[models.ScoredPoint],
+               limit: int) -> List[models.ScoredPoint]:
+        """Return the `limit` hits the cross-encoder judges most relevant to `query`.
+
+        Args:
+            query: The search query.
+            hits: Candidate hits; the passage text is read from `payload["content"]`.
+            limit: Maximum number of hits to return.
+
+        Returns:
+            The best hits, most relevant first.
+        """
+        if not hits:
+            return []
+
+        passages = [(hit.payload or {}).get("content", "") for hit in hits]
+        scores: List[float] = []
+        with torch.no_grad():
+            for start in range(0, len(passages), self.batch_size):
+                batch = passages[start:start + self.batch_size]
+                inputs = self.tokenizer([query] * len(batch), batch, padding=True,
+                                        truncation=True, max_length=512, return_tensors="pt")
+                scores.extend(self.model(**inputs).logits[:, 0].tolist())
+
+        order = sorted(range(len(hits)), key=scores.__getitem__, reverse=True)
+        logger.debug(f"Reranked {len(hits)} candidates down to {min(limit, len(hits))}")
+        return [hits[i] for i in order[:limit]]
+
+
+# ----------------------------------------------------------------------------------------
+#  Maximal Marginal Relevance
+# ----------------------------------------------------------------------------------------
+@require(lambda limit: isinstance(limit, int) and limit > 0, "Limit must be a positive integer")
+@require(lambda lambda_mult: 0.0 <= lambda_mult <= 1.0, "Lambda must be in [0, 1]")
+def mmr_select(*, query_vector: Any, candidate_vectors: Any, limit: int,
+               lambda_mult: float = 0.5) -> List[int]:
+    """Pick up to `limit` candidates that are relevant to the query but not to each other.
+
+    Each step takes the candidate maximizing
+    ``lambda_mult * sim(query, c) - (1 - lambda_mult) * max(sim(c, already selected))``.
+    All cosine similarities come from two matrix products (``C @ q`` and ``C @ C.T``);
+    the selection loop then only updates a running maximum over the small K x K matrix.
+
+    Args:
+        query_vector: Query embedding, shape (D,).
+        candidate_vectors: Candidate embeddings, shape (K, D).
+        limit: Number of candidates to select.
+        lambda_mult: 1.0 ranks purely by relevance, 0.0 purely by diversity.
+
+    Returns:
+        Indices into `candidate_vectors`, in selection order.
+    """
+    candidates = np.array(candidate_vectors, dtype=np.float32)
+    if candidates.size == 0:
+        return []
+    candidates /= np.linalg.norm(candidates, axis=1, keepdims=True).clip(min=1e-12)
+    query = np.asarray(query_vector, dtype=np.float32).ravel()
+    query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+    relevance = candidates @ query
+    similarity = candidates @ candidates.T
+
+    selected = [int(np.argmax(relevance))]
+    closest_selected = similarity[selected[0]].copy()
+    for _ in range(min(limit, len(candidates)) - 1):
+        scores = lambda_mult * relevance - (1.0 - lambda_mult) * closest_selected
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        np.maximum(closest_selected, similarity[best], out=closest_selected)
+    return selected
@@ -0,0 +1,209 @@
+# =============================================================================
+#  Filename: semantic_cache.py
+#
+#  Short Description: In-process semantic cache keyed by normalized query embeddings.
+#
+#  Creation date: 2025-09-18
+#  Author: Asif Qamar
+# =============================================================================
+
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+from icontract import require
+from loguru import logger
+
+
+#============================================================================================
+#  Class: SemanticQueryCache
+#============================================================================================
+class SemanticQueryCache:
+    """Cache results for queries that are identical or semantically near-identical.
+
+    Each entry is stored under a *scope* — a hashable tuple of everything besides the
+    query text that determines the result (filters, limits, model, ...). A lookup first
+    tries an exact match on the normalized query text, then compares the query
+    embedding against the cached embeddings of the same scope with a single
+    matrix-vector product, returning the cached value when cosine similarity reaches
+    `threshold`.
+
+    Entries expire after `ttl_seconds` and the least recently used entry is evicted
+    once `max_entries` is reached. All methods are thread-safe.
+    """
+
+    # ----------------------------------------------------------------------------------------
+    #  Constructor
+    # ----------------------------------------------------------------------------------------
+    @require(lambda threshold: 0.0 < threshold <= 1.0, "Threshold must be in (0, 1]")
+    @require(lambda max_entries: isinstance(max_entries, int) and max_entries > 0,
+             "Max entries must be a positive integer")
+    @require(lambda ttl_seconds: ttl_seconds > 0, "TTL must be positive")
+    def __init__(self, *, threshold: float = 0.97, max_entries: int = 4096,
+                 ttl_seconds: float = 7 * 24 * 3600) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a semantic hit.
+            max_entries: Maximum number of cached entries before LRU eviction.
+            ttl_seconds: Age after which an entry is no longer served.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._reset()
+
+    # ----------------------------------------------------------------------------------------
+    #  Public API
+    # ----------------------------------------------------------------------------------------
+    def clear(self) -> None:
+        """Drop every cached entry (e.g. after the underlying collection changes)."""
+        with self._lock:
+            self._reset()
+
+    def get_exact(self, *, query_text: str, scope: Hashable) -> Optional[Any]:
+        """Return the cached value for this exact (normalized) query text, if any.
+
+        This check needs no embedding, so callers should try it first.
+        """
+        with self._lock:
+            slot = self._exact.get((scope, self._normalize_text(query_text)))
+            if slot is None or not self._is_fresh(slot):
+                return None
+            return self._touch(slot)
+
+    def get(self, *, query_vector: np.ndarray, scope: Hashable) -> Optional[Any]:
+        """Return the cached value of the most similar query in `scope`, if similar enough.
+
+        Args:
+            query_vector: Embedding of the incoming query.
+            scope: Everything other than the query text that determines the result.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        query = self._normalize_vector(query_vector)
+        with self._lock:
+            used = len(self._scopes)
+            if used == 0:
+                self.misses += 1
+                return None
+
+            now = time.monotonic()
+            mask = self._valid[:used] & (now - self._created[:used] < self.ttl_seconds)
+            mask &= np.fromiter((s == scope for s in self._scopes), dtype=bool, count=used)
+            if not mask.any():
+                self.misses += 1
+                return None
+
+            scores = self._vectors[:used] @ query
+            scores[~mask] = -np.inf
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                self.misses += 1
+                return None
+            return self._touch(best)
+
+    def put(self, *, query_text: str, query_vector: np.ndarray, scope: Hashable,
+            value: Any) -> None:
+        """Store `value` as the result for this query in `scope`."""
+        vector = self._normalize_vector(query_vector)
+        text = self._normalize_text(query_text)
+        with self._lock:
+            existing = self._exact.get((scope, text))
+            slot = existing if existing is not None else self._allocate_slot(vector.shape[0])
+            now = time.monotonic()
+            self._vectors[slot] = vector
+            self._valid[slot] = True
+            self._created[slot] = now
+            self._last_used[slot] = now
+            self._scopes[slot] = scope
+            self._texts[slot] = text
+            self._values[slot] = value
+            self._exact[(scope, text)] = slot
+
+    def __len__(self) -> int:
+        return int(self._valid.sum())
+
+    # ----------------------------------------------------------------------------------------
+    #  Helper Methods (Private)
+    # ----------------------------------------------------------------------------------------
+    def _reset(self) -> None:
+        # Slot-based storage: row `i` of `_vectors` belongs to slot `i`. Arrays are
+        # allocated with spare capacity; lists hold one item per slot handed out so far.
+        # Freed slots are reused, so storage never exceeds `max_entries` rows.
+        self._vectors: Optional[np.ndarray] = None
+        self._valid = np.zeros(0, dtype=bool)
+        self._created = np.zeros(0, dtype=np.float64)
+        self._last_used = np.zeros(0, dtype=np.float64)
+        self._scopes: List[Optional[Hashable]] = []
+        self._texts: List[Optional[str]] = []
+        self._values: List[Any] = []
+        self._exact: Dict[Tuple[Hashable, str], int] = {}
+        self._free: List[int] = []
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def _normalize_vector(vector: Any) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm > 0 else array
+
+    def _is_fresh(self, slot: int) -> bool:
+        return time.monotonic() - self._created[slot] < self.ttl_seconds
+
+    def _touch(self, slot: int) -> Any:
+        self._last_used[slot] = time.monotonic()
+        self.hits += 1
+        return self._values[slot]
+
+    def _allocate_slot(self, dimension: int) -> int:
+        """Return a free slot, growing storage geometrically or evicting the LRU entry."""
+        if self._free:
+            return self._free.pop()
+
+        size = len(self._scopes)
+        if size < self.max_entries:
+            capacity = 0 if self._vectors is None else self._vectors.shape[0]
+            if size == capacity:
+                self._grow(dimension, min(self.max_entries, max(16, capacity * 2)))
+            self._scopes.append(None)
+            self._texts.append(None)
+            self._values.append(None)
+            return size
+
+        # Full: evict expired entries first, otherwise the least recently used one.
+        expired = np.flatnonzero(time.monotonic() - self._created[:size] >= self.ttl_seconds)
+        victim = int(expired[0]) if expired.size else int(np.argmin(self._last_used[:size]))
+        self._release(victim)
+        logger.debug(f"Semantic cache evicted slot {victim}")
+        return self._free.pop()
+
+    def _grow(self, dimension: int, capacity: int) -> None:
+        vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        valid = np.zeros(capacity, dtype=bool)
+        created = np.zeros(capacity, dtype=np.float64)
+        last_used = np.zeros(capacity, dtype=np.float64)
+        if self._vectors is not None:
+            used = self._vectors.shape[0]
+            vectors[:used] = self._vectors
+            valid[:used] = self._valid
+            created[:used] = self._created
+            last_used[:used] = self._last_used
+        self._vectors, self._valid = vectors, valid
+        self._created, self._last_used = created, last_used
+
+    def _release(self, slot: int) -> None:
+        self._exact.pop((self._scopes[slot], self._texts[slot]), None)
+        self._valid[slot] = False
+        self._scopes[slot] = None
+        self._texts[slot] = None
+        self._values[slot] = None
+        self._free.append(slot)
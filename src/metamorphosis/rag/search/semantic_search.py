@@ -15,6 +15,7 @@ from loguru import logger
 
 from metamorphosis.rag.vectordb.embedded_vectordb import EmbeddedVectorDB
 from metamorphosis.rag.vectordb.embedder import Embedder, create_embedder
+from metamorphosis.rag.vectordb.embedding_cache import EmbeddingDiskCache
 from metamorphosis.rag.exceptions import (
     CollectionParameterMismatchError,
     InvalidPointsError,
@@ -329,13 +330,15 @@ class SemanticSearch:
              "Limit must be a positive integer")
     @ensure(lambda result: isinstance(result, list), "Must return a list")
     def search_with_text(self, *, query_text: str, limit: int = 10,
-                        score_threshold: Optional[float] = None) -> List[models.ScoredPoint]:
+                        score_threshold: Optional[float] = None,
+                        query_filter: Optional[models.Filter] = None) -> List[models.ScoredPoint]:
         """Search for similar content using text query.
         
         Args:
             query_text: Text query to search for.
             limit: Maximum number of results to return.
             score_threshold: Minimum similarity score threshold.
+            query_filter: Optional payload filter applied by the vector database.
             
         Returns:
             List of scored points sorted by similarity.
@@ -357,7 +360,8 @@ class SemanticSearch:
                 collection_name=self.collection_name,
                 query_vector=query_vector,
                 limit=limit,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                query_filter=query_filter
             )
             
             logger.info(f"Text search for '{query_text[:50]}...' returned {len(results)} results")
@@ -369,6 +373,109 @@ class SemanticSearch:
                 points_count=1
             )
 
+    # ----------------------------------------------------------------------------------------
+    #  Search with Vector
+    # ----------------------------------------------------------------------------------------
+    @require(lambda limit: isinstance(limit, int) and limit > 0,
+             "Limit must be a positive integer")
+    @ensure(lambda result: isinstance(result, list), "Must return a list")
+    def search_with_vector(self, *, query_vector: Any, limit: int = 10,
+                           score_threshold: Optional[float] = None,
+                           query_filter: Optional[models.Filter] = None,
+                           search_params: Optional[models.SearchParams] = None,
+                           with_vectors: bool = False) -> List[models.ScoredPoint]:
+        """Search for similar content using an already computed query embedding.
+        
+        Args:
+            query_vector: Query embedding (list or numpy array) from this embedder.
+            limit: Maximum number of results to return.
+            score_threshold: Minimum similarity score threshold.
+            query_filter: Optional payload filter applied by the vector database.
+            search_params: Optional search parameters (e.g. quantization rescoring).
+            with_vectors: Also return each hit's stored vector.
+            
+        Returns:
+            List of scored points sorted by similarity.
+            
+        Raises:
+            InvalidPointsError: If the query cannot be processed.
+        """
+        try:
+            # Convert numpy array to list if needed
+            if hasattr(query_vector, 'tolist'):
+                query_vector = query_vector.tolist()
+            
+            results = self.vector_db.search_points(
+                collection_name=self.collection_name,
+                query_vector=query_vector,
+                limit=limit,
+                score_threshold=score_threshold,
+                query_filter=query_filter,
+                search_params=search_params,
+                with_vectors=with_vectors,
+            )
+            
+            logger.info(f"Vector search returned {len(results)} results")
+            return results
+            
+        except Exception as e:
+            raise InvalidPointsError(
+                issue=f"Failed to search with query vector: {str(e)}",
+                points_count=1
+            )
+
+    # ----------------------------------------------------------------------------------------
+    #  Search with Texts (batched)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda query_texts: isinstance(query_texts, list) and len(query_texts) > 0,
+             "Query texts must be a non-empty list")
+    @require(lambda query_texts: all(isinstance(q, str) and len(q.strip()) > 0 for q in query_texts),
+             "All query texts must be non-empty strings")
+    @require(lambda limit: isinstance(limit, int) and limit > 0,
+             "Limit must be a positive integer")
+    @ensure(lambda result, query_texts: len(result) == len(query_texts),
+            "Must return one result list per query")
+    def search_with_texts(self, *, query_texts: List[str], limit: int = 10,
+                          score_threshold: Optional[float] = None) -> List[List[models.ScoredPoint]]:
+        """Search for similar content for several text queries at once.
+        
+        All queries are embedded in one batch and sent to the vector database as a
+        single batched search.
+        
+        Args:
+            query_texts: Text queries to search for.
+            limit: Maximum number of results to return per query.
+            score_threshold: Minimum similarity score threshold.
+            
+        Returns:
+            One list of scored points per query, in input order.
+            
+        Raises:
+            InvalidPointsError: If the queries cannot be processed.
+        """
+        try:
+            query_vectors = [
+                vector.tolist() if hasattr(vector, 'tolist') else vector
+                for vector in self.embedder.embed_texts(texts=query_texts)
+            ]
+            
+            results = self.vector_db.search_points_batch(
+                collection_name=self.collection_name,
+                query_vectors=query_vectors,
+                limit=limit,
+                score_threshold=score_threshold
+            )
+            
+            logger.info(f"Batched text search for {len(query_texts)} queries returned "
+                       f"{sum(len(r) for r in results)} results")
+            return results
+            
+        except Exception as e:
+            raise InvalidPointsError(
+                issue=f"Failed to search with text queries: {str(e)}",
+                points_count=len(query_texts)
+            )
+
     # ----------------------------------------------------------------------------------------
     #  Search with Image
     # ----------------------------------------------------------------------------------------
@@ -425,15 +532,28 @@ class SemanticSearch:
              "Texts must be a non-empty list")
     @require(lambda texts: all(isinstance(text, str) and len(text.strip()) > 0 for text in texts),
              "All texts must be non-empty strings")
+    @require(lambda batch_size: isinstance(batch_size, int) and batch_size > 0,
+             "Batch size must be a positive integer")
     def index_all_text(self, *, texts: List[str], 
                       metadata_list: Optional[List[Dict[str, Any]]] = None,
-                      point_ids: Optional[List[str]] = None) -> List[str]:
+                      point_ids: Optional[List[str]] = None,
+                      batch_size: int = 128,
+                      bulk: bool = False,
+                      embedding_cache: Optional[EmbeddingDiskCache] = None) -> List[str]:
         """Index multiple text documents into the collection.
         
+        Texts are embedded in batches of `batch_size` per forward pass rather than
+        one at a time.
+        
         Args:
             texts: List of text content to index.
             metadata_list: Optional list of metadata for each text.
             point_ids: Optional list of custom IDs for the points.
+            batch_size: Number of texts embedded per forward pass.
+            bulk: Upload through `EmbeddedVectorDB.bulk_upload_points`, which defers
+                HNSW indexing until all points are stored. Use for large initial loads.
+            embedding_cache: Optional on-disk cache; only texts missing from it are
+                run through the embedding model.
             
         Returns:
             List of IDs of the indexed points.
@@ -455,27 +575,27 @@ class SemanticSearch:
                     points_count=len(texts)
                 )
             
-            # Create embeddings for all texts
-            points = []
-            indexed_ids = []
-            
-            for i, text in enumerate(texts):
-                metadata = metadata_list[i] if metadata_list else None
-                point_id = point_ids[i] if point_ids else None
-                
-                point = self.embedder.embed(
-                    content=text,
-                    metadata=metadata,
-                    point_id=point_id,
-                )
-                points.append(point)
-                indexed_ids.append(point.id)
+            # Create embeddings for all texts in batched forward passes
+            points = self.embedder.embed_text_points(
+                texts=texts,
+                metadata_list=metadata_list,
+                point_ids=point_ids,
+                batch_size=batch_size,
+                cache=embedding_cache,
+            )
+            indexed_ids = [point.id for point in points]
             
             # Batch upsert to vector database
-            self.vector_db.upsert_points(
-                collection_name=self.collection_name,
-                points=points
-            )
+            if bulk:
+                self.vector_db.bulk_upload_points(
+                    collection_name=self.collection_name,
+                    points=points
+                )
+            else:
+                self.vector_db.upsert_points(
+                    collection_name=self.collection_name,
+                    points=points
+                )
             
             logger.info(f"Indexed {len(texts)} texts into collection '{self.collection_name}'")
             return indexed_ids
@@ -7,8 +7,9 @@
 #  Author: Asif Qamar
 # =============================================================================
 
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, Dict, List, Optional
 from icontract import require, ensure, invariant
 from qdrant_client import QdrantClient, models
 from metamorphosis.rag import config
@@ -21,6 +22,9 @@ from metamorphosis.rag.exceptions import (
 )
 from loguru import logger
 
+# gRPC keepalive for the remote client, so idle pooled connections are not dropped.
+_GRPC_OPTIONS = {"grpc.keepalive_time_ms": 10000}
+
 #============================================================================================
 #  Class: EmbeddedVectorDB
 #============================================================================================
@@ -31,8 +35,15 @@ class EmbeddedVectorDB:
     
     This class provides a simple interface to interact with a local Qdrant
     vector database, including collection management and point operations.
+    
+    Prefer `EmbeddedVectorDB.shared()` over constructing new instances: one client
+    per process keeps a single pooled connection to the server, and an on-disk
+    database can only be opened by one client at a time.
     """
     
+    _shared_instance: ClassVar[Optional["EmbeddedVectorDB"]] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     # ----------------------------------------------------------------------------------------
     #  Constructor
     # ----------------------------------------------------------------------------------------
@@ -49,9 +60,14 @@ class EmbeddedVectorDB:
         logger.info(f"Connecting to vector database at {path}")
         if path == "localhost":
             # If the path is "localhost", we are using the default Qdrant
-            # instance running on the same machine.
-            self.client = QdrantClient(url="localhost", port=6333)
-            logger.info("Connected to embedded vector database at localhost:6333")
+            # instance running on the same machine. gRPC has markedly lower
+            # per-request overhead than REST for the small payloads used here.
+            self.client = QdrantClient(
+                url="localhost", port=6333, grpc_port=6334,
+                prefer_grpc=True, grpc_options=_GRPC_OPTIONS,
+            )
+            self._is_remote = True
+            logger.info("Connected to embedded vector database at localhost:6334 (gRPC)")
         else:
             if not Path(path).exists():
                 raise VectorDatabasePathNotFoundError(
@@ -59,8 +75,25 @@ class EmbeddedVectorDB:
                     suggestion="Create the directory or update your configuration"
                 )
             self.client = QdrantClient(path=path)
+            self._is_remote = False
             logger.info(f"Connected to embedded vector database at {path}")
 
+    # ----------------------------------------------------------------------------------------
+    #  Shared Instance
+    # ----------------------------------------------------------------------------------------
+    @classmethod
+    def shared(cls) -> "EmbeddedVectorDB":
+        """Return the process-wide client, creating it on first use.
+        
+        Returns:
+            The shared EmbeddedVectorDB instance.
+        """
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
+
     # ----------------------------------------------------------------------------------------
     #  Collection Exists
     # ----------------------------------------------------------------------------------------
@@ -120,13 +153,23 @@ class EmbeddedVectorDB:
              "Distance must be a non-empty string")
     @ensure(lambda result: isinstance(result, bool), "Must return boolean")
     def create_collection(self, *, collection_name: str, vector_size: int, 
-                         distance: str) -> bool:
+                         distance: str,
+                         quantization_config: Optional[models.QuantizationConfig] = None,
+                         on_disk: bool = False,
+                         datatype: Optional[models.Datatype] = None,
+                         hnsw_config: Optional[models.HnswConfigDiff] = None) -> bool:
         """Create a new collection in the vector database.
         
         Args:
             collection_name: Name of the collection to create.
             vector_size: Size of the vectors to be stored.
             distance: Distance metric to use (e.g., 'Cosine', 'Euclidean', 'Dot').
+            quantization_config: Optional vector quantization (scalar, binary, ...).
+            on_disk: Keep the original vectors in memory-mapped files instead of RAM;
+                pair with an in-RAM quantized copy to keep searches fast.
+            datatype: Storage type of the original vectors, e.g. `models.Datatype.FLOAT16`
+                to halve their size (default: float32).
+            hnsw_config: Optional HNSW graph parameters (`m`, `ef_construct`, ...).
             
         Returns:
             True if collection was created successfully.
@@ -153,7 +196,11 @@ class EmbeddedVectorDB:
         
         self.client.create_collection(
             collection_name=collection_name,
-            vectors_config=models.VectorParams(size=vector_size, distance=distance)
+            vectors_config=models.VectorParams(
+                size=vector_size, distance=distance, on_disk=on_disk, datatype=datatype
+            ),
+            quantization_config=quantization_config,
+            hnsw_config=hnsw_config,
         )
         logger.info(f"Created collection '{collection_name}' with vector size {vector_size}")
         return self.client.collection_exists(collection_name)
@@ -340,6 +387,48 @@ class EmbeddedVectorDB:
         logger.info(f"Retrieved {len(results)} points from collection '{collection_name}'")
         return results
 
+    # ----------------------------------------------------------------------------------------
+    #  Distinct Payload Values
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    @require(lambda field_names: isinstance(field_names, list) and len(field_names) > 0,
+             "Field names must be a non-empty list")
+    def distinct_payload_values(self, *, collection_name: str, field_names: List[str],
+                                page_size: int = 256) -> Dict[str, List[str]]:
+        """Collect the distinct values stored under each payload key in a collection.
+        
+        Scrolls the whole collection once, reading only the requested payload keys
+        (no vectors). Intended for small, low-cardinality metadata fields.
+        
+        Args:
+            collection_name: Name of the collection.
+            field_names: Payload keys to collect.
+            page_size: Number of points fetched per scroll request.
+            
+        Returns:
+            Mapping of each field name to its sorted distinct string values.
+        """
+        values: Dict[str, set] = {field_name: set() for field_name in field_names}
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=models.PayloadSelectorInclude(include=field_names),
+                with_vectors=False,
+            )
+            for record in records:
+                payload = record.payload or {}
+                for field_name in field_names:
+                    value = payload.get(field_name)
+                    if isinstance(value, str):
+                        values[field_name].add(value)
+            if offset is None:
+                break
+        return {field_name: sorted(found) for field_name, found in values.items()}
+
     # ----------------------------------------------------------------------------------------
     #  List Collections
     # ----------------------------------------------------------------------------------------
@@ -371,7 +460,10 @@ class EmbeddedVectorDB:
              "Limit must be a positive integer")
     @ensure(lambda result: isinstance(result, list), "Must return a list")
     def search_points(self, *, collection_name: str, query_vector: List[float], 
-                     limit: int = 10, score_threshold: Optional[float] = None) -> List[models.ScoredPoint]:
+                     limit: int = 10, score_threshold: Optional[float] = None,
+                     query_filter: Optional[models.Filter] = None,
+                     search_params: Optional[models.SearchParams] = None,
+                     with_vectors: bool = False) -> List[models.ScoredPoint]:
         """Search for similar points in a collection using vector similarity.
         
         Args:
@@ -379,6 +471,9 @@ class EmbeddedVectorDB:
             query_vector: Vector to search for similar points.
             limit: Maximum number of results to return.
             score_threshold: Minimum similarity score threshold.
+            query_filter: Optional payload filter applied by Qdrant during the search.
+            search_params: Optional search parameters (e.g. quantization rescoring).
+            with_vectors: Also return each point's stored vector.
             
         Returns:
             List of scored points sorted by similarity.
@@ -399,24 +494,248 @@ class EmbeddedVectorDB:
                 available_collections=available_collections
             )
         
-        search_params = {
+        search_kwargs = {
             "collection_name": collection_name,
             "query_vector": query_vector,
             "limit": limit,
         }
 
         if score_threshold is not None:
-            search_params["score_threshold"] = score_threshold
+            search_kwargs["score_threshold"] = score_threshold
+        if query_filter is not None:
+            search_kwargs["query_filter"] = query_filter
+        if search_params is not None:
+            search_kwargs["search_params"] = search_params
+        if with_vectors:
+            search_kwargs["with_vectors"] = True
 
         # `qdrant_client` returns a list of `ScoredPoint` objects when using the
         # `search` method.  Previous implementation incorrectly used
         # `query_points`, which is not part of the public API and would raise an
         # `AttributeError` at runtime.  Switching to `search` ensures
         # compatibility with supported versions of the client.
-        results = self.client.search(**search_params)
+        results = self.client.search(**search_kwargs)
         logger.info(f"Found {len(results)} points in collection '{collection_name}'")
         return results
 
+    # ----------------------------------------------------------------------------------------
+    #  Search Points by Text (Server-Side Inference)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    @require(lambda text: isinstance(text, str) and len(text.strip()) > 0,
+             "Query text must be a non-empty string")
+    @require(lambda limit: isinstance(limit, int) and limit > 0,
+             "Limit must be a positive integer")
+    def search_points_by_text(self, *, collection_name: str, text: str, model_name: str,
+                              limit: int = 10, score_threshold: Optional[float] = None,
+                              query_filter: Optional[models.Filter] = None,
+                              search_params: Optional[models.SearchParams] = None
+                              ) -> List[models.ScoredPoint]:
+        """Search with a raw text query that Qdrant embeds itself.
+        
+        The text is sent as a `models.Document`, so embedding and search happen in a
+        single request and no model runs in this process. The server (or, in local
+        mode, FastEmbed) must support `model_name`, and it must be the model the
+        collection was indexed with.
+        
+        Args:
+            collection_name: Name of the collection to search in.
+            text: The query text.
+            model_name: Embedding model Qdrant should apply to `text`.
+            limit: Maximum number of results to return.
+            score_threshold: Minimum similarity score threshold.
+            query_filter: Optional payload filter applied by Qdrant during the search.
+            search_params: Optional search parameters (e.g. quantization rescoring).
+            
+        Returns:
+            List of scored points sorted by similarity.
+            
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist.
+        """
+        if not self.client.collection_exists(collection_name):
+            raise CollectionNotFoundError(
+                collection_name=collection_name,
+                operation="search_points_by_text",
+            )
+        
+        response = self.client.query_points(
+            collection_name=collection_name,
+            query=models.Document(text=text, model=model_name),
+            limit=limit,
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            search_params=search_params,
+        )
+        logger.info(f"Found {len(response.points)} points in collection '{collection_name}'")
+        return response.points
+
+    # ----------------------------------------------------------------------------------------
+    #  Ensure Quantization
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    def ensure_quantization(self, *, collection_name: str,
+                            quantization_config: models.QuantizationConfig) -> None:
+        """Enable vector quantization on an existing collection that has none.
+        
+        Collections that already carry a quantization config are left untouched.
+        The embedded local mode does not quantize, so the call is skipped there.
+        
+        Args:
+            collection_name: Name of the collection.
+            quantization_config: Quantization to apply.
+        """
+        if not self._is_remote:
+            logger.debug("Skipping quantization: not supported in local mode")
+            return
+        info = self.client.get_collection(collection_name)
+        if info.config.quantization_config is not None:
+            return
+        self.client.update_collection(
+            collection_name=collection_name,
+            quantization_config=quantization_config,
+        )
+        logger.info(f"Enabled quantization on collection '{collection_name}'")
+
+    # ----------------------------------------------------------------------------------------
+    #  Create Payload Index
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    @require(lambda field_name: isinstance(field_name, str) and len(field_name.strip()) > 0,
+             "Field name must be a non-empty string")
+    def create_payload_index(self, *, collection_name: str, field_name: str,
+                             field_schema: str = "keyword") -> None:
+        """Index a payload field so filtered searches prune at the vector-index level.
+        
+        Creating an index that already exists is a no-op on the server. The embedded
+        local mode has no payload indexes, so the call is skipped there.
+        
+        Args:
+            collection_name: Name of the collection.
+            field_name: Payload key to index.
+            field_schema: Qdrant field schema (e.g. 'keyword', 'integer').
+        """
+        if not self._is_remote:
+            logger.debug(f"Skipping payload index '{field_name}': not supported in local mode")
+            return
+        self.client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=field_schema,
+        )
+        logger.info(f"Ensured payload index '{field_name}' on collection '{collection_name}'")
+
+    # ----------------------------------------------------------------------------------------
+    #  Ensure Payload Indexes
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    @require(lambda field_names: isinstance(field_names, list) and len(field_names) > 0,
+             "Field names must be a non-empty list")
+    def ensure_payload_indexes(self, *, collection_name: str, field_names: List[str],
+                               field_schema: str = "keyword") -> None:
+        """Create whichever of the given payload indexes the collection is missing.
+        
+        One `get_collection` call reads the existing payload schema; only absent
+        fields are then indexed. Skipped in the embedded local mode, which has no
+        payload indexes.
+        
+        Args:
+            collection_name: Name of the collection.
+            field_names: Payload keys that should be indexed.
+            field_schema: Qdrant field schema for the new indexes (e.g. 'keyword').
+        """
+        if not self._is_remote:
+            logger.debug("Skipping payload indexes: not supported in local mode")
+            return
+        existing = self.client.get_collection(collection_name).payload_schema or {}
+        for field_name in field_names:
+            if field_name not in existing:
+                self.create_payload_index(collection_name=collection_name,
+                                          field_name=field_name, field_schema=field_schema)
+
+    # ----------------------------------------------------------------------------------------
+    #  Search Points (batched)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    @require(lambda query_vectors: isinstance(query_vectors, list) and len(query_vectors) > 0,
+             "Query vectors must be a non-empty list")
+    @require(lambda limit: isinstance(limit, int) and limit > 0,
+             "Limit must be a positive integer")
+    @ensure(lambda result, query_vectors: len(result) == len(query_vectors),
+            "Must return one result list per query vector")
+    def search_points_batch(self, *, collection_name: str, query_vectors: List[List[float]],
+                            limit: int = 10, 
+                            score_threshold: Optional[float] = None) -> List[List[models.ScoredPoint]]:
+        """Run several similarity searches against a collection in a single request.
+        
+        Args:
+            collection_name: Name of the collection to search in.
+            query_vectors: Vectors to search for similar points.
+            limit: Maximum number of results to return per query.
+            score_threshold: Minimum similarity score threshold.
+            
+        Returns:
+            One list of scored points per query vector, in input order.
+            
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist.
+        """
+        if not self.client.collection_exists(collection_name):
+            try:
+                available_collections = [col.name for col in self.client.get_collections().collections]
+            except Exception:
+                available_collections = None
+                
+            raise CollectionNotFoundError(
+                collection_name=collection_name,
+                operation="search_points_batch",
+                available_collections=available_collections
+            )
+        
+        requests = [
+            models.QueryRequest(
+                query=query_vector,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+            )
+            for query_vector in query_vectors
+        ]
+        return self._query_batch(collection_name=collection_name, requests=requests)
+
+    # ----------------------------------------------------------------------------------------
+    #  Query Batch
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    @require(lambda requests: isinstance(requests, list) and len(requests) > 0,
+             "Requests must be a non-empty list")
+    def query_batch(self, *, collection_name: str,
+                    requests: List[models.QueryRequest]) -> List[List[models.ScoredPoint]]:
+        """Run fully specified queries (own limit, filter, params each) in a single request.
+        
+        Args:
+            collection_name: Name of the collection to search in.
+            requests: One `models.QueryRequest` per search.
+            
+        Returns:
+            One list of scored points per request, in input order.
+            
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist.
+        """
+        if not self.client.collection_exists(collection_name):
+            raise CollectionNotFoundError(
+                collection_name=collection_name,
+                operation="query_batch",
+            )
+        return self._query_batch(collection_name=collection_name, requests=requests)
+
     # ----------------------------------------------------------------------------------------
     #  Upsert Points
     # ----------------------------------------------------------------------------------------
@@ -453,9 +772,82 @@ class EmbeddedVectorDB:
         self.client.upsert(collection_name=collection_name, points=points)
         logger.info(f"Upserted {len(points)} points to collection '{collection_name}'")
 
+    # ----------------------------------------------------------------------------------------
+    #  Bulk Upload Points
+    # ----------------------------------------------------------------------------------------
+    @require(lambda collection_name: isinstance(collection_name, str) and 
+             len(collection_name.strip()) > 0, "Collection name must be a non-empty string")
+    @require(lambda points: isinstance(points, list) and len(points) > 0,
+             "Points must be a non-empty list")
+    @require(lambda batch_size: isinstance(batch_size, int) and batch_size > 0,
+             "Batch size must be a positive integer")
+    def bulk_upload_points(self, *, collection_name: str, points: List[models.PointStruct],
+                           batch_size: int = 256, parallel: int = 8) -> None:
+        """Upload many points with HNSW indexing suspended until the upload finishes.
+        
+        Indexing is switched off (``indexing_threshold=0``) for the duration of the
+        upload so the HNSW graph is built once at the end instead of being updated
+        batch by batch; the collection's previous threshold is then restored.
+        
+        Args:
+            collection_name: Name of the collection to upload into.
+            points: Points to upload.
+            batch_size: Points per upload request.
+            parallel: Upload workers; only used against a Qdrant server (the
+                embedded local mode uploads in-process).
+            
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist.
+        """
+        if not self.client.collection_exists(collection_name):
+            try:
+                available_collections = [col.name for col in self.client.get_collections().collections]
+            except Exception:
+                available_collections = None
+                
+            raise CollectionNotFoundError(
+                collection_name=collection_name,
+                operation="bulk_upload_points",
+                available_collections=available_collections
+            )
+        
+        optimizer_config = self.client.get_collection(collection_name).config.optimizer_config
+        previous_threshold = getattr(optimizer_config, "indexing_threshold", None)
+        self.client.update_collection(
+            collection_name=collection_name,
+            optimizer_config=models.OptimizersConfigDiff(indexing_threshold=0),
+        )
+        try:
+            self.client.upload_points(
+                collection_name=collection_name,
+                points=points,
+                batch_size=batch_size,
+                parallel=parallel if self._is_remote else 1,
+                wait=True,
+            )
+        finally:
+            self.client.update_collection(
+                collection_name=collection_name,
+                optimizer_config=models.OptimizersConfigDiff(
+                    indexing_threshold=(
+                        previous_threshold if previous_threshold is not None else 20000
+                    )
+                ),
+            )
+        logger.info(f"Bulk-uploaded {len(points)} points to collection '{collection_name}'")
+
     # ----------------------------------------------------------------------------------------
     #  Helper Methods (Private)
     # ----------------------------------------------------------------------------------------
+    def _query_batch(self, *, collection_name: str,
+                     requests: List[models.QueryRequest]) -> List[List[models.ScoredPoint]]:
+        """Send `requests` in one `query_batch_points` call and unwrap the hits."""
+        responses = self.client.query_batch_points(
+            collection_name=collection_name, requests=requests
+        )
+        logger.info(f"Ran {len(requests)} batched searches in collection '{collection_name}'")
+        return [response.points for response in responses]
+
     def _create_new_collection(self, collection_name: str, vector_size: int, 
                               distance: str) -> bool:
         """Helper to create a new collection."""
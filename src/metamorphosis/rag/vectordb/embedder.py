@@ -7,7 +7,9 @@
 #  Author: Asif Qamar
 # =============================================================================
 
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
 from typing import Union, List, Optional, Dict, Any
 from uuid import uuid4
@@ -20,6 +22,13 @@ import numpy as np
 import open_clip
 from loguru import logger
 from metamorphosis.rag.exceptions import InvalidPointsError
+from metamorphosis.rag.vectordb.embedding_cache import EmbeddingDiskCache
+from metamorphosis.utilities import get_project_root
+
+
+# Where `export_onnx_embedder.py` writes the quantized MiniLM model by default;
+# anchored to the project root so it does not depend on the working directory.
+DEFAULT_ONNX_MODEL_DIR = get_project_root() / "onnx_models" / "all-MiniLM-L6-v2-int8"
 
 
 #============================================================================================
@@ -53,6 +62,89 @@ class Embedder(ABC):
         """
         pass
 
+    # ----------------------------------------------------------------------------------------
+    #  Embed Texts (batched)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda texts: isinstance(texts, list) and len(texts) > 0,
+             "Texts must be a non-empty list")
+    def embed_texts(self, *, texts: List[str], batch_size: int = 64) -> List[np.ndarray]:
+        """Convert several text strings to embedding vectors.
+        
+        The default implementation embeds one text at a time; subclasses that can run
+        a batched forward pass should override it.
+        
+        Args:
+            texts: Text strings to embed.
+            batch_size: Maximum number of texts per forward pass (ignored here).
+            
+        Returns:
+            One embedding vector per input text, in input order.
+            
+        Raises:
+            InvalidPointsError: If any text cannot be embedded.
+        """
+        return [self.embed(content=text).vector for text in texts]
+
+    # ----------------------------------------------------------------------------------------
+    #  Embed Text Points (batched)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda texts: isinstance(texts, list) and len(texts) > 0,
+             "Texts must be a non-empty list")
+    @ensure(lambda result, texts: len(result) == len(texts),
+            "Must return one point per text")
+    def embed_text_points(self, *, texts: List[str],
+                          metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+                          point_ids: Optional[List[Optional[str]]] = None,
+                          batch_size: int = 64,
+                          cache: Optional[EmbeddingDiskCache] = None) -> List[models.PointStruct]:
+        """Embed several texts via `embed_texts` and wrap them as PointStructs.
+        
+        Payloads match what `embed` produces for a single text.
+        
+        Args:
+            texts: Text strings to embed.
+            metadata_list: Optional metadata per text.
+            point_ids: Optional custom ID per text; UUIDs are generated otherwise.
+            batch_size: Maximum number of texts per forward pass.
+            cache: Optional on-disk embedding cache. Texts already cached for this
+                model are not re-embedded; newly embedded texts are added to it.
+            
+        Returns:
+            One PointStruct per input text, in input order.
+            
+        Raises:
+            InvalidPointsError: If the texts cannot be embedded.
+        """
+        if cache is None:
+            vectors = self.embed_texts(texts=texts, batch_size=batch_size)
+        else:
+            vectors = self._embed_texts_through_cache(
+                texts=texts, batch_size=batch_size, cache=cache
+            )
+        points = []
+        for i, (text, vector) in enumerate(zip(texts, vectors)):
+            payload = {"content": text, "content_type": "text"}
+            if metadata_list and metadata_list[i]:
+                payload.update(metadata_list[i])
+            point_id = point_ids[i] if point_ids and point_ids[i] else str(uuid4())
+            points.append(models.PointStruct(id=point_id, vector=vector, payload=payload))
+        return points
+
+    def _embed_texts_through_cache(self, *, texts: List[str], batch_size: int,
+                                   cache: EmbeddingDiskCache) -> List[np.ndarray]:
+        """Serve cached vectors from `cache` and run `embed_texts` on the misses only."""
+        model_name = getattr(self, "model_name", type(self).__name__)
+        vectors = cache.get_many(model_name=model_name, texts=texts)
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            embedded = self.embed_texts(texts=miss_texts, batch_size=batch_size)
+            cache.put_many(model_name=model_name, texts=miss_texts, vectors=embedded)
+            for i, vector in zip(misses, embedded):
+                vectors[i] = vector
+        logger.debug(f"Embedding cache served {len(texts) - len(misses)} of {len(texts)} texts")
+        return vectors
+
     # ----------------------------------------------------------------------------------------
     #  Abstract Method: Get Vector Size
     # ----------------------------------------------------------------------------------------
@@ -89,11 +181,16 @@ class SimpleTextEmbedder(Embedder):
     # ----------------------------------------------------------------------------------------
     @require(lambda model_name: isinstance(model_name, str) and len(model_name.strip()) > 0,
              "Model name must be a non-empty string")
-    def __init__(self, *, model_name: str = "sentence-transformers/all-MiniLM-L6-v2") -> None:
+    @require(lambda vector_cache_size: isinstance(vector_cache_size, int)
+             and vector_cache_size >= 0, "Vector cache size must be a non-negative integer")
+    def __init__(self, *, model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 vector_cache_size: int = 1024) -> None:
         """Initialize the text embedder with a specified model.
         
         Args:
             model_name: HuggingFace model identifier for text embeddings.
+            vector_cache_size: Number of recently embedded texts whose vectors `embed`
+                reuses, so an exact repeat skips the model forward pass (0 disables).
             
         Raises:
             InvalidPointsError: If model cannot be loaded.
@@ -103,6 +200,7 @@ class SimpleTextEmbedder(Embedder):
             self.tokenizer = AutoTokenizer.from_pretrained(model_name)
             self.model = AutoModel.from_pretrained(model_name)
             self.model.eval()
+            self._init_vector_cache(vector_cache_size)
             
             # Determine vector size by running a test embedding
             with torch.no_grad():
@@ -147,17 +245,7 @@ class SimpleTextEmbedder(Embedder):
             if point_id is None:
                 point_id = str(uuid4())
                 
-            # Tokenize and embed the text
-            with torch.no_grad():
-                inputs = self.tokenizer(content, return_tensors="pt", 
-                                      padding=True, truncation=True, max_length=512)
-                outputs = self.model(**inputs)
-                
-                # Use mean pooling over token embeddings
-                embeddings = outputs.last_hidden_state.mean(dim=1)
-                # Normalize the embeddings for better similarity search
-                embeddings = embeddings / embeddings.norm(dim=-1, keepdim=True)
-                vector = embeddings.squeeze().numpy()
+            vector = self._encode_cached(content)
                 
             # Prepare payload with content and metadata
             payload = {"content": content, "content_type": "text"}
@@ -180,6 +268,143 @@ class SimpleTextEmbedder(Embedder):
                 points_count=1
             )
 
+    def _encode(self, content: str) -> np.ndarray:
+        """Run the model on one text; the result is read-only because it is cached."""
+        with torch.no_grad():
+            inputs = self.tokenizer(content, return_tensors="pt", 
+                                  padding=True, truncation=True, max_length=512)
+            outputs = self.model(**inputs)
+            
+            # Use mean pooling over token embeddings
+            embeddings = outputs.last_hidden_state.mean(dim=1)
+            # Normalize the embeddings for better similarity search
+            embeddings = embeddings / embeddings.norm(dim=-1, keepdim=True)
+            vector = embeddings.squeeze().numpy()
+        vector.setflags(write=False)
+        return vector
+
+    def _init_vector_cache(self, size: int) -> None:
+        """Create the per-instance LRU of recently embedded texts (size 0 disables it)."""
+        self._vector_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._vector_cache_size = size
+        self._vector_cache_lock = threading.Lock()
+
+    def _encode_cached(self, content: str) -> np.ndarray:
+        """`_encode`, served from the vector cache for recently embedded texts."""
+        with self._vector_cache_lock:
+            vector = self._vector_cache.get(content)
+            if vector is not None:
+                self._vector_cache.move_to_end(content)
+                return vector
+        vector = self._encode(content)
+        self._remember_vectors([content], [vector])
+        return vector
+
+    def _remember_vectors(self, texts: List[str], vectors: List[np.ndarray]) -> None:
+        """Add vectors to the cache, dropping the least recently used beyond its size."""
+        if self._vector_cache_size == 0:
+            return
+        with self._vector_cache_lock:
+            for text, vector in zip(texts, vectors):
+                self._vector_cache[text] = vector
+                self._vector_cache.move_to_end(text)
+            while len(self._vector_cache) > self._vector_cache_size:
+                self._vector_cache.popitem(last=False)
+
+    # ----------------------------------------------------------------------------------------
+    #  Embed Texts (cached)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda texts: isinstance(texts, list) and len(texts) > 0,
+             "Texts must be a non-empty list")
+    def embed_cached_texts(self, *, texts: List[str], batch_size: int = 64) -> List[np.ndarray]:
+        """Embed texts through the vector cache used by `embed`.
+        
+        Cached texts skip the model; the rest are embedded together with
+        `embed_texts` and added to the cache, so later `embed` calls for them are
+        served from memory. Meant for queries known in advance, not for bulk
+        corpus indexing.
+        
+        Args:
+            texts: Text strings to embed.
+            batch_size: Maximum number of texts per forward pass.
+            
+        Returns:
+            One read-only embedding vector per input text, in input order.
+        """
+        with self._vector_cache_lock:
+            vectors = [self._vector_cache.get(text) for text in texts]
+        misses = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if misses:
+            embedded = [
+                np.array(vector, dtype=np.float32)
+                for vector in self.embed_texts(texts=misses, batch_size=batch_size)
+            ]
+            for vector in embedded:
+                vector.setflags(write=False)
+            self._remember_vectors(misses, embedded)
+            by_text = dict(zip(misses, embedded))
+            vectors = [by_text[text] if vector is None else vector
+                       for text, vector in zip(texts, vectors)]
+        return vectors
+
+    # ----------------------------------------------------------------------------------------
+    #  Embed Texts (batched)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda texts: isinstance(texts, list) and len(texts) > 0,
+             "Texts must be a non-empty list")
+    @require(lambda texts: all(isinstance(text, str) and len(text.strip()) > 0 for text in texts),
+             "All texts must be non-empty strings")
+    @require(lambda batch_size: isinstance(batch_size, int) and batch_size > 0,
+             "Batch size must be a positive integer")
+    def embed_texts(self, *, texts: List[str], batch_size: int = 64) -> List[np.ndarray]:
+        """Convert several text strings to embedding vectors in batched forward passes.
+        
+        Mean pooling is restricted to real tokens via the attention mask, so each
+        vector matches what `embed` produces for the same text on its own. Texts are
+        grouped by length before batching ("smart batching") so short texts are not
+        padded to the longest text of an unrelated batch; results are returned in
+        input order.
+        
+        Args:
+            texts: Text strings to embed.
+            batch_size: Maximum number of texts per forward pass.
+            
+        Returns:
+            One normalized embedding vector per input text, in input order.
+            
+        Raises:
+            InvalidPointsError: If the texts cannot be embedded.
+        """
+        try:
+            # Process texts shortest-first, then scatter results back to input order
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+            with torch.no_grad():
+                for start in range(0, len(order), batch_size):
+                    batch_indices = order[start:start + batch_size]
+                    batch = [texts[i] for i in batch_indices]
+                    inputs = self.tokenizer(batch, return_tensors="pt",
+                                          padding=True, truncation=True, max_length=512)
+                    outputs = self.model(**inputs)
+                    
+                    # Mean pooling over non-padding tokens only
+                    mask = inputs["attention_mask"].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+                    summed = (outputs.last_hidden_state * mask).sum(dim=1)
+                    embeddings = summed / mask.sum(dim=1).clamp(min=1e-9)
+                    embeddings = embeddings / embeddings.norm(dim=-1, keepdim=True)
+                    for i, vector in zip(batch_indices, embeddings.numpy()):
+                        vectors[i] = vector
+                
+            logger.debug(f"Embedded {len(texts)} texts in batches of {batch_size} "
+                        f"(dimension: {len(vectors[0])})")
+            return vectors
+            
+        except Exception as e:
+            raise InvalidPointsError(
+                issue=f"Failed to embed text batch: {str(e)}",
+                points_count=len(texts)
+            )
+
     # ----------------------------------------------------------------------------------------
     #  Get Vector Size
     # ----------------------------------------------------------------------------------------
@@ -195,6 +420,131 @@ class SimpleTextEmbedder(Embedder):
         return "Cosine"
 
 
+#============================================================================================
+#  Class: OnnxTextEmbedder
+#============================================================================================
+class OnnxTextEmbedder(SimpleTextEmbedder):
+    """SimpleTextEmbedder running an INT8-quantized ONNX export on ONNX Runtime.
+
+    Produces the same mean-pooled, L2-normalized vectors as `SimpleTextEmbedder`
+    (up to quantization error) at a fraction of the CPU latency and model size.
+    Create the model directory once with `export_onnx_embedder.py`. Requires the
+    optional `onnxruntime` package.
+    """
+
+    # ----------------------------------------------------------------------------------------
+    #  Constructor
+    # ----------------------------------------------------------------------------------------
+    @require(lambda model_dir: isinstance(model_dir, (str, Path)),
+             "Model directory must be a string or Path")
+    @require(lambda vector_cache_size: isinstance(vector_cache_size, int)
+             and vector_cache_size >= 0, "Vector cache size must be a non-negative integer")
+    def __init__(self, *, model_dir: Union[str, Path] = DEFAULT_ONNX_MODEL_DIR,
+                 model_file: str = "model_quantized.onnx",
+                 vector_cache_size: int = 1024) -> None:
+        """Load the ONNX model and its tokenizer from `model_dir`.
+
+        Args:
+            model_dir: Directory written by `export_onnx_embedder.py`, holding the
+                ONNX model and the tokenizer files.
+            model_file: Name of the ONNX model inside `model_dir`.
+            vector_cache_size: Number of recently embedded texts whose vectors `embed`
+                reuses (0 disables).
+
+        Raises:
+            InvalidPointsError: If onnxruntime is missing or the model cannot be loaded.
+        """
+        model_dir = Path(model_dir)
+        try:
+            import onnxruntime as ort
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            self.session = ort.InferenceSession(
+                str(model_dir / model_file), sess_options=options,
+                providers=["CPUExecutionProvider"],
+            )
+            self._input_names = {node.name for node in self.session.get_inputs()}
+            self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+            # Distinct from the float model's name: cached vectors of the two differ
+            self.model_name = f"{model_dir.name}:{model_file}"
+            self._init_vector_cache(vector_cache_size)
+            self._vector_size = int(self._encode("test").shape[0])
+
+            logger.info(f"Initialized OnnxTextEmbedder from '{model_dir / model_file}', "
+                       f"vector size: {self._vector_size}")
+
+        except Exception as e:
+            raise InvalidPointsError(
+                issue=f"Failed to initialize ONNX text embedder from '{model_dir}': {str(e)}"
+            )
+
+    # ----------------------------------------------------------------------------------------
+    #  Embed Texts (batched)
+    # ----------------------------------------------------------------------------------------
+    @require(lambda texts: isinstance(texts, list) and len(texts) > 0,
+             "Texts must be a non-empty list")
+    @require(lambda texts: all(isinstance(text, str) and len(text.strip()) > 0 for text in texts),
+             "All texts must be non-empty strings")
+    @require(lambda batch_size: isinstance(batch_size, int) and batch_size > 0,
+             "Batch size must be a positive integer")
+    def embed_texts(self, *, texts: List[str], batch_size: int = 64) -> List[np.ndarray]:
+        """Convert several text strings to embedding vectors in batched ONNX runs.
+
+        Texts are grouped by length before batching, as in `SimpleTextEmbedder`.
+
+        Args:
+            texts: Text strings to embed.
+            batch_size: Maximum number of texts per run.
+
+        Returns:
+            One normalized embedding vector per input text, in input order.
+
+        Raises:
+            InvalidPointsError: If the texts cannot be embedded.
+        """
+        try:
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+            for start in range(0, len(order), batch_size):
+                batch_indices = order[start:start + batch_size]
+                embeddings = self._run([texts[i] for i in batch_indices])
+                for i, vector in zip(batch_indices, embeddings):
+                    vectors[i] = vector
+
+            logger.debug(f"Embedded {len(texts)} texts in batches of {batch_size} "
+                        f"(dimension: {len(vectors[0])})")
+            return vectors
+
+        except Exception as e:
+            raise InvalidPointsError(
+                issue=f"Failed to embed text batch: {str(e)}",
+                points_count=len(texts)
+            )
+
+    # ----------------------------------------------------------------------------------------
+    #  Helper Methods (Private)
+    # ----------------------------------------------------------------------------------------
+    def _encode(self, content: str) -> np.ndarray:
+        """Run the model on one text; the result is read-only because it is cached."""
+        vector = self._run([content])[0]
+        vector.setflags(write=False)
+        return vector
+
+    def _run(self, texts: List[str]) -> np.ndarray:
+        """Embed `texts` in one session run: masked mean pooling, then L2 normalization."""
+        inputs = self.tokenizer(texts, return_tensors="np", padding=True,
+                                truncation=True, max_length=512)
+        feed = {name: inputs[name].astype(np.int64) for name in self._input_names
+                if name in inputs}
+        hidden = self.session.run(None, feed)[0]
+
+        mask = inputs["attention_mask"][..., None].astype(hidden.dtype)
+        embeddings = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings.astype(np.float32, copy=False)
+
+
 #============================================================================================
 #  Class: MultimodalEmbedder
 #============================================================================================
@@ -0,0 +1,137 @@
+# =============================================================================
+#  Filename: embedding_cache.py
+#
+#  Short Description: Persistent on-disk cache of text embeddings keyed by content hash.
+#
+#  Creation date: 2025-09-22
+#  Author: Asif Qamar
+# =============================================================================
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+from icontract import require
+from loguru import logger
+
+
+DEFAULT_EMBEDDING_CACHE_PATH = Path("~/.cache/metamorphosis/embeddings.sqlite").expanduser()
+
+# Stay well below SQLite's bound-parameter limit in `IN (...)` lookups.
+_LOOKUP_CHUNK_SIZE = 500
+
+
+def sidecar_cache_path(corpus_path: Path) -> Path:
+    """Location of a pre-computed embedding cache shipped next to a corpus file.
+
+    e.g. ``project_portfolio.jsonl`` -> ``project_portfolio.embeddings.sqlite``.
+    """
+    return Path(corpus_path).with_suffix(".embeddings.sqlite")
+
+
+#============================================================================================
+#  Class: EmbeddingDiskCache
+#============================================================================================
+class EmbeddingDiskCache:
+    """SQLite-backed store of text embeddings that survives across runs.
+
+    Each vector is keyed by ``sha256(model_name + ":" + text)``, so a cached vector
+    is only reused for the same text under the same model. Vectors are stored as
+    float32 bytes, so a cache hit is bit-identical to re-embedding the text.
+
+    The database file and its parent directory are created on first use. All
+    methods are thread-safe.
+    """
+
+    # ----------------------------------------------------------------------------------------
+    #  Constructor
+    # ----------------------------------------------------------------------------------------
+    def __init__(self, *, path: Path = DEFAULT_EMBEDDING_CACHE_PATH) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Location of the SQLite database file.
+        """
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------------------------------
+    #  Public API
+    # ----------------------------------------------------------------------------------------
+    @require(lambda model_name: isinstance(model_name, str) and len(model_name) > 0,
+             "Model name must be a non-empty string")
+    def get_many(self, *, model_name: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up the cached embedding of every text.
+
+        Args:
+            model_name: Identifier of the model that produced the embeddings.
+            texts: Texts to look up.
+
+        Returns:
+            One entry per input text, in input order: the cached vector, or None.
+        """
+        keys = [self._key(model_name, text) for text in texts]
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+                chunk = keys[start:start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                found.update(rows)
+        return [
+            np.frombuffer(found[key], dtype=np.float32) if key in found else None
+            for key in keys
+        ]
+
+    @require(lambda model_name: isinstance(model_name, str) and len(model_name) > 0,
+             "Model name must be a non-empty string")
+    @require(lambda texts, vectors: len(texts) == len(vectors),
+             "Texts and vectors must have the same length")
+    def put_many(self, *, model_name: str, texts: Sequence[str],
+                 vectors: Sequence[np.ndarray]) -> None:
+        """Store the embedding of every text, replacing existing entries.
+
+        Args:
+            model_name: Identifier of the model that produced the embeddings.
+            texts: Texts that were embedded.
+            vectors: Embedding of each text, in the same order.
+        """
+        rows = [
+            (self._key(model_name, text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+                )
+        logger.debug(f"Stored {len(rows)} embeddings in '{self.path}'")
+
+    # ----------------------------------------------------------------------------------------
+    #  Helper Methods (Private)
+    # ----------------------------------------------------------------------------------------
+    @staticmethod
+    def _key(model_name: str, text: str) -> bytes:
+        return hashlib.sha256(f"{model_name}:{text}".encode("utf-8")).digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use; callers must hold `_lock`."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._connection = connection
+            logger.info(f"Opened embedding cache at '{self.path}'")
+        return self._connection
@@ -0,0 +1,81 @@
+# =============================================================================
+#  Filename: export_onnx_embedder.py
+#
+#  Short Description: One-off export of the text embedder to an INT8-quantized ONNX model.
+#
+#  Creation date: 2025-09-26
+#  Author: Asif Qamar
+# =============================================================================
+
+"""
+Export a sentence-transformers model to ONNX and quantize it for `OnnxTextEmbedder`.
+
+The weights are quantized to INT8 dynamically (activations are quantized at run time,
+so no calibration data is needed), using the AVX-512 VNNI configuration. Graph
+optimizations are applied by ONNX Runtime when `OnnxTextEmbedder` loads the model.
+Requires the optional `optimum[onnxruntime]` package.
+
+By default the model is written to ``<project root>/onnx_models/all-MiniLM-L6-v2-int8``,
+where `OnnxTextEmbedder` and the RAG examples look for it.
+
+Usage:
+    python -m metamorphosis.rag.vectordb.export_onnx_embedder \\
+        --model sentence-transformers/all-MiniLM-L6-v2
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+from metamorphosis.rag.vectordb.embedder import DEFAULT_ONNX_MODEL_DIR
+
+
+def export_quantized_model(*, model_name: str, output_dir: Path) -> Path:
+    """Export `model_name` to ONNX and write its INT8-quantized version to `output_dir`.
+
+    Args:
+        model_name: HuggingFace identifier of the embedding model.
+        output_dir: Directory for the quantized model and the tokenizer files.
+
+    Returns:
+        Path of the quantized ONNX model (`model_quantized.onnx`).
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as export_dir:
+        logger.info(f"Exporting '{model_name}' to ONNX")
+        model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+        model.save_pretrained(export_dir)
+
+        logger.info("Quantizing weights to INT8")
+        quantizer = ORTQuantizer.from_pretrained(export_dir, file_name="model.onnx")
+        quantizer.quantize(
+            save_dir=output_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=False
+            ),
+        )
+
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+    model_path = output_dir / "model_quantized.onnx"
+    logger.info(f"Wrote quantized embedder to '{model_path}'")
+    return model_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2",
+                        help="HuggingFace identifier of the embedding model")
+    parser.add_argument("--output", type=Path, default=DEFAULT_ONNX_MODEL_DIR,
+                        help="Directory for the quantized model and tokenizer")
+    args = parser.parse_args()
+    export_quantized_model(model_name=args.model, output_dir=args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,8 +24,11 @@ Features:
 """
 
 import os
+import atexit
+import json
 import uuid
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
 import requests
@@ -39,6 +42,7 @@ from metamorphosis.ui.nicegui.nicegui_ui_helpers import (
     patch_state,
     sse_events,
     validate_review_text,
+    load_sample_review,
     display_achievements_table,
     display_metrics_table,
     display_radar_plot,
@@ -54,33 +58,78 @@ load_dotenv()
 SERVICE_BASE = os.getenv("SERVICE_BASE", "http://localhost:8000")
 STREAM_URL = f"{SERVICE_BASE}/stream"
 ICON = 'docs/images/overlapping_logo.png'
+UI_RENDER_INTERVAL = 1 / 30  # Seconds between repaints while a stream is running
+
+# State keys that mark a finished pipeline stage, with their progress checklist labels
+PROGRESS_STEPS = (
+    ("copy_edited_text", "✅ Copy Editing"),
+    ("summary", "✅ Summarization"),
+    ("word_cloud_path", "✅ Word Cloud"),
+    ("achievements", "✅ Achievements"),
+    ("review_scorecard", "✅ Scorecard"),
+)
+PROGRESS_KEYS = frozenset(key for key, _ in PROGRESS_STEPS) | {"review_complete"}
 
-io_executor = ThreadPoolExecutor(max_workers=10)
+# One worker per active SSE stream; the work is network-bound, so this is not tied to the CPU count
+io_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="sse-io")
+atexit.register(lambda: io_executor.shutdown(wait=False, cancel_futures=True))
 
 # =============================================================================
 # ASYNC WRAPPER
 # =============================================================================
+SSE_QUEUE_SIZE = 64  # Events buffered between the reader thread and the UI
+
 async def async_sse_generator(url, data):
+    """
+    Streams SSE events from a worker thread, yielding them in batches: each batch holds
+    every event that arrived since the previous one was consumed.
+    """
     loop = asyncio.get_event_loop()
-    queue = asyncio.Queue()
-    
+    # Bounded, so a slow UI makes the reader thread wait instead of buffering the whole stream
+    queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+    cancelled = threading.Event()
+
+    def put(item):
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
     def run_stream():
         try:
             for event in sse_events(url, data):
-                loop.call_soon_threadsafe(queue.put_nowait, event)
-            loop.call_soon_threadsafe(queue.put_nowait, None)
+                if cancelled.is_set():
+                    return
+                put(event)
+            put(None)
         except Exception as e:
-            loop.call_soon_threadsafe(queue.put_nowait, e)
+            if not cancelled.is_set():
+                put(e)
 
     loop.run_in_executor(io_executor, run_stream)
 
-    while True:
-        item = await queue.get()
-        if item is None:
-            break
-        if isinstance(item, Exception):
-            raise item
-        yield item
+    try:
+        finished = False
+        while not finished:
+            # Take whatever else is already queued, so a burst of events is handled in one pass
+            items = [await queue.get()]
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            batch, error = [], None
+            for item in items:
+                if item is None:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    error = item
+                    break
+                batch.append(item)
+            if batch:
+                yield batch
+            if error is not None:
+                raise error
+    finally:
+        # Consumer stopped early: free queue slots so a blocked put() returns and the thread exits
+        cancelled.set()
+        while not queue.empty():
+            queue.get_nowait()
 
 # =============================================================================
 # UI STATE CLASS
@@ -96,17 +145,10 @@ class UIState:
         self.review_title = "Self-review Q1–Q2 / H1 2025"
         self.stream_mode = "values"
         self.last_error = None  # Track last error for retry capability
-        
-        try:
-            root_dir = os.getenv("PROJECT_ROOT_DIR", ".")
-            sample_file_path = os.path.join(root_dir, "sample_reviews", "poor_review.md")
-            if os.path.exists(sample_file_path):
-                with open(sample_file_path, 'r', encoding='utf-8') as f:
-                    self.review_text = f.read().strip()
-            else:
-                self.review_text = "I had an eventful cycle this summer..."
-        except Exception:
-            self.review_text = "I had an eventful cycle this summer..."
+        self.ui_dirty = False  # Set per SSE event; cleared when render_loop() repaints
+        self.rendered_steps = []  # Progress steps currently shown in progress_column
+        self.completed_steps = {}  # Finished stage key -> checklist label, in completion order
+        self.review_text = load_sample_review()
 
 # =============================================================================
 # HELPER: COPY TO CLIPBOARD
@@ -115,9 +157,8 @@ async def copy_to_clipboard(text: str):
     if not text:
         ui.notify('Nothing to copy!', type='warning')
         return
-    # Escape backticks and backslashes for JS
-    js_text = text.replace('\\', '\\\\').replace('`', '\\`').replace('$', '')
-    await ui.run_javascript(f'navigator.clipboard.writeText(`{js_text}`)')
+    # json.dumps yields a valid JS string literal, whatever the text contains
+    await ui.run_javascript(f'mmCopy({json.dumps(text)})')
     ui.notify('Copied to clipboard!', type='positive', icon='content_copy')
 
 # =============================================================================
@@ -140,6 +181,9 @@ async def main_page():
         .section-card:hover { box-shadow: 0 4px 20px rgba(0,0,0,0.1); }
     ''')
     
+    # Clipboard helper used by copy_to_clipboard()
+    ui.add_body_html('<script>window.mmCopy = (t) => navigator.clipboard.writeText(t);</script>')
+
     ui.colors(primary='#1A3263', secondary='#547792', accent='#FAB95B', positive='#27AE60', negative='#C0392B')
 
     # --- HEADER ---
@@ -340,12 +384,18 @@ async def main_page():
             scorecard_panel.refresh()
 
             # Progress Steps
-            progress_column.clear()
+            # Steps normally only get appended: add rows for the new ones, and rebuild
+            # only when an earlier step changed (reset, or a stage finishing out of order)
+            rendered = state.rendered_steps
+            if state.progress_steps[:len(rendered)] != rendered:
+                progress_column.clear()
+                rendered = []
             with progress_column:
-                for step in state.progress_steps:
+                for step in state.progress_steps[len(rendered):]:
                     with ui.row().classes('items-center gap-2'):
                         ui.icon('check_circle', color='positive', size='xs')
                         ui.label(step.replace('✅ ', '')).classes('text-sm text-gray-700')
+            state.rendered_steps = list(state.progress_steps)
             
             # Button States
             if state.running:
@@ -392,6 +442,14 @@ async def main_page():
             if "Client has been deleted" not in str(e):
                 logger.warning("UI Warning: {}", e)
 
+    async def render_loop():
+        # Repaint at a fixed rate while streaming, however fast events arrive
+        while state.running and client.connected:
+            await asyncio.sleep(UI_RENDER_INTERVAL)
+            if state.ui_dirty:
+                state.ui_dirty = False
+                update_ui()
+
     async def start_streaming():
         if not client.connected:
             return
@@ -406,6 +464,7 @@ async def main_page():
         state.running = True
         state.state = {}
         state.progress_steps = []
+        state.completed_steps = {}
         state.progress_value = 0.0
         
         # 2. FORCE UI REFRESH
@@ -420,49 +479,43 @@ async def main_page():
             "mode": "values"
         }
         
+        render_task = asyncio.create_task(render_loop())
         try:
-            async for ev in async_sse_generator(STREAM_URL, request_data):
+            async for batch in async_sse_generator(STREAM_URL, request_data):
                 if not client.connected:
                     return
                 if not state.running:
                     break
 
-                vals = extract_values_from_event(ev)
-                if vals:
-                    state.state.update(vals)
-                if "updates" in ev:
-                    state.state = patch_state(state.state, ev["updates"])
+                changed_keys = set()
+                for ev in batch:
+                    vals = extract_values_from_event(ev)
+                    if vals:
+                        state.state.update(vals)
+                        changed_keys.update(vals)
+                    if "updates" in ev:
+                        state.state = patch_state(state.state, ev["updates"])
+                        changed_keys.update(ev["updates"] or {})
                 
-                # Calculate Progress
-                curr = state.state
-                steps = []
-                count = 0
-                if curr.get("copy_edited_text"):
-                    steps.append("✅ Copy Editing")
-                    count += 1
-                if curr.get("summary"):
-                    steps.append("✅ Summarization")
-                    count += 1
-                if curr.get("word_cloud_path"):
-                    steps.append("✅ Word Cloud")
-                    count += 1
-                if curr.get("achievements"):
-                    steps.append("✅ Achievements")
-                    count += 1
-                if curr.get("review_scorecard"):
-                    steps.append("✅ Scorecard")
-                    count += 1
-                if "review_complete" in curr:
-                    if curr["review_complete"]:
-                        steps.append("✅ Review Complete")
-                    else:
-                        steps.append("❌ Review has issues — too few achievements")
-                    count += 1
-                
-                state.progress_steps = steps
-                state.progress_value = count / 5.0
-                
-                update_ui()
+                # Progress only moves when a batch touches a stage's key; stages are
+                # listed in the order they finished
+                if changed_keys & PROGRESS_KEYS:
+                    curr = state.state
+                    for key, label in PROGRESS_STEPS:
+                        if key not in state.completed_steps and curr.get(key):
+                            state.completed_steps[key] = label
+                    steps = list(state.completed_steps.values())
+                    count = len(steps)
+                    if "review_complete" in curr:
+                        if curr["review_complete"]:
+                            steps.append("✅ Review Complete")
+                        else:
+                            steps.append("❌ Review has issues — too few achievements")
+                        count += 1
+
+                    state.progress_steps = steps
+                    state.progress_value = count / 5.0
+                state.ui_dirty = True
                 
             if client.connected:
                 state.running = False
@@ -515,6 +568,8 @@ async def main_page():
             if client.connected:
                 ui.notify(friendly_msg, type='negative', position='top', timeout=5000)
             update_ui()
+        finally:
+            render_task.cancel()
 
     def stop_streaming():
         state.running = False
@@ -524,6 +579,7 @@ async def main_page():
         state.thread_id = str(uuid.uuid4())
         state.state = {}
         state.progress_steps = []
+        state.completed_steps = {}
         state.progress_value = 0.0
         state.running = False
         state.last_error = None
@@ -16,6 +16,8 @@ stream parsing, and input validation.
 """
 
 import json
+import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 import requests
 from nicegui import ui
@@ -266,9 +268,13 @@ def display_radar_plot(review_scorecard: ReviewScorecard, container: ui.element)
         
         ui.plotly(fig).classes('w-full')
 
+@lru_cache(maxsize=256)
 def validate_review_text(text: str) -> tuple[bool, str]:
     """
     Simple validation for review text input.
+
+    The UI re-validates the unchanged review text on every streamed event, so results
+    are cached by text (str caches its own hash, making repeat lookups cheap).
     """
     if not text or not text.strip():
         return False, "Please enter some review text before starting."
@@ -278,6 +284,20 @@ def validate_review_text(text: str) -> tuple[bool, str]:
         return False, "Review text is too long (max 10,000 characters)."
     return True, ""
 
+@lru_cache(maxsize=1)
+def load_sample_review() -> str:
+    """
+    Returns the sample review shown to new sessions, read from disk once per process.
+    """
+    default = "I had an eventful cycle this summer..."
+    try:
+        root_dir = os.getenv("PROJECT_ROOT_DIR", ".")
+        sample_file_path = os.path.join(root_dir, "sample_reviews", "poor_review.md")
+        with open(sample_file_path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except Exception:
+        return default
+
 def patch_state(dst: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
     """
     Performs a shallow merge of two dictionaries for 'updates' mode.